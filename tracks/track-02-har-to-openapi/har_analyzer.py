@@ -9,9 +9,14 @@ and generate insights for OpenAPI specification creation.
 import json
 import sys
 import argparse
+import hashlib
+import mmap
+import tempfile
 from urllib.parse import urlparse, parse_qs
 from collections import defaultdict, Counter
-from typing import List, Dict, Any
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+import math
 import re
 
 def load_har_file(filepath: str) -> Dict[str, Any]:
@@ -23,8 +28,97 @@ def load_har_file(filepath: str) -> Dict[str, Any]:
         print(f"❌ Error loading HAR file: {e}")
         sys.exit(1)
 
-def extract_api_candidates(har_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Extract potential API calls from HAR data."""
+class BodyStore:
+    """
+    Content-addressed store for request/response bodies.
+
+    Each distinct body is kept once and referenced by its hash, so identical
+    polling responses cost one copy however often they repeat. With a spill
+    directory, bodies are appended to an anonymous temporary file there and
+    read back through mmap instead of being held in memory; the file is
+    removed when the store is closed.
+    """
+    
+    def __init__(self, spill_dir: Optional[str] = None):
+        self.bodies = {}
+        self.refcounts = Counter()
+        self.total_bytes = 0
+        self.unique_bytes = 0
+        self._spill_file = tempfile.TemporaryFile(dir=spill_dir) if spill_dir else None
+        self._spill_size = 0
+        self._mmap = None
+    
+    def intern(self, text: str) -> Optional[str]:
+        """Store a body and return its ID (None for empty bodies)."""
+        if not text:
+            return None
+        
+        data = text.encode('utf-8')
+        body_id = hashlib.blake2b(data, digest_size=16).hexdigest()
+        self.refcounts[body_id] += 1
+        self.total_bytes += len(data)
+        
+        if body_id not in self.bodies:
+            self.unique_bytes += len(data)
+            if self._spill_file is None:
+                self.bodies[body_id] = text
+            else:
+                self._spill_file.write(data)
+                self.bodies[body_id] = (self._spill_size, len(data))
+                self._spill_size += len(data)
+        return body_id
+    
+    def get(self, body_id: Optional[str]) -> str:
+        """Return the body for an ID ('' for None)."""
+        if body_id is None:
+            return ''
+        
+        stored = self.bodies[body_id]
+        if self._spill_file is None:
+            return stored
+        
+        offset, length = stored
+        if self._mmap is None or len(self._mmap) < offset + length:
+            self._spill_file.flush()
+            if self._mmap is not None:
+                self._mmap.close()
+            self._mmap = mmap.mmap(self._spill_file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap[offset:offset + length].decode('utf-8')
+    
+    def unique_bodies(self):
+        """O(1) view of distinct body IDs and how many calls reference each."""
+        return self.refcounts.keys()
+    
+    def __len__(self) -> int:
+        return len(self.bodies)
+    
+    def __enter__(self) -> 'BodyStore':
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+def extract_api_candidates(har_data: Dict[str, Any],
+                           body_store: Optional[BodyStore] = None) -> List[Dict[str, Any]]:
+    """
+    Extract potential API calls from HAR data.
+    
+    Bodies are interned in body_store and candidates carry their IDs, which
+    resolve through the same store for as long as it stays open. Without a
+    store, bodies are interned in memory and candidates also carry them as
+    request_body/response_body; repeated bodies share one string.
+    """
+    inline_bodies = body_store is None
+    if inline_bodies:
+        body_store = BodyStore()
     entries = har_data['log']['entries']
     api_candidates = []
     
@@ -53,15 +147,161 @@ def extract_api_candidates(har_data: Dict[str, Any]) -> List[Dict[str, Any]]:
                 'status': response['status'],
                 'headers': {h['name']: h['value'] for h in request['headers']},
                 'query_params': {p['name']: p['value'] for p in request.get('queryString', [])},
-                'request_body': request.get('postData', {}).get('text', ''),
-                'response_body': response.get('content', {}).get('text', ''),
+                'request_body_id': body_store.intern(request.get('postData', {}).get('text', '')),
+                'response_body_id': body_store.intern(response.get('content', {}).get('text', '')),
                 'response_type': response.get('content', {}).get('mimeType', ''),
                 'response_size': response.get('content', {}).get('size', 0),
-                'timing': entry.get('time', 0)
+                'timing': entry.get('time', 0),
+                'started': entry.get('startedDateTime', '')
             })
     
+    if inline_bodies:
+        for call in api_candidates:
+            call['request_body'] = body_store.get(call['request_body_id'])
+            call['response_body'] = body_store.get(call['response_body_id'])
     return api_candidates
 
+# Segments that are identifiers regardless of how often they were seen
+ID_SEGMENT_PATTERNS = [
+    re.compile(r'^\d+$'),
+    re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE),
+    re.compile(r'^[0-9a-f]{8,}$', re.IGNORECASE),
+    re.compile(r'^(?=.*\d)[A-Za-z0-9_\-]{16,}$'),
+]
+
+# Thresholds for treating a trie position as variable from its sibling values
+MAX_LITERAL_SIBLINGS = 25     # more distinct values than this is never a fixed set of resources
+MIN_VARIABLE_SIBLINGS = 3     # fewer distinct values than this is never merged
+MIN_POSITION_CALLS = 20       # fewer calls than this is too little evidence for the spread tests
+MIN_DISTINCT_RATIO = 0.2      # distinct values per call observed at the position
+MIN_NORMALIZED_ENTROPY = 0.8  # how evenly calls spread over the distinct values
+
+class PathTrieNode:
+    """One path segment position in the endpoint trie."""
+    
+    __slots__ = ('children', 'calls', 'count', 'param')
+    
+    def __init__(self):
+        self.children = {}
+        self.calls = []
+        self.count = 0
+        self.param = None
+
+def is_id_segment(segment: str) -> bool:
+    """Check if a path segment looks like an identifier on its own."""
+    return any(pattern.match(segment) for pattern in ID_SEGMENT_PATTERNS)
+
+def segment_entropy(counts: List[int]) -> float:
+    """Shannon entropy (bits) of the call distribution over sibling values."""
+    total = sum(counts)
+    return -sum((c / total) * math.log2(c / total) for c in counts if c)
+
+def value_shape(node: PathTrieNode) -> tuple:
+    """What a segment leads to: the methods called on it and its child segments (identifiers folded)."""
+    methods = frozenset(call['method'] for call in node.calls)
+    children = frozenset('{}' if is_id_segment(segment) else segment for segment in node.children)
+    return methods, children
+
+def is_variable_position(node: PathTrieNode) -> bool:
+    """Decide whether the remaining literal children of a node are values of one parameter."""
+    counts = [child.count for child in node.children.values()]
+    distinct = len(counts)
+    if distinct > MAX_LITERAL_SIBLINGS:
+        return True
+    if distinct < MIN_VARIABLE_SIBLINGS:
+        return False
+    
+    total = sum(counts)
+    if total < MIN_POSITION_CALLS:
+        return False
+    # Values of one parameter lead to the same operations; resources differ
+    # in their methods or sub-resources and stay literal
+    if len({value_shape(child) for child in node.children.values()}) > 1:
+        return False
+    normalized_entropy = segment_entropy(counts) / math.log2(distinct)
+    return distinct / total >= MIN_DISTINCT_RATIO and normalized_entropy >= MIN_NORMALIZED_ENTROPY
+
+def parameter_name(parent_segment: Optional[str]) -> str:
+    """Name a path parameter after the collection it indexes, e.g. users -> userId."""
+    if not parent_segment or parent_segment.startswith('{') or not parent_segment.isalpha():
+        return 'id'
+    
+    word = parent_segment.lower()
+    if word.endswith('ies') and len(word) > 3:
+        word = word[:-3] + 'y'
+    elif word.endswith(('ses', 'xes', 'ches', 'shes')):
+        word = word[:-2]
+    elif word.endswith('s') and not word.endswith('ss'):
+        word = word[:-1]
+    return f'{word}Id'
+
+def build_path_trie(api_calls: List[Dict[str, Any]]) -> PathTrieNode:
+    """Insert every call's path into a segment trie in O(n·depth)."""
+    root = PathTrieNode()
+    for call in api_calls:
+        node = root
+        node.count += 1
+        for segment in urlparse(call['url']).path.split('/'):
+            if not segment:
+                continue
+            node = node.children.setdefault(segment, PathTrieNode())
+            node.count += 1
+        node.calls.append(call)
+    return root
+
+def merge_trie_nodes(target: PathTrieNode, source: PathTrieNode):
+    """Fold source's subtree into target."""
+    target.count += source.count
+    target.calls.extend(source.calls)
+    if source.param is not None:
+        if target.param is None:
+            target.param = source.param
+        else:
+            merge_trie_nodes(target.param, source.param)
+    for segment, child in source.children.items():
+        if segment in target.children:
+            merge_trie_nodes(target.children[segment], child)
+        else:
+            target.children[segment] = child
+
+def cluster_path_trie(node: PathTrieNode):
+    """Collapse variable sibling segments into a single parameter child, top-down."""
+    if node.children:
+        # Identifier-shaped segments always become the parameter; the remaining
+        # literals only join it when their own spread looks like parameter values
+        to_merge = [segment for segment in node.children if is_id_segment(segment)]
+        for segment in to_merge:
+            node_param = node.param or PathTrieNode()
+            merge_trie_nodes(node_param, node.children.pop(segment))
+            node.param = node_param
+        if node.children and is_variable_position(node):
+            for segment in list(node.children):
+                node_param = node.param or PathTrieNode()
+                merge_trie_nodes(node_param, node.children.pop(segment))
+                node.param = node_param
+    
+    for child in node.children.values():
+        cluster_path_trie(child)
+    if node.param is not None:
+        cluster_path_trie(node.param)
+
+def collect_templated_paths(node: PathTrieNode, segments: List[str], used_names: Dict[str, int],
+                            templates: Dict[str, List[Dict[str, Any]]]):
+    """Walk the clustered trie and emit one templated path per terminal node."""
+    if node.calls:
+        templates['/' + '/'.join(segments)] = node.calls
+    
+    for segment, child in node.children.items():
+        collect_templated_paths(child, segments + [segment], used_names, templates)
+    
+    if node.param is not None:
+        name = parameter_name(segments[-1] if segments else None)
+        seen = used_names.get(name, 0)
+        used_names[name] = seen + 1
+        unique_name = name if seen == 0 else f'{name}{seen + 1}'
+        collect_templated_paths(node.param, segments + [f'{{{unique_name}}}'], used_names, templates)
+        used_names[name] = seen
+
 def analyze_url_patterns(api_calls: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Analyze URL patterns to identify endpoints."""
     patterns = defaultdict(list)
@@ -71,15 +311,16 @@ def analyze_url_patterns(api_calls: List[Dict[str, Any]]) -> Dict[str, Any]:
         parsed = urlparse(call['url'])
         base_url = f"{parsed.scheme}://{parsed.netloc}"
         base_urls[base_url] += 1
-        
-        # Normalize path for pattern recognition
-        path = parsed.path
-        # Replace likely ID patterns with placeholder
-        normalized_path = re.sub(r'/\d+(?=/|$)', '/{id}', path)
-        normalized_path = re.sub(r'/[a-f0-9]{8,}(?=/|$)', '/{id}', normalized_path)
-        
-        pattern_key = f"{call['method']} {normalized_path}"
-        patterns[pattern_key].append(call)
+    
+    # Cluster paths across all methods so every operation on a resource shares a template
+    trie = build_path_trie(api_calls)
+    cluster_path_trie(trie)
+    templates = {}
+    collect_templated_paths(trie, [], {}, templates)
+    
+    for templated_path, calls in templates.items():
+        for call in calls:
+            patterns[f"{call['method']} {templated_path}"].append(call)
     
     return {
         'patterns': dict(patterns),
@@ -120,7 +361,139 @@ def analyze_authentication(api_calls: List[Dict[str, Any]]) -> Dict[str, Any]:
     auth_patterns['custom_headers'] = list(auth_patterns['custom_headers'])
     return auth_patterns
 
-def generate_openapi_skeleton(analysis: Dict[str, Any], api_calls: List[Dict[str, Any]]) -> Dict[str, Any]:
+class QuantileSketch:
+    """
+    Streaming quantile sketch with bounded relative error.
+
+    Values are counted in logarithmic buckets (as in DDSketch), so any quantile
+    is accurate to within relative_accuracy while memory stays bounded by
+    max_buckets no matter how many samples are added. Past that bound the
+    lowest buckets are folded upwards: from then on values at or below the
+    lowest kept bucket are counted in it, and only they lose precision.
+    """
+    
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.max_buckets = max_buckets
+        self.buckets = {}
+        # Lowest bucket key once buckets have been folded; lower keys count in it
+        self.floor_key = None
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+    
+    def add(self, value: float):
+        """Add one sample."""
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        
+        if value <= 0:
+            self.zero_count += 1
+            return
+        
+        key = math.ceil(math.log(value) / self.log_gamma)
+        if self.floor_key is not None and key < self.floor_key:
+            key = self.floor_key
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+        if len(self.buckets) > self.max_buckets:
+            # Fold the lowest bucket into the next one up. Keys are integers and
+            # the floor only rises, so the upward scan is amortized O(1) per add
+            lowest = self.floor_key if self.floor_key is not None else min(self.buckets)
+            folded = self.buckets.pop(lowest)
+            second = lowest + 1
+            while second not in self.buckets:
+                second += 1
+            self.buckets[second] += folded
+            self.floor_key = second
+    
+    def quantile(self, q: float) -> float:
+        """Estimate the q-quantile (0 <= q <= 1)."""
+        if self.count == 0:
+            return 0.0
+        
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if seen > rank:
+            return max(self.min, 0.0)
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen > rank:
+                estimate = 2 * self.gamma ** key / (self.gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+    
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+def parse_har_timestamp(value: str) -> Optional[float]:
+    """Parse a HAR startedDateTime into epoch seconds."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
+
+def profile_endpoint_performance(analysis: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Summarize latency, payload size and throughput per endpoint pattern."""
+    latency = defaultdict(QuantileSketch)
+    payload = defaultdict(QuantileSketch)
+    counts = Counter()
+    first_seen = None
+    last_seen = None
+    
+    for pattern, calls in analysis['patterns'].items():
+        for call in calls:
+            counts[pattern] += 1
+            if call.get('timing', -1) >= 0:
+                latency[pattern].add(call['timing'])
+            if call.get('response_size', -1) >= 0:
+                payload[pattern].add(call['response_size'])
+            started = parse_har_timestamp(call.get('started', ''))
+            if started is not None:
+                first_seen = started if first_seen is None else min(first_seen, started)
+                last_seen = started if last_seen is None else max(last_seen, started)
+    
+    # Throughput is measured against the whole capture window
+    window = (last_seen - first_seen) if first_seen is not None else 0
+    
+    profiles = {}
+    for pattern, count in counts.items():
+        times = latency[pattern]
+        sizes = payload[pattern]
+        profiles[pattern] = {
+            'sampleCount': count,
+            'latencyMs': {
+                'p50': round(times.quantile(0.50), 1),
+                'p95': round(times.quantile(0.95), 1),
+                'p99': round(times.quantile(0.99), 1),
+                'mean': round(times.mean, 1),
+                'max': round(times.max, 1) if times.count else 0.0
+            },
+            'responseBytes': {
+                'mean': round(sizes.mean),
+                'p95': round(sizes.quantile(0.95)),
+                'max': round(sizes.max) if sizes.count else 0,
+                'total': round(sizes.total)
+            },
+            'callsPerMinute': round(count * 60 / window, 2) if window > 0 else None
+        }
+    
+    return profiles
+
+def slowest_endpoints(performance: Dict[str, Dict[str, Any]], limit: int = 10) -> List[tuple]:
+    """Endpoint patterns ordered by p95 latency, slowest first."""
+    ranked = sorted(performance.items(), key=lambda item: item[1]['latencyMs']['p95'], reverse=True)
+    return ranked[:limit]
+
+def generate_openapi_skeleton(analysis: Dict[str, Any], api_calls: List[Dict[str, Any]],
+                              performance: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
     """Generate basic OpenAPI specification skeleton."""
     base_url = analysis['most_common_base'][0] if analysis['most_common_base'] else 'https://api.example.com'
     
@@ -189,9 +562,18 @@ def generate_openapi_skeleton(analysis: Dict[str, Any], api_calls: List[Dict[str
         }
         
         # Add parameters if detected
+        for param_name in re.findall(r'\{(\w+)\}', path):
+            operation.setdefault('parameters', []).append({
+                'name': param_name,
+                'in': 'path',
+                'required': True,
+                'schema': {'type': 'string'},
+                'description': 'Path parameter discovered in HAR analysis'
+            })
+        
         sample_call = calls[0]
         if sample_call['query_params']:
-            operation['parameters'] = []
+            operation.setdefault('parameters', [])
             for param_name, param_value in sample_call['query_params'].items():
                 operation['parameters'].append({
                     'name': param_name,
@@ -202,11 +584,17 @@ def generate_openapi_skeleton(analysis: Dict[str, Any], api_calls: List[Dict[str
                     'description': f'Parameter discovered in HAR analysis'
                 })
         
+        # Observed performance lets agent planners prefer fast endpoints
+        if performance and pattern in performance:
+            operation['x-performance'] = performance[pattern]
+        
         openapi_spec['paths'][path][method.lower()] = operation
     
     return openapi_spec
 
-def print_analysis_report(analysis: Dict[str, Any], auth_analysis: Dict[str, Any], api_calls: List[Dict[str, Any]]):
+def print_analysis_report(analysis: Dict[str, Any], auth_analysis: Dict[str, Any], api_calls: List[Dict[str, Any]],
+                          performance: Optional[Dict[str, Dict[str, Any]]] = None,
+                          body_store: Optional[BodyStore] = None):
     """Print comprehensive analysis report."""
     print("=" * 60)
     print("🔍 HAR FILE ANALYSIS REPORT")
@@ -255,6 +643,27 @@ def print_analysis_report(analysis: Dict[str, Any], auth_analysis: Dict[str, Any
     for content_type, count in response_types.most_common():
         print(f"  {content_type}: {count} responses")
     
+    if body_store is not None and body_store.total_bytes:
+        references = sum(body_store.refcounts.values())
+        saved = body_store.total_bytes - body_store.unique_bytes
+        print(f"  Unique bodies: {len(body_store)} of {references} "
+              f"({saved / 1024:.1f} KB of duplicate content stored once)")
+    
+    # Performance profile
+    if performance:
+        print(f"\n⏱️  PERFORMANCE PROFILE")
+        print(f"  {'Endpoint':50} {'Calls':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'Avg KB':>8}")
+        for pattern, profile in sorted(performance.items()):
+            latency = profile['latencyMs']
+            print(f"  {pattern[:50]:50} {profile['sampleCount']:>6} {latency['p50']:>9.1f} "
+                  f"{latency['p95']:>9.1f} {latency['p99']:>9.1f} {profile['responseBytes']['mean'] / 1024:>8.1f}")
+        
+        print(f"\n🐢 SLOWEST ENDPOINTS (by p95 latency)")
+        for pattern, profile in slowest_endpoints(performance, 5):
+            rate = profile['callsPerMinute']
+            rate_text = f", {rate} calls/min" if rate is not None else ''
+            print(f"  {pattern}: p95 {profile['latencyMs']['p95']:.1f} ms{rate_text}")
+    
     # Recommendations
     print(f"\n💡 RECOMMENDATIONS")
     print("1. Focus on endpoints with successful responses (2xx status codes)")
@@ -278,6 +687,9 @@ def main():
     parser.add_argument('har_file', help='Path to HAR file to analyze')
     parser.add_argument('--output', '-o', help='Output file for OpenAPI skeleton (optional)')
     parser.add_argument('--format', choices=['yaml', 'json'], default='yaml', help='Output format')
+    parser.add_argument('--spill-bodies', metavar='DIR',
+                        help='Keep request/response bodies in an mmap-backed temporary file in DIR '
+                             'instead of memory (removed on exit)')
     
     args = parser.parse_args()
     
@@ -285,42 +697,46 @@ def main():
     print(f"🔍 Analyzing HAR file: {args.har_file}")
     har_data = load_har_file(args.har_file)
     
-    # Extract API candidates
-    api_calls = extract_api_candidates(har_data)
-    
-    if not api_calls:
-        print("❌ No API calls found in HAR file. Check the capture or filtering criteria.")
-        return
-    
-    # Perform analysis
-    url_analysis = analyze_url_patterns(api_calls)
-    auth_analysis = analyze_authentication(api_calls)
-    
-    # Print report
-    print_analysis_report(url_analysis, auth_analysis, api_calls)
-    
-    # Generate OpenAPI skeleton if requested
-    if args.output:
-        openapi_spec = generate_openapi_skeleton(url_analysis, api_calls)
+    # Extract API candidates; the store (and its spill file) lives until the report is written
+    with BodyStore(args.spill_bodies) as body_store:
+        api_calls = extract_api_candidates(har_data, body_store)
+        # Bodies now live once in the store; drop the raw capture
+        del har_data
         
-        try:
-            if args.format == 'yaml':
-                import yaml
-                with open(args.output, 'w') as f:
-                    yaml.dump(openapi_spec, f, default_flow_style=False, sort_keys=False)
-            else:
-                with open(args.output, 'w') as f:
-                    json.dump(openapi_spec, f, indent=2)
+        if not api_calls:
+            print("❌ No API calls found in HAR file. Check the capture or filtering criteria.")
+            return
+        
+        # Perform analysis
+        url_analysis = analyze_url_patterns(api_calls)
+        auth_analysis = analyze_authentication(api_calls)
+        performance = profile_endpoint_performance(url_analysis)
+        
+        # Print report
+        print_analysis_report(url_analysis, auth_analysis, api_calls, performance, body_store)
+        
+        # Generate OpenAPI skeleton if requested
+        if args.output:
+            openapi_spec = generate_openapi_skeleton(url_analysis, api_calls, performance)
+        
+            try:
+                if args.format == 'yaml':
+                    import yaml
+                    with open(args.output, 'w') as f:
+                        yaml.dump(openapi_spec, f, default_flow_style=False, sort_keys=False)
+                else:
+                    with open(args.output, 'w') as f:
+                        json.dump(openapi_spec, f, indent=2)
             
-            print(f"\n✅ OpenAPI skeleton saved to: {args.output}")
-            print("📝 Remember to:")
-            print("   - Add detailed descriptions and examples")
-            print("   - Define proper response schemas")
-            print("   - Validate the specification")
-            print("   - Remove any sensitive data")
+                print(f"\n✅ OpenAPI skeleton saved to: {args.output}")
+                print("📝 Remember to:")
+                print("   - Add detailed descriptions and examples")
+                print("   - Define proper response schemas")
+                print("   - Validate the specification")
+                print("   - Remove any sensitive data")
             
-        except Exception as e:
-            print(f"❌ Error saving OpenAPI skeleton: {e}")
+            except Exception as e:
+                print(f"❌ Error saving OpenAPI skeleton: {e}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
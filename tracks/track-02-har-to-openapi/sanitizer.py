@@ -8,8 +8,12 @@ Removes sensitive information from HAR files to make them safe for sharing.
 import json
 import re
 import argparse
+import bisect
+import functools
+import hashlib
+import sqlite3
 import sys
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
 # Patterns for detecting and replacing sensitive data
 SENSITIVE_PATTERNS = [
@@ -58,82 +62,338 @@ SENSITIVE_HEADERS = {
     'x-csrf-token': 'X-CSRF-Token: {{CSRF_TOKEN}}',
 }
 
-def sanitize_string(text: str, patterns: List[Tuple[str, str]]) -> str:
-    """Apply sanitization patterns to a string."""
-    if not text:
+# A finding is (field_path, pattern_name, byte_offset, replacement)
+Finding = Tuple[str, str, int, str]
+
+def pattern_name(replacement: str) -> str:
+    """Derive a pattern name from its placeholder, e.g. '{{IP_ADDRESS}}' -> 'IP_ADDRESS'."""
+    match = re.search(r'\{\{(\w+)\}\}', replacement)
+    return match.group(1) if match else replacement
+
+# Header values, URLs and query values repeat heavily across a capture, so
+# their sanitized form is memoized per pattern table. Bodies are never
+# memoized, and neither are values longer than MEMO_MAX_LENGTH.
+MEMO_MAX_LENGTH = 2048
+MEMO_SIZE = 65536
+
+@functools.lru_cache(maxsize=None)
+def _compile_patterns(patterns: Tuple[Tuple[str, str], ...]) -> List[Tuple[re.Pattern, str, str]]:
+    """Compile a pattern table once."""
+    return [
+        (re.compile(pattern, re.IGNORECASE), replacement, pattern_name(replacement))
+        for pattern, replacement in patterns
+    ]
+
+def _apply_patterns(text: str, compiled: List[Tuple[re.Pattern, str, str]],
+                    findings: Optional[List[Finding]], path: str) -> str:
+    """Run every compiled pattern over text, recording findings if requested.
+
+    Finding offsets are byte offsets of the placeholder in the final
+    sanitized text. While patterns run they are kept as character offsets
+    and shifted by the length changes of later replacements before them,
+    then converted to bytes in one walk over the result.
+    """
+    if findings is None:
+        for regex, replacement, _ in compiled:
+            text = regex.sub(replacement, text)
         return text
     
-    for pattern, replacement in patterns:
-        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+    placed = []  # [character offset, pattern name, replacement], in text order
+    for regex, replacement, name in compiled:
+        pieces, added, edit_starts, edit_ends, edit_shifts = [], [], [], [], []
+        last = shift = 0
+        for match in regex.finditer(text):
+            start, end = match.span()
+            value = match.expand(replacement) if '\\' in replacement else replacement
+            pieces.append(text[last:start])
+            pieces.append(value)
+            added.append([start + shift, name, value])
+            shift += len(value) - (end - start)
+            edit_starts.append(start)
+            edit_ends.append(end)
+            edit_shifts.append(shift)
+            last = end
+        if not added:
+            continue
+        pieces.append(text[last:])
+        text = ''.join(pieces)
+        kept = []
+        for item in placed:
+            # The last replacement starting at or before this placeholder
+            edit = bisect.bisect_right(edit_starts, item[0]) - 1
+            if edit >= 0:
+                if item[0] < edit_ends[edit]:
+                    continue  # rewritten by this pattern; its own finding replaces it
+                item[0] += edit_shifts[edit]
+            kept.append(item)
+        placed = sorted(kept + added, key=lambda item: item[0])
     
+    if text.isascii():
+        findings.extend((path, name, position, value) for position, name, value in placed)
+        return text
+    byte_offset = char_offset = 0
+    for position, name, value in placed:
+        byte_offset += len(text[char_offset:position].encode('utf-8'))
+        char_offset = position
+        findings.append((path, name, byte_offset, value))
     return text
 
-def sanitize_headers(headers: List[Dict[str, str]]) -> List[Dict[str, str]]:
+@functools.lru_cache(maxsize=MEMO_SIZE)
+def _sanitize_memoized(patterns: Tuple[Tuple[str, str], ...],
+                       text: str) -> Tuple[str, Tuple[Tuple[str, int, str], ...]]:
+    """Sanitize a short value, keeping its findings for replay.
+
+    The pattern table is part of the key, so changing the rules never
+    replays a result computed under the old ones.
+    """
+    findings = []
+    result = _apply_patterns(text, _compile_patterns(patterns), findings, '')
+    return result, tuple((name, offset, replacement) for _, name, offset, replacement in findings)
+
+def memo_stats() -> Dict[str, Any]:
+    """Hit-rate statistics for the short-value memo."""
+    info = _sanitize_memoized.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        'hits': info.hits,
+        'misses': info.misses,
+        'size': info.currsize,
+        'max_size': info.maxsize,
+        'hit_rate': info.hits / lookups if lookups else 0.0
+    }
+
+def clear_memo():
+    """Drop all memoized values and reset the statistics."""
+    _sanitize_memoized.cache_clear()
+
+def sanitize_string(text: str, patterns: List[Tuple[str, str]],
+                    findings: Optional[List[Finding]] = None, path: str = '',
+                    memoize: bool = False) -> str:
+    """Apply sanitization patterns to a string.
+
+    When a findings list is given, every replacement is appended to it with the
+    byte offset of its placeholder in the returned (sanitized) value. Pass
+    memoize=True for short values that repeat across entries (header, URL and
+    query values).
+    """
+    if not text:
+        return text
+    
+    table = tuple(map(tuple, patterns))
+    if memoize and len(text) <= MEMO_MAX_LENGTH:
+        result, matches = _sanitize_memoized(table, text)
+        if findings is not None:
+            findings.extend((path, name, offset, replacement) for name, offset, replacement in matches)
+        return result
+    
+    return _apply_patterns(text, _compile_patterns(table), findings, path)
+
+def sanitize_headers(headers: List[Dict[str, str]],
+                     findings: Optional[List[Finding]] = None,
+                     path: str = 'headers') -> List[Dict[str, str]]:
     """Sanitize request/response headers."""
     sanitized = []
     
-    for header in headers:
+    for i, header in enumerate(headers):
         name = header.get('name', '').lower()
         value = header.get('value', '')
+        value_path = f'{path}[{i}].value'
         
         if name in SENSITIVE_HEADERS:
             # Replace with placeholder
+            placeholder = SENSITIVE_HEADERS[name].split(': ', 1)[1]
             sanitized.append({
                 'name': header['name'],  # Keep original case
-                'value': SENSITIVE_HEADERS[name].split(': ', 1)[1]
+                'value': placeholder
             })
+            if findings is not None:
+                findings.append((value_path, pattern_name(placeholder), 0, placeholder))
         elif name.startswith('x-') and ('auth' in name or 'token' in name or 'key' in name):
             # Sanitize custom auth headers
             sanitized.append({
                 'name': header['name'],
                 'value': '{{CUSTOM_AUTH_HEADER}}'
             })
+            if findings is not None:
+                findings.append((value_path, 'CUSTOM_AUTH_HEADER', 0, '{{CUSTOM_AUTH_HEADER}}'))
         else:
             # Apply general sanitization patterns
             sanitized.append({
                 'name': header['name'],
-                'value': sanitize_string(value, SENSITIVE_PATTERNS)
+                'value': sanitize_string(value, SENSITIVE_PATTERNS, findings, value_path, memoize=True)
             })
     
     return sanitized
 
-def sanitize_har_file(har_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Sanitize an entire HAR file."""
+def entry_digest(entry: Dict[str, Any]) -> str:
+    """Stable content hash of a HAR entry, used to recognise unchanged entries."""
+    canonical = json.dumps(entry, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+
+def rules_digest() -> str:
+    """Hash of the pattern and header tables; clean entries are only clean under these rules."""
+    canonical = json.dumps([SENSITIVE_PATTERNS, sorted(SENSITIVE_HEADERS.items())], ensure_ascii=False)
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+
+class FindingsIndex:
+    """
+    SQLite index of every replacement made by the sanitizer.
+
+    One row per finding (entry index, field path, pattern name, byte offset,
+    replacement) plus one row per entry with its content digest, so reviewers
+    can query e.g. all IP_ADDRESS replacements under response.headers without
+    opening the sanitized HAR. Entries that were clean on the previous run and
+    whose digest is unchanged can be skipped when sanitizing again, as long
+    as the sanitization rules (rules_digest) are the same as on that run.
+    """
+
+    BATCH_SIZE = 1000
+
+    def __init__(self, path: str):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS entries (
+                entry_index INTEGER PRIMARY KEY,
+                digest TEXT NOT NULL,
+                finding_count INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS findings (
+                entry_index INTEGER NOT NULL,
+                field_path TEXT NOT NULL,
+                pattern TEXT NOT NULL,
+                byte_offset INTEGER NOT NULL,
+                replacement TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_findings_pattern ON findings (pattern, field_path);
+            CREATE INDEX IF NOT EXISTS idx_findings_entry ON findings (entry_index);
+            CREATE TABLE IF NOT EXISTS metadata (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+        """)
+        # Remember which entries were clean last time before this run rewrites
+        # them, unless the rules changed: new patterns may match them now
+        rules = rules_digest()
+        previous_rules = self.conn.execute("SELECT value FROM metadata WHERE key = 'rules'").fetchone()
+        self.previously_clean = {}
+        if previous_rules is not None and previous_rules[0] == rules:
+            self.previously_clean = dict(self.conn.execute(
+                "SELECT entry_index, digest FROM entries WHERE finding_count = 0"
+            ))
+        with self.conn:
+            self.conn.execute("DELETE FROM entries")
+            self.conn.execute("DELETE FROM findings")
+            self.conn.execute("INSERT OR REPLACE INTO metadata VALUES ('rules', ?)", (rules,))
+        self._entry_rows = []
+        self._finding_rows = []
+        self.total_findings = 0
+        self.total_entries = 0
+        self.skipped_entries = 0
+
+    def is_known_clean(self, entry_index: int, digest: str) -> bool:
+        """True if this exact entry had no findings on the previous run."""
+        return self.previously_clean.get(entry_index) == digest
+
+    def record_entry(self, entry_index: int, digest: str, findings: List[Finding]):
+        """Queue an entry and its findings, flushing in batches."""
+        self._entry_rows.append((entry_index, digest, len(findings)))
+        self._finding_rows.extend(
+            (entry_index, field_path, name, offset, replacement)
+            for field_path, name, offset, replacement in findings
+        )
+        self.total_entries += 1
+        self.total_findings += len(findings)
+        if len(self._entry_rows) >= self.BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        """Write queued rows in a single transaction."""
+        with self.conn:
+            self.conn.executemany("INSERT INTO entries VALUES (?, ?, ?)", self._entry_rows)
+            self.conn.executemany("INSERT INTO findings VALUES (?, ?, ?, ?, ?)", self._finding_rows)
+        self._entry_rows = []
+        self._finding_rows = []
+
+    def pattern_counts(self) -> List[Tuple[str, int]]:
+        """Number of findings per pattern, most frequent first."""
+        return self.conn.execute(
+            "SELECT pattern, COUNT(*) FROM findings GROUP BY pattern ORDER BY COUNT(*) DESC"
+        ).fetchall()
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+def sanitize_entry(entry: Dict[str, Any], findings: Optional[List[Finding]] = None) -> Dict[str, Any]:
+    """Sanitize a single HAR entry."""
+    sanitized_entry = entry.copy()
+    
+    # Sanitize request
+    request = sanitized_entry.get('request', {})
+    if 'headers' in request:
+        request['headers'] = sanitize_headers(request['headers'], findings, 'request.headers')
+    if 'url' in request:
+        request['url'] = sanitize_string(request['url'], SENSITIVE_PATTERNS, findings, 'request.url',
+                                         memoize=True)
+    if 'queryString' in request:
+        for i, param in enumerate(request['queryString']):
+            param['value'] = sanitize_string(
+                param['value'],
+                SENSITIVE_PATTERNS,
+                findings,
+                f'request.queryString[{i}].value',
+                memoize=True
+            )
+    if 'postData' in request and 'text' in request['postData']:
+        request['postData']['text'] = sanitize_string(
+            request['postData']['text'], 
+            SENSITIVE_PATTERNS,
+            findings,
+            'request.postData.text'
+        )
+    
+    # Sanitize response
+    response = sanitized_entry.get('response', {})
+    if 'headers' in response:
+        response['headers'] = sanitize_headers(response['headers'], findings, 'response.headers')
+    if 'content' in response and 'text' in response['content']:
+        response['content']['text'] = sanitize_string(
+            response['content']['text'], 
+            SENSITIVE_PATTERNS,
+            findings,
+            'response.content.text'
+        )
+    
+    return sanitized_entry
+
+def sanitize_har_file(har_data: Dict[str, Any], index: Optional[FindingsIndex] = None) -> Dict[str, Any]:
+    """Sanitize an entire HAR file, optionally recording findings in an index."""
     sanitized_har = har_data.copy()
     
     # Sanitize each entry
     entries = sanitized_har.get('log', {}).get('entries', [])
     sanitized_entries = []
     
-    for entry in entries:
-        sanitized_entry = entry.copy()
+    for entry_index, entry in enumerate(entries):
+        if index is None:
+            sanitized_entries.append(sanitize_entry(entry))
+            continue
         
-        # Sanitize request
-        request = sanitized_entry.get('request', {})
-        if 'headers' in request:
-            request['headers'] = sanitize_headers(request['headers'])
-        if 'url' in request:
-            request['url'] = sanitize_string(request['url'], SENSITIVE_PATTERNS)
-        if 'queryString' in request:
-            for param in request['queryString']:
-                param['value'] = sanitize_string(param['value'], SENSITIVE_PATTERNS)
-        if 'postData' in request and 'text' in request['postData']:
-            request['postData']['text'] = sanitize_string(
-                request['postData']['text'], 
-                SENSITIVE_PATTERNS
-            )
+        digest = entry_digest(entry)
+        if index.is_known_clean(entry_index, digest):
+            # Nothing matched last time and the entry is unchanged
+            index.skipped_entries += 1
+            index.record_entry(entry_index, digest, [])
+            sanitized_entries.append(entry)
+            continue
         
-        # Sanitize response
-        response = sanitized_entry.get('response', {})
-        if 'headers' in response:
-            response['headers'] = sanitize_headers(response['headers'])
-        if 'content' in response and 'text' in response['content']:
-            response['content']['text'] = sanitize_string(
-                response['content']['text'], 
-                SENSITIVE_PATTERNS
-            )
-        
-        sanitized_entries.append(sanitized_entry)
+        findings = []
+        sanitized_entries.append(sanitize_entry(entry, findings))
+        index.record_entry(entry_index, digest, findings)
+    
+    if index is not None:
+        index.flush()
     
     sanitized_har['log']['entries'] = sanitized_entries
     return sanitized_har
@@ -143,6 +403,7 @@ def main():
     parser.add_argument('input_file', help='Input HAR file to sanitize')
     parser.add_argument('output_file', help='Output file for sanitized HAR')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be sanitized without saving')
+    parser.add_argument('--index', help='SQLite file recording every replacement for review (reused to skip clean entries)')
     
     args = parser.parse_args()
     
@@ -156,9 +417,22 @@ def main():
     
     # Perform sanitization
     original_count = len(har_data.get('log', {}).get('entries', []))
-    sanitized_har = sanitize_har_file(har_data)
+    index = FindingsIndex(args.index) if args.index else None
+    sanitized_har = sanitize_har_file(har_data, index)
     sanitized_count = len(sanitized_har.get('log', {}).get('entries', []))
     
+    if index is not None:
+        print(f"🗂️  Findings index saved to: {args.index}")
+        print(f"   {index.total_findings} replacements across {index.total_entries} entries"
+              f" ({index.skipped_entries} unchanged clean entries skipped)")
+        for name, count in index.pattern_counts():
+            print(f"   {name}: {count}")
+        index.close()
+    
+    stats = memo_stats()
+    print(f"⚡ Memo hit rate: {stats['hit_rate']:.1%} "
+          f"({stats['hits']} hits, {stats['misses']} misses, {stats['size']} cached values)")
+    
     if args.dry_run:
         print("🔍 DRY RUN - No files will be modified")
         print(f"Original entries: {original_count}")
@@ -172,7 +446,10 @@ def main():
             
             print(f"✅ Sanitized HAR file saved to: {args.output_file}")
             print(f"📊 Processed {sanitized_count} entries")
-            print("⚠️  IMPORTANT: Review the output file manually for any remaining sensitive data")
+            if args.index:
+                print(f"⚠️  IMPORTANT: Review the replacements recorded in {args.index} and spot-check the output")
+            else:
+                print("⚠️  IMPORTANT: Review the output file manually for any remaining sensitive data")
             
         except Exception as e:
             print(f"❌ Error saving sanitized file: {e}")
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Tests for the HAR analyzer.
+Run: pytest test_har_analyzer.py
+"""
+
+import random
+
+from har_analyzer import (
+    BodyStore, QuantileSketch, analyze_url_patterns, extract_api_candidates, generate_openapi_skeleton, profile_endpoint_performance
+)
+
+
+def make_call(url, method='GET', status=200, timing=0, size=0, started=''):
+    return {
+        'url': url,
+        'method': method,
+        'status': status,
+        'headers': {},
+        'query_params': {},
+        'request_body_id': None,
+        'response_body_id': None,
+        'response_type': 'application/json',
+        'response_size': size,
+        'timing': timing,
+        'started': started
+    }
+
+
+def test_slug_and_username_segments_collapse_into_named_parameters():
+    calls = [make_call(f'https://api.example.com/profiles/user_{i}/feed') for i in range(100)]
+    calls += [make_call(f'https://api.example.com/orders/{i:08x}-aaaa-bbbb-cccc-{i:012x}') for i in range(50)]
+    calls += [make_call(f'https://api.example.com/users/{i}', method=m) for i in range(20) for m in ('GET', 'DELETE')]
+
+    patterns = analyze_url_patterns(calls)['patterns']
+
+    assert sorted(patterns) == [
+        'DELETE /users/{userId}',
+        'GET /orders/{orderId}',
+        'GET /profiles/{profileId}/feed',
+        'GET /users/{userId}',
+    ]
+    assert len(patterns['GET /profiles/{profileId}/feed']) == 100
+
+
+def test_small_sets_of_resources_stay_literal():
+    calls = []
+    for resource in ('users', 'orders', 'products'):
+        calls += [make_call(f'https://api.example.com/api/{resource}') for _ in range(30)]
+    calls.append(make_call('https://api.example.com/api/users/me'))
+    calls.append(make_call('https://api.example.com/api/users/42'))
+
+    patterns = analyze_url_patterns(calls)['patterns']
+
+    assert 'GET /api/users' in patterns
+    assert 'GET /api/orders' in patterns
+    assert 'GET /api/users/me' in patterns
+    assert 'GET /api/users/{userId}' in patterns
+
+
+def test_resources_seen_a_few_times_stay_literal():
+    calls = []
+    for resource in ('users', 'orders', 'products', 'cart'):
+        calls.append(make_call(f'https://api.example.com/api/{resource}'))
+    calls.append(make_call('https://api.example.com/api/users', method='POST'))
+    calls.append(make_call('https://api.example.com/api/orders/17'))
+    for resource in ('users', 'orders', 'products', 'categories'):
+        calls += [make_call(f'https://api.example.com/{resource}')] * 2
+
+    patterns = analyze_url_patterns(calls)['patterns']
+
+    assert sorted(patterns) == [
+        'GET /api/cart', 'GET /api/orders', 'GET /api/orders/{orderId}', 'GET /api/products', 'GET /api/users',
+        'GET /categories', 'GET /orders', 'GET /products', 'GET /users', 'POST /api/users',
+    ]
+
+
+def test_repeated_parameter_names_are_made_unique_and_documented():
+    calls = [make_call(f'https://api.example.com/items/{i}/items/{i + 1}') for i in range(5)]
+    analysis = analyze_url_patterns(calls)
+
+    assert list(analysis['patterns']) == ['GET /items/{itemId}/items/{itemId2}']
+
+    spec = generate_openapi_skeleton(analysis, calls)
+    params = spec['paths']['/items/{itemId}/items/{itemId2}']['get']['parameters']
+    assert [(p['name'], p['in']) for p in params] == [('itemId', 'path'), ('itemId2', 'path')]
+
+
+def test_quantile_sketch_is_accurate_and_bounded():
+    rng = random.Random(7)
+    samples = [rng.expovariate(1 / 120) for _ in range(20000)]
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for value in samples:
+        sketch.add(value)
+
+    samples.sort()
+    for q in (0.5, 0.95, 0.99):
+        exact = samples[int(q * (len(samples) - 1))]
+        assert abs(sketch.quantile(q) - exact) <= 0.02 * exact
+    assert len(sketch.buckets) < 2048
+
+
+def test_full_sketch_folds_its_lowest_buckets():
+    sketch = QuantileSketch(relative_accuracy=0.01, max_buckets=8)
+    values = [1.1 ** exponent for exponent in range(40)]
+    for value in values:
+        sketch.add(value)
+    sketch.add(0.5)  # below the floor: counted in the lowest kept bucket
+
+    assert len(sketch.buckets) == 8
+    assert min(sketch.buckets) == sketch.floor_key
+    assert sum(sketch.buckets.values()) == sketch.count == 41
+    assert abs(sketch.quantile(1.0) - values[-1]) <= 0.02 * values[-1]
+    assert abs(sketch.quantile(0.9) - values[35]) <= 0.02 * values[35]
+
+
+def test_performance_profile_is_emitted_as_extension():
+    calls = [
+        make_call('https://api.example.com/search', timing=t, size=2048,
+                  started=f'2024-01-01T00:00:{i:02d}.000Z')
+        for i, t in enumerate([100] * 9 + [1000])
+    ]
+    calls.append(make_call('https://api.example.com/health', timing=5, size=10,
+                           started='2024-01-01T00:01:00.000Z'))
+    analysis = analyze_url_patterns(calls)
+    performance = profile_endpoint_performance(analysis)
+
+    search = performance['GET /search']
+    assert search['sampleCount'] == 10
+    assert abs(search['latencyMs']['p50'] - 100) <= 2
+    assert search['latencyMs']['max'] == 1000
+    assert search['responseBytes']['total'] == 20480
+    assert search['callsPerMinute'] == 10.0
+
+    spec = generate_openapi_skeleton(analysis, calls, performance)
+    assert spec['paths']['/search']['get']['x-performance'] == search
+
+
+def make_har(bodies):
+    return {'log': {'entries': [
+        {
+            'request': {'url': 'https://api.example.com/api/status', 'method': 'GET', 'headers': []},
+            'response': {'status': 200, 'content': {'mimeType': 'application/json', 'text': body}}
+        }
+        for body in bodies
+    ]}}
+
+
+def test_identical_bodies_are_stored_once():
+    store = BodyStore()
+    calls = extract_api_candidates(make_har(['{"state": "pending"}'] * 50 + ['{"state": "done"}']), store)
+
+    assert len(store) == 2
+    assert calls[0]['response_body_id'] == calls[49]['response_body_id']
+    assert calls[0]['request_body_id'] is None
+    assert store.refcounts[calls[0]['response_body_id']] == 50
+    assert store.get(calls[50]['response_body_id']) == '{"state": "done"}'
+
+
+def test_spilled_bodies_are_read_back_through_mmap(tmp_path):
+    store = BodyStore(str(tmp_path))
+    calls = extract_api_candidates(make_har(['{"name": "Zoë"}', '{"n": 1}', '{"name": "Zoë"}']), store)
+
+    assert len(store) == 2
+    assert store.get(calls[2]['response_body_id']) == '{"name": "Zoë"}'
+    assert store.get(calls[1]['response_body_id']) == '{"n": 1}'
+    store.close()
+
+
+def test_body_store_closes_its_spill_file_on_exit(tmp_path):
+    (tmp_path / 'keep.txt').write_text('not a spill file')
+    with BodyStore(str(tmp_path)) as store:
+        calls = extract_api_candidates(make_har(['{"n": 1}']), store)
+        assert store.get(calls[0]['response_body_id']) == '{"n": 1}'
+    assert store._spill_file is None and store._mmap is None
+    # Existing files are untouched and the spill file is gone
+    assert [path.name for path in tmp_path.iterdir()] == ['keep.txt']
+    assert (tmp_path / 'keep.txt').read_text() == 'not a spill file'
+
+
+def test_candidates_carry_bodies_without_a_store():
+    calls = extract_api_candidates(make_har(['{"state": "pending"}'] * 3))
+    assert calls[0]['response_body'] == '{"state": "pending"}' and calls[0]['request_body'] == ''
+    assert calls[0]['response_body'] is calls[2]['response_body']
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Tests for the HAR sanitizer.
+Run: pytest test_sanitizer.py
+"""
+
+import sqlite3
+
+import sanitizer
+from sanitizer import (
+    FindingsIndex, SENSITIVE_PATTERNS, clear_memo, memo_stats, sanitize_har_file, sanitize_string
+)
+
+
+def make_har():
+    return {
+        'log': {
+            'entries': [
+                {
+                    'request': {
+                        'url': 'https://api.example.com/users?api_key=abcdef123',
+                        'headers': [
+                            {'name': 'Authorization', 'value': 'Bearer secret'},
+                            {'name': 'Accept', 'value': 'application/json'},
+                        ],
+                    },
+                    'response': {
+                        'headers': [{'name': 'X-Served-By', 'value': 'proxy 10.0.0.12'}],
+                        'content': {'text': '{"email": "jane@example.com"}'},
+                    },
+                },
+                {
+                    'request': {'url': 'https://api.example.com/health', 'headers': []},
+                    'response': {'headers': [], 'content': {'text': '{"ok": true}'}},
+                },
+            ]
+        }
+    }
+
+
+def test_sanitize_string_records_byte_offsets():
+    findings = []
+    result = sanitize_string('héllo 192.168.0.1', SENSITIVE_PATTERNS, findings, 'request.url')
+    assert result == 'héllo {{IP_ADDRESS}}'
+    # 'é' is two bytes in UTF-8
+    assert findings == [('request.url', 'IP_ADDRESS', 7, '{{IP_ADDRESS}}')]
+
+
+def test_offsets_point_into_the_sanitized_value():
+    # The token pattern runs before the IP pattern, whose longer placeholder then shifts it
+    findings = []
+    text = 'ü 10.0.0.1 token=abc'
+    result = sanitize_string(text, SENSITIVE_PATTERNS, findings, 'request.url')
+    assert result == 'ü {{IP_ADDRESS}} token={{TOKEN}}'
+    assert [(name, offset) for _, name, offset, _ in findings] == [('IP_ADDRESS', 3), ('TOKEN', 18)]
+    encoded = result.encode('utf-8')
+    for _, _, offset, replacement in findings:
+        assert encoded[offset:].startswith(replacement.encode('utf-8'))
+
+
+def test_memo_replays_findings_for_repeated_values():
+    clear_memo()
+    first, second = [], []
+    url = 'https://api.example.com/items?token=abc123'
+    assert sanitize_string(url, SENSITIVE_PATTERNS, first, 'request.url', memoize=True) == \
+        sanitize_string(url, SENSITIVE_PATTERNS, second, 'response.headers[0].value', memoize=True)
+    assert [f[1:] for f in first] == [f[1:] for f in second]
+    assert second[0][0] == 'response.headers[0].value'
+
+    stats = memo_stats()
+    assert stats['hits'] == 1 and stats['misses'] == 1
+    assert stats['hit_rate'] == 0.5
+
+
+def test_memo_follows_pattern_changes(monkeypatch):
+    clear_memo()
+    text = '{"ok": true}'
+    assert sanitize_string(text, SENSITIVE_PATTERNS, memoize=True) == text
+
+    monkeypatch.setattr(sanitizer, 'SENSITIVE_PATTERNS', list(SENSITIVE_PATTERNS))
+    sanitizer.SENSITIVE_PATTERNS.append((r'"ok"', '"{{STATUS}}"'))
+    findings = []
+    assert sanitize_string(text, sanitizer.SENSITIVE_PATTERNS, findings, memoize=True) == '{"{{STATUS}}": true}'
+    assert [name for _, name, _, _ in findings] == ['STATUS']
+
+
+def test_index_records_findings_per_field(tmp_path):
+    index = FindingsIndex(str(tmp_path / 'findings.db'))
+    sanitize_har_file(make_har(), index)
+    index.close()
+
+    conn = sqlite3.connect(str(tmp_path / 'findings.db'))
+    rows = conn.execute(
+        "SELECT entry_index, field_path FROM findings "
+        "WHERE pattern = 'IP_ADDRESS' AND field_path LIKE 'response.headers%'"
+    ).fetchall()
+    assert rows == [(0, 'response.headers[0].value')]
+
+    patterns = {row[0] for row in conn.execute("SELECT pattern FROM findings")}
+    assert {'AUTH_HEADER', 'API_KEY', 'USER_EMAIL', 'IP_ADDRESS'} <= patterns
+
+    counts = dict(conn.execute("SELECT entry_index, finding_count FROM entries"))
+    assert counts[1] == 0
+
+
+def test_index_skips_unchanged_clean_entries(tmp_path):
+    path = str(tmp_path / 'findings.db')
+    index = FindingsIndex(path)
+    sanitize_har_file(make_har(), index)
+    index.close()
+
+    index = FindingsIndex(path)
+    sanitize_har_file(make_har(), index)
+    assert index.skipped_entries == 1
+    assert index.total_entries == 2
+    index.close()
+
+
+def test_index_rescans_clean_entries_when_rules_change(tmp_path, monkeypatch):
+    path = str(tmp_path / 'findings.db')
+    index = FindingsIndex(path)
+    sanitize_har_file(make_har(), index)
+    index.close()
+
+    monkeypatch.setattr(sanitizer, 'SENSITIVE_PATTERNS', SENSITIVE_PATTERNS + [(r'"ok"', '"{{STATUS}}"')])
+    index = FindingsIndex(path)
+    sanitized = sanitize_har_file(make_har(), index)
+    assert index.skipped_entries == 0
+    index.close()
+    assert sanitized['log']['entries'][1]['response']['content']['text'] == '{"{{STATUS}}": true}'
+
+    conn = sqlite3.connect(path)
+    rows = conn.execute("SELECT entry_index, field_path FROM findings WHERE pattern = 'STATUS'").fetchall()
+    assert rows == [(1, 'response.content.text')]
+    assert dict(conn.execute("SELECT entry_index, finding_count FROM entries"))[1] == 1
@@ -7,36 +7,90 @@ Analyzes OpenAPI specifications for agent-readiness and quality.
 import click
 import os
 import sys
-from pathlib import Path
-from dotenv import load_dotenv
+import time
 
-# TODO: Import your scorecard modules here
-# from scorecard.parser import OpenAPIParser
-# from scorecard.analyzer import QualityAnalyzer
-# from scorecard.reporter import ReportGenerator
+from scorecard import CATEGORIES, OpenAPIParser, QualityAnalyzer, thresholds_from_env
+from scorecard.batch import SORT_KEYS
+
+__version__ = '0.1.0'
 
 @click.command()
-@click.argument('spec_path')
+@click.version_option(__version__, prog_name='scorecard')
+@click.argument('spec_path', required=False)
 @click.option('--output', '-o', help='Output file path for report')
 @click.option('--format', '-f', 
-              type=click.Choice(['html', 'json', 'markdown'], case_sensitive=False),
+              type=click.Choice(['html', 'json', 'markdown', 'csv'], case_sensitive=False),
               default='html', 
               help='Output format for report')
-@click.option('--detailed', '-d', is_flag=True, help='Generate detailed analysis')
+@click.option('--detailed', '-d', is_flag=True,
+              help='Generate detailed analysis (reports also list the issues of every operation)')
+@click.option('--explain', is_flag=True,
+              help='Break the score down by rule: points, operations responsible and evaluation time')
 @click.option('--quiet', '-q', is_flag=True, help='Suppress console output')
 @click.option('--threshold', '-t', type=int, default=70, 
               help='Minimum score threshold (default: 70)')
-def main(spec_path, output, format, detailed, quiet, threshold):
+@click.option('--cache', 'cache_dir', metavar='DIR',
+              help='Cache directory for per-operation and per-schema counters: unchanged specs are '
+                   'not re-parsed and only changed operations and schemas are re-collected')
+@click.option('--history', 'history_db', metavar='DB',
+              help='SQLite score history: every scored spec is appended to it, and --trend and '
+                   '--regressions read from it')
+@click.option('--trend', 'trend_api', metavar='API',
+              help='Show the score trend across the recorded versions of API (its info.title) and exit')
+@click.option('--regressions', is_flag=True,
+              help='List APIs whose latest version scores lower than the previous one; exits 1 if any')
+@click.option('--manifest', '-m', type=click.Path(exists=True, dir_okay=False),
+              help='Batch mode: score every spec listed in this file (one path or URL per line)')
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=None,
+              help='Batch mode: worker processes (default: CPU count)')
+@click.option('--sort', 'sort_key', type=click.Choice(list(SORT_KEYS)), default='overall_score',
+              help='Batch mode: leaderboard sort column')
+@click.option('--min-average', type=float, default=None,
+              help='Batch mode: fail if the average score is below this')
+@click.option('--max-below', type=click.FloatRange(0, 1), default=None,
+              help='Batch mode: fail if a larger share of specs (0-1) scores below --threshold')
+@click.option('--report-dir', metavar='DIR',
+              help='Batch mode: also write a report per spec into DIR (in --format; HTML when it is csv)')
+@click.option('--max-errors', type=click.IntRange(min=0), default=None,
+              help='Batch mode: fail if more specs than this cannot be scored')
+def main(spec_path, output, format, detailed, explain, quiet, threshold, cache_dir, history_db, trend_api, regressions,
+         manifest, jobs, sort_key, min_average, max_below, report_dir, max_errors):
     """
     Analyze OpenAPI specification for agent-readiness and quality.
     
     SPEC_PATH can be a local file path or URL to an OpenAPI specification.
+    A directory (or --manifest) scores every spec in it in parallel and
+    writes a leaderboard instead; the exit code then follows only the
+    aggregate rules --min-average, --max-below and --max-errors.
     
     Examples:
         scorecard.py api.yaml
         scorecard.py https://api.example.com/openapi.json --detailed
         scorecard.py spec.yaml --output report.html --format html
+        scorecard.py large-api.yaml --explain
+        scorecard.py specs/ --output leaderboard.csv --format csv --max-below 0.2
+        scorecard.py api.yaml --history scores.db
+        scorecard.py --history scores.db --trend "Example API"
     """
+    # Load environment variables here rather than at import time, so --help
+    # and --version (handled by click before this runs) never import dotenv
+    from dotenv import load_dotenv
+    load_dotenv()
+    
+    if trend_api or regressions:
+        if not history_db:
+            raise click.UsageError("--trend and --regressions need --history DB.")
+        sys.exit(show_history(history_db, trend_api, output, format, quiet))
+    if manifest or (spec_path and os.path.isdir(spec_path)):
+        if explain:
+            raise click.UsageError("--explain breaks down a single spec; run it on one spec of the catalog.")
+        run_batch_mode(spec_path, manifest, output, format, quiet, threshold, jobs, sort_key,
+                       min_average, max_below, max_errors, cache_dir, history_db, report_dir, detailed)
+        return
+    if not spec_path:
+        raise click.UsageError("Missing argument 'SPEC_PATH' (or use --manifest).")
+    if format == 'csv':
+        raise click.UsageError("--format csv is only available for leaderboards (directory or --manifest).")
     
     if not quiet:
         click.echo("🔍 API Quality Scorecard")
@@ -45,57 +99,69 @@ def main(spec_path, output, format, detailed, quiet, threshold):
         click.echo()
     
     try:
-        # TODO: Implement the actual scorecard logic
-        # This is just a skeleton to show the structure
-        
         # 1. Parse the OpenAPI specification
         if not quiet:
             click.echo("📖 Parsing OpenAPI specification...")
         
-        # parser = OpenAPIParser()
-        # spec = parser.load(spec_path)
-        
-        # 2. Analyze the specification
-        if not quiet:
-            click.echo("🔬 Analyzing API quality...")
-        
-        # analyzer = QualityAnalyzer()
-        # results = analyzer.analyze(spec, detailed=detailed)
-        
-        # 3. Generate report
-        if not quiet:
-            click.echo("📊 Generating report...")
-        
-        # reporter = ReportGenerator()
-        # report = reporter.generate(results, format=format, detailed=detailed)
+        parser = OpenAPIParser()
+        spec = cache = None
+        if cache_dir and not explain:
+            # Parsing and analysis go through the cache, which skips whatever is unchanged
+            from scorecard.cache import ScoreCache, analyze_cached
+            
+            cache = ScoreCache.for_spec(cache_dir, spec_path)
+            info, results = analyze_cached(spec_path, cache, thresholds_from_env(), detailed, parser)
+            if not quiet:
+                click.echo(f"♻️  Reused cached counters for {cache.reused} units, collected {cache.collected}")
+        else:
+            started = time.perf_counter()
+            spec = parser.load(spec_path)
+            parsed = time.perf_counter() - started
+            
+            # 2. Analyze the specification (one pass collects every metric)
+            if not quiet:
+                click.echo("🔬 Analyzing API quality...")
+            
+            analyzer = QualityAnalyzer(thresholds_from_env())
+            results = analyzer.analyze(spec, detailed=detailed, explain=explain)
+            if explain:
+                results['explain']['timings'] = {'parse': parsed, **results['explain']['timings']}
+            info = spec.get('info') or {}
         
-        # For now, just show a placeholder
-        placeholder_results = {
-            'overall_score': 75,
-            'category_scores': {
-                'documentation': 18,
-                'schemas': 20,
-                'errors': 15,
-                'usability': 16,
-                'auth': 6
-            },
-            'total_operations': 25,
-            'issues_found': 12,
-            'recommendations': 8
-        }
+        if history_db:
+            from scorecard.history import TrendStore
+            
+            store = TrendStore(history_db)
+            store.record(str(info.get('title', '')), str(info.get('version', '')), results)
+            store.close()
         
         # Display results
         if not quiet:
-            display_results(placeholder_results, threshold)
+            display_results(results, threshold, detailed)
+            if explain:
+                display_explanation(results['explain'])
         
         # Save report if output specified
         if output:
-            save_report(placeholder_results, output, format)
             if not quiet:
-                click.echo(f"📁 Report saved to: {output}")
+                click.echo("📊 Generating report...")
+            operation_rows = None
+            if detailed:
+                # Per-operation issue table, produced while the report is written
+                from scorecard.analyzer import operation_issues
+                
+                if cache is not None:
+                    # Cached feature rows and operationIds: the spec is not parsed again
+                    operation_rows = operation_issues(None, features=cache.operation_features(thresholds_from_env()))
+                else:
+                    operation_rows = operation_issues(spec, thresholds_from_env())
+            written = save_report(results, output, format, operation_rows)
+            if not quiet:
+                click.echo(f"📁 Report saved to: {output}"
+                           + (f" (+{len(written) - 1} pages)" if len(written) > 1 else ""))
         
         # Exit with appropriate code
-        score = placeholder_results['overall_score']
+        score = results['overall_score']
         if score < threshold:
             if not quiet:
                 click.echo(f"\n⚠️  Score {score} below threshold {threshold}")
@@ -117,7 +183,120 @@ def main(spec_path, output, format, detailed, quiet, threshold):
             click.echo("  - Try with a simpler specification first")
         sys.exit(1)
 
-def display_results(results, threshold):
+def run_batch_mode(spec_path, manifest, output, format, quiet, threshold, jobs, sort_key,
+                   min_average, max_below, max_errors, cache_dir=None, history_db=None, report_dir=None,
+                   detailed=False):
+    """Score a catalog of specs, write the leaderboard and exit by the aggregate rules."""
+    from scorecard.batch import aggregate_failures, expand_catalog, read_manifest, run_batch, sort_rows, summarize_rows
+    from scorecard.leaderboard import chunk_lines, leaderboard_lines
+    
+    specs = []
+    if spec_path:
+        specs.extend(expand_catalog(spec_path))
+    if manifest:
+        specs.extend(read_manifest(manifest))
+    specs = list(dict.fromkeys(specs))
+    if not specs:
+        click.echo("❌ Error: No specifications found to score", err=True)
+        sys.exit(1)
+    
+    jobs = jobs or os.cpu_count() or 1
+    if not quiet:
+        click.echo("🔍 API Quality Scorecard - Batch")
+        click.echo("=" * 50)
+        click.echo(f"Scoring {len(specs)} specifications on {min(jobs, len(specs))} worker(s)")
+        click.echo()
+    
+    store = None
+    if history_db:
+        from scorecard.history import TrendStore
+        store = TrendStore(history_db)
+    
+    def on_result(row):
+        if store and row['status'] == 'scored':
+            store.record(row['title'], row['version'], row)
+        if quiet:
+            return
+        if row['status'] == 'scored':
+            click.echo(f"  {row['overall_score']:3}/100  {row['spec']}", err=True)
+        else:
+            click.echo(f"  error    {row['spec']}: {row['error']}", err=True)
+    
+    report_format = 'html' if format == 'csv' else format
+    rows = sort_rows(run_batch(specs, jobs, thresholds_from_env(), on_result, cache_dir, report_dir, report_format,
+                               detailed), sort_key)
+    if store:
+        store.close()
+    summary = summarize_rows(rows, threshold)
+    
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            for chunk in chunk_lines(leaderboard_lines(rows, summary, format)):
+                f.write(chunk)
+    
+    if not quiet:
+        click.echo(f"\n📊 Scored {summary['scored']} of {summary['total_specs']} specs "
+                   f"({summary['errored']} errors, {summary['total_operations']} operations)")
+        click.echo(f"  Average score: {summary['average_score']}  Median: {summary['median_score']}")
+        click.echo(f"  Below threshold {threshold}: {summary['below_threshold']}")
+        click.echo("\n🏆 Top APIs:")
+        for row in rows[:10]:
+            if row['status'] == 'scored':
+                click.echo(f"  {row['rank']:3}. {row['overall_score']:3}/100  {row['title']} ({row['spec']})")
+        if output:
+            click.echo(f"\n📁 Leaderboard saved to: {output}")
+        if report_dir:
+            click.echo(f"📁 Reports saved to: {report_dir}")
+    
+    failures = aggregate_failures(summary, min_average, max_below, max_errors)
+    if failures:
+        if not quiet:
+            for failure in failures:
+                click.echo(f"\n⚠️  {failure}")
+        sys.exit(1)
+    if not quiet:
+        click.echo("\n✅ Batch meets the aggregate thresholds")
+    sys.exit(0)
+
+def show_history(history_db, trend_api, output, format, quiet):
+    """Print (and save) a trend or regression table from the score history; returns the exit code."""
+    from scorecard.history import TrendStore, trend_lines
+    
+    store = TrendStore(history_db)
+    try:
+        if trend_api:
+            try:
+                rows = store.trend(trend_api)
+            except KeyError:
+                known = ', '.join(store.apis()) or 'none'
+                click.echo(f"❌ Error: No history for API {trend_api!r} (recorded APIs: {known})", err=True)
+                return 1
+            title = f"📈 Score trend: {trend_api}"
+        else:
+            rows = store.regressions()
+            title = f"📉 Regressions: {len(rows)} APIs scored lower than their previous version"
+    finally:
+        store.close()
+    
+    if not quiet:
+        click.echo(title)
+        click.echo("=" * 50)
+        for row in rows:
+            delta = row['delta']['overall_score']
+            change = '' if delta is None else f" ({delta:+d})"
+            color = None if not delta else ('green' if delta > 0 else 'red')
+            label = row['version'] if trend_api else f"{row['api']} {row['version']}"
+            click.echo(f"  {label:30} ", nl=False)
+            click.secho(f"{row['overall_score']:3}/100{change}", fg=color)
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            for line in trend_lines(rows, format):
+                f.write(line + '\n')
+        if not quiet:
+            click.echo(f"\n📁 Table saved to: {output}")
+    return 1 if rows and not trend_api else 0
+
+def display_results(results, threshold, detailed=False):
     """Display analysis results to console."""
     score = results['overall_score']
     
@@ -137,17 +316,8 @@ def display_results(results, threshold):
     
     # Category breakdown
     click.echo("\n📋 Category Scores:")
-    categories = {
-        'documentation': 'Documentation Quality',
-        'schemas': 'Schema Completeness', 
-        'errors': 'Error Handling',
-        'usability': 'Agent Usability',
-        'auth': 'Authentication Clarity'
-    }
-    
-    for key, name in categories.items():
+    for key, name, max_score in CATEGORIES:
         category_score = results['category_scores'][key]
-        max_score = {'documentation': 25, 'schemas': 25, 'errors': 20, 'usability': 20, 'auth': 10}[key]
         percentage = int((category_score / max_score) * 100)
         
         if percentage >= 80:
@@ -165,68 +335,41 @@ def display_results(results, threshold):
     click.echo(f"  Operations analyzed: {results['total_operations']}")
     click.echo(f"  Issues found: {results['issues_found']}")
     click.echo(f"  Recommendations: {results['recommendations']}")
+    
+    if detailed:
+        if results.get('criteria'):
+            click.echo("\n🔎 Criteria:")
+            for criterion in results['criteria']:
+                click.echo(f"  {criterion['name']:25} {criterion['points']:5.1f}/{criterion['max_points']}")
+        if results.get('issues'):
+            click.echo("\n⚠️  Issues:")
+            for issue in results['issues']:
+                click.echo(f"  - [{issue['category']}] {issue['message']}")
+        if results.get('recommendation_details'):
+            click.echo("\n💡 Recommendations:")
+            for item in results['recommendation_details']:
+                click.echo(f"  - {item['recommendation']} (+{item['points_lost']:.1f} points)")
 
-def save_report(results, output_path, format):
-    """Save report to file."""
-    # TODO: Implement actual report generation
-    
-    if format == 'json':
-        import json
-        with open(output_path, 'w') as f:
-            json.dump(results, f, indent=2)
-    
-    elif format == 'html':
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>API Quality Scorecard Report</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 40px; }}
-                .score {{ font-size: 2em; font-weight: bold; }}
-                .category {{ margin: 10px 0; }}
-            </style>
-        </head>
-        <body>
-            <h1>API Quality Scorecard Report</h1>
-            <div class="score">Overall Score: {results['overall_score']}/100</div>
-            <h2>Category Scores</h2>
-            <div class="category">Documentation: {results['category_scores']['documentation']}/25</div>
-            <div class="category">Schemas: {results['category_scores']['schemas']}/25</div>
-            <div class="category">Error Handling: {results['category_scores']['errors']}/20</div>
-            <div class="category">Usability: {results['category_scores']['usability']}/20</div>
-            <div class="category">Authentication: {results['category_scores']['auth']}/10</div>
-        </body>
-        </html>
-        """
-        with open(output_path, 'w') as f:
-            f.write(html_content)
-    
-    elif format == 'markdown':
-        md_content = f"""# API Quality Scorecard Report
-
-## Overall Score: {results['overall_score']}/100
-
-## Category Scores
-
-- **Documentation Quality**: {results['category_scores']['documentation']}/25
-- **Schema Completeness**: {results['category_scores']['schemas']}/25  
-- **Error Handling**: {results['category_scores']['errors']}/20
-- **Agent Usability**: {results['category_scores']['usability']}/20
-- **Authentication Clarity**: {results['category_scores']['auth']}/10
-
-## Summary
+def display_explanation(explanation):
+    """Display the per-rule breakdown of --explain."""
+    timings = explanation['timings']
+    click.echo("\n⏱️  Time: " + ", ".join(f"{phase} {seconds * 1000:.1f} ms" for phase, seconds in timings.items()))
+    
+    click.echo("\n🧮 Rules (points, operations losing points, evaluation time;")
+    click.echo("   indented: operations losing the most, each scored on its own):")
+    for rule in explanation['rules']:
+        operations = f"{rule['operations']:6} ops" if rule['scope'] == 'operation' else '  spec-wide'
+        click.echo(f"  {rule['name']:25} {rule['points']:5.1f}/{rule['max_points']:<2} "
+                   f"(-{rule['points_lost']:4.1f}) {operations} {rule['seconds'] * 1000:7.2f} ms")
+        for operation in rule['top_operations']:
+            click.echo(f"      -{operation['points_lost']:.1f}  {operation['method']} {operation['path']}")
 
-- Operations analyzed: {results['total_operations']}
-- Issues found: {results['issues_found']}
-- Recommendations: {results['recommendations']}
-"""
-        with open(output_path, 'w') as f:
-            f.write(md_content)
+def save_report(results, output_path, format, operation_rows=None):
+    """Save report to file; returns the files written (HTML reports page long operation tables)."""
+    from scorecard.report import write_report
+    
+    return write_report(results, output_path, format, operation_rows)
 
 if __name__ == '__main__':
-    # Load environment variables
-    load_dotenv()
-    
     # Run CLI
     main()
\ No newline at end of file
@@ -0,0 +1,30 @@
+"""
+API quality scorecard package used by scorecard.py.
+
+OpenAPIParser loads specs, collect_metrics() gathers every counter the
+scoring criteria need in one traversal, and QualityAnalyzer turns them into
+category scores (see scoring_framework.md). extract_features() lays the
+per-operation part out as NumPy columns, so operation-scoped criteria,
+per-operation scores and percentiles are computed over whole arrays. run_batch() scores a whole
+catalog on a process pool for the leaderboards of scorecard.leaderboard.
+ScoreCache keeps per-operation and per-schema counters between runs so
+that only changed parts of a spec are collected again, and TrendStore
+records every run for trend and regression queries.
+"""
+
+from .analyzer import CATEGORIES, CATEGORY_MAX, CRITERIA, QualityAnalyzer, score_metrics
+from .batch import aggregate_failures, run_batch, sort_rows, summarize_rows
+from .cache import ScoreCache, analyze_cached, collect_incremental
+from .features import OperationFeatures, extract_features, percentile_ranks
+from .history import TrendStore
+from .metrics import (FRAMEWORK_VERSION, QUALITY_THRESHOLDS, SpecMetrics, collect_metrics, collect_unit_metrics,
+                      spec_units, thresholds_from_env)
+from .parser import OpenAPIParser
+
+__all__ = [
+    'CATEGORIES', 'CATEGORY_MAX', 'CRITERIA', 'QualityAnalyzer', 'score_metrics',
+    'FRAMEWORK_VERSION', 'QUALITY_THRESHOLDS', 'SpecMetrics', 'collect_metrics', 'collect_unit_metrics',
+    'spec_units', 'thresholds_from_env', 'ScoreCache', 'analyze_cached', 'collect_incremental',
+    'OperationFeatures', 'extract_features', 'percentile_ranks',
+    'OpenAPIParser', 'TrendStore', 'aggregate_failures', 'run_batch', 'sort_rows', 'summarize_rows',
+]
@@ -0,0 +1,414 @@
+"""
+Scoring engine: the criteria of scoring_framework.md evaluated on SpecMetrics.
+
+Each criterion is a function of the metrics returning the fraction of its
+points earned and, when points were lost, the number of offending items and
+a message. Criteria never look at the spec, so all five categories are
+scored from the counters of a single traversal. Operation-scoped criteria
+are also evaluated once over the per-operation feature columns
+(scorecard.features). That gives every operation's points and issues as
+arrays: operation_scores() and operation_issues(). explain_criteria()
+breaks a score down rule by rule, with the operations behind every loss
+and the time each rule takes.
+"""
+
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .features import REPORTED_FEATURES, OperationFeatures, extract_features
+from .metrics import SpecMetrics
+
+# (key, display name, maximum points)
+CATEGORIES = (
+    ('documentation', 'Documentation Quality', 25),
+    ('schemas', 'Schema Completeness', 25),
+    ('errors', 'Error Handling', 20),
+    ('usability', 'Agent Usability', 20),
+    ('auth', 'Authentication Clarity', 10),
+)
+CATEGORY_MAX = {key: maximum for key, _, maximum in CATEGORIES}
+CATEGORY_NAMES = {key: name for key, name, _ in CATEGORIES}
+
+# Error status codes an agent most needs to tell apart
+COMMON_ERROR_STATUSES = ('400', '401', '403', '404', '500')
+
+# Criteria losing less than this many points get no recommendation
+RECOMMENDATION_MIN_LOSS = 0.5
+
+# Operations listed per criterion when explaining a score
+EXPLAIN_OPERATIONS = 5
+
+# (fraction earned, offending items, message about them)
+Evaluation = Tuple[float, int, str]
+
+
+class Criterion:
+    """
+    One scoring criterion: `points` of a category, earned as evaluate(metrics)
+    says. Criteria with scope 'operation' can be evaluated on the counters of
+    a single operation; 'spec' ones only make sense for the whole document.
+    """
+
+    def __init__(self, category: str, name: str, points: int, evaluate: Callable[[SpecMetrics], Evaluation],
+                 recommendation: str, scope: str = 'operation'):
+        self.category = category
+        self.name = name
+        self.points = points
+        self.evaluate = evaluate
+        self.recommendation = recommendation
+        self.scope = scope
+
+
+CRITERIA: List[Criterion] = []
+
+
+def criterion(category: str, name: str, points: int, recommendation: str, scope: str = 'operation'):
+    """Register a criterion; points per category must add up to CATEGORY_MAX."""
+    def decorator(evaluate):
+        CRITERIA.append(Criterion(category, name, points, evaluate, recommendation, scope))
+        return evaluate
+    return decorator
+
+
+def _missing(metrics: SpecMetrics, part: str, whole: str) -> int:
+    return metrics[whole] - metrics[part]
+
+
+# Documentation Quality
+
+@criterion('documentation', 'Operation descriptions', 8,
+           'Describe what each operation does, when to use it and what it returns')
+def operation_descriptions(m):
+    # Half the credit for a description, the rest for a detailed one
+    fraction = (m.ratio('operations_described', 'operations', 0.0)
+                + m.ratio('operations_well_described', 'operations', 0.0)) / 2
+    return (fraction, _missing(m, 'operations_well_described', 'operations'),
+            f"operations without a detailed description ({m.thresholds['good_description_length']}+ characters)")
+
+
+@criterion('documentation', 'Parameter descriptions', 7, 'Describe every parameter, including its format and units')
+def parameter_descriptions(m):
+    return (m.ratio('parameters_described', 'parameters'), _missing(m, 'parameters_described', 'parameters'),
+            'parameters without a description')
+
+
+@criterion('documentation', 'Examples', 5, 'Add request and response examples')
+def examples(m):
+    return (m.ratio('operations_with_examples', 'operations', 0.0),
+            _missing(m, 'operations_with_examples', 'operations'), 'operations without any example')
+
+
+@criterion('documentation', 'Summaries and tags', 5, 'Give every operation a short summary and at least one tag')
+def summaries_and_tags(m):
+    fraction = (m.ratio('operations_summarized', 'operations', 0.0)
+                + m.ratio('operations_tagged', 'operations', 0.0)) / 2
+    return fraction, _missing(m, 'operations_summarized', 'operations'), 'operations without a summary'
+
+
+# Schema Completeness
+
+@criterion('schemas', 'Request body schemas', 8, 'Define a typed schema for every request body media type')
+def request_body_schemas(m):
+    return (m.ratio('request_bodies_typed', 'request_bodies'), _missing(m, 'request_bodies_typed', 'request_bodies'),
+            'request bodies without a typed schema')
+
+
+@criterion('schemas', 'Response schemas', 8, 'Define a schema for every response that has a body')
+def response_schemas(m):
+    return (m.ratio('responses_with_schema', 'responses', 0.0), _missing(m, 'responses_with_schema', 'responses'),
+            'responses without a schema')
+
+
+@criterion('schemas', 'Parameter types', 5, 'Give every parameter a schema with a type')
+def parameter_types(m):
+    return (m.ratio('parameters_typed', 'parameters'), _missing(m, 'parameters_typed', 'parameters'),
+            'parameters without a type')
+
+
+@criterion('schemas', 'Required fields', 4, 'List the required properties of every object schema')
+def required_fields(m):
+    return (m.ratio('object_schemas_with_required', 'object_schemas'),
+            _missing(m, 'object_schemas_with_required', 'object_schemas'),
+            'object schemas without required properties')
+
+
+# Error Handling
+
+@criterion('errors', 'Error responses', 8, 'Document the 4xx and 5xx responses of every operation')
+def error_responses(m):
+    fraction = (m.ratio('operations_with_4xx', 'operations', 0.0)
+                + m.ratio('operations_with_5xx', 'operations', 0.0)) / 2
+    return (fraction, _missing(m, 'operations_with_4xx', 'operations') + _missing(m, 'operations_with_5xx', 'operations'),
+            '4xx/5xx response classes missing from operations')
+
+
+@criterion('errors', 'Error schemas', 6, 'Give error responses a structured schema (e.g. code and message)')
+def error_schemas(m):
+    return (m.ratio('error_responses_with_schema', 'error_responses', 0.0),
+            _missing(m, 'error_responses_with_schema', 'error_responses'), 'error responses without a schema')
+
+
+@criterion('errors', 'Status code coverage', 4, 'Cover the common error statuses: ' + ', '.join(COMMON_ERROR_STATUSES),
+           scope='spec')
+def status_code_coverage(m):
+    missing = [status for status in COMMON_ERROR_STATUSES if not m['status:' + status]]
+    return (1 - len(missing) / len(COMMON_ERROR_STATUSES), len(missing),
+            'common error statuses never documented' + (f" ({', '.join(missing)})" if missing else ''))
+
+
+@criterion('errors', 'Error examples', 2, 'Add examples to error responses')
+def error_examples(m):
+    return (m.ratio('error_responses_with_examples', 'error_responses', 0.0),
+            _missing(m, 'error_responses_with_examples', 'error_responses'), 'error responses without an example')
+
+
+# Agent Usability
+
+@criterion('usability', 'Operation naming', 6, 'Give every operation an operationId in one consistent style')
+def operation_naming(m):
+    fraction = (m.ratio('operations_with_id', 'operations', 0.0) + m.style_consistency('operation_id_style')) / 2
+    return fraction, _missing(m, 'operations_with_id', 'operations'), 'operations without an operationId'
+
+
+@criterion('usability', 'Organization', 5, 'Tag operations and describe the tags at the top level')
+def organization(m):
+    fraction = (3 * m.ratio('operations_tagged', 'operations', 0.0)
+                + 2 * m.ratio('tags_described', 'tags_declared', 0.0)) / 5
+    return fraction, _missing(m, 'operations_tagged', 'operations'), 'operations without tags'
+
+
+@criterion('usability', 'Operation complexity', 5, 'Split operations with many parameters or deeply nested schemas')
+def operation_complexity(m):
+    return (m.ratio('operations_simple', 'operations', 0.0), _missing(m, 'operations_simple', 'operations'),
+            f"operations with more than {m.thresholds['max_parameters_per_operation']} parameters "
+            f"or schemas nested deeper than {m.thresholds['max_schema_depth']}")
+
+
+@criterion('usability', 'Naming consistency', 4, 'Use one naming style for parameters and for schema properties',
+           scope='spec')
+def naming_consistency(m):
+    fraction = (m.style_consistency('param_style') + m.style_consistency('property_style')) / 2
+    names = sum(m.prefixed('param_style').values()) + sum(m.prefixed('property_style').values())
+    return fraction, round(names * (1 - fraction)), 'names outside the dominant naming style'
+
+
+# Authentication Clarity
+
+@criterion('auth', 'Security schemes', 4, 'Define security schemes and describe how to obtain credentials',
+           scope='spec')
+def security_schemes(m):
+    if not m['security_schemes']:
+        return 0.0, 1, 'no security schemes defined'
+    return ((1 + m.ratio('security_schemes_described', 'security_schemes')) / 2,
+            _missing(m, 'security_schemes_described', 'security_schemes'), 'security schemes without a description')
+
+
+@criterion('auth', 'Authentication coverage', 3, 'Apply security requirements and document 401 responses')
+def authentication_coverage(m):
+    fraction = (2 * m.ratio('operations_secured', 'operations', 0.0)
+                + m.ratio('secured_operations_with_401', 'operations_secured', 0.0)) / 3
+    return fraction, _missing(m, 'secured_operations_with_401', 'operations_secured'), \
+        'secured operations without a 401 response'
+
+
+@criterion('auth', 'OAuth scopes', 2, 'Describe every OAuth scope', scope='spec')
+def oauth_scopes(m):
+    if not m['oauth_schemes']:
+        # Not applicable: full credit when the API documents some other scheme
+        return (1.0 if m['security_schemes'] else 0.0), 0, 'OAuth scopes without a description'
+    return (m.ratio('oauth_scopes_described', 'oauth_scopes'), _missing(m, 'oauth_scopes_described', 'oauth_scopes'),
+            'OAuth scopes without a description')
+
+
+@criterion('auth', 'Auth flows', 1, 'Complete every security scheme (token URLs, header names, HTTP scheme)',
+           scope='spec')
+def auth_flows(m):
+    return (m.ratio('security_schemes_complete', 'security_schemes', 0.0),
+            _missing(m, 'security_schemes_complete', 'security_schemes'), 'incomplete security schemes')
+
+
+def score_metrics(metrics: SpecMetrics, detailed: bool = False) -> Dict[str, Any]:
+    """
+    Score collected metrics. The result has the keys save_report and
+    display_results read; `detailed` adds the per-criterion breakdown.
+    """
+    category_points = {key: 0.0 for key in CATEGORY_MAX}
+    criteria = []
+    issues = []
+    recommendations = []
+    if not metrics['operations']:
+        # Nothing an agent could call: no criterion applies
+        issues.append({'category': 'usability', 'criterion': None, 'count': 1, 'message': 'no operations to score'})
+    for item in CRITERIA:
+        if metrics['operations']:
+            fraction, offending, message = item.evaluate(metrics)
+        else:
+            fraction, offending, message = 0.0, 0, ''
+        fraction = min(max(fraction, 0.0), 1.0)
+        earned = fraction * item.points
+        category_points[item.category] += earned
+        criteria.append({'category': item.category, 'name': item.name, 'points': round(earned, 2),
+                         'max_points': item.points})
+        if offending > 0 and fraction < 1.0:
+            issues.append({'category': item.category, 'criterion': item.name, 'count': offending,
+                           'message': f"{offending} {message}"})
+        if item.points - earned >= RECOMMENDATION_MIN_LOSS:
+            recommendations.append({'category': item.category, 'criterion': item.name,
+                                    'points_lost': round(item.points - earned, 2),
+                                    'recommendation': item.recommendation})
+
+    category_scores = {key: round(points) for key, points in category_points.items()}
+    recommendations.sort(key=lambda item: -item['points_lost'])
+    results = {
+        'overall_score': sum(category_scores.values()),
+        'category_scores': category_scores,
+        'total_operations': metrics['operations'],
+        'issues_found': sum(issue['count'] for issue in issues),
+        'recommendations': len(recommendations),
+        'issues': issues,
+        'recommendation_details': recommendations,
+    }
+    if detailed:
+        results['criteria'] = criteria
+        results['metrics'] = dict(sorted(metrics.counts.items()))
+    return results
+
+
+def _evaluate_operations(features: OperationFeatures):
+    """(criterion, fraction per operation, offending per operation, message) for operation-scoped criteria."""
+    import numpy as np
+
+    metrics = features.operation_metrics()
+    for item in CRITERIA:
+        if item.scope == 'operation':
+            fraction, offending, message = item.evaluate(metrics)
+            fraction = np.clip(np.broadcast_to(fraction, (len(features),)), 0.0, 1.0)
+            yield item, fraction, np.broadcast_to(offending, (len(features),)), message
+
+
+def operation_scores(features: OperationFeatures):
+    """Score of every operation, 0-100, from the points of the operation-scoped criteria."""
+    import numpy as np
+
+    earned = np.zeros(len(features))
+    possible = 0
+    for item, fraction, _, _ in _evaluate_operations(features):
+        earned += fraction * item.points
+        possible += item.points
+    return earned * (100 / possible) if possible else earned
+
+
+def operation_issues(spec: Optional[Dict[str, Any]], thresholds: Optional[Dict[str, int]] = None,
+                     features: Optional[OperationFeatures] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Issues of every operation, one dict per (operation, criterion), produced
+    lazily in document order so reports can stream them. `spec` may be None
+    when `features` carries the operationIds (ScoreCache.operation_features).
+    """
+    import numpy as np
+
+    features = features or extract_features(spec, thresholds)
+    evaluated = list(_evaluate_operations(features))
+    if not evaluated:
+        return
+    failing = np.array([(offending > 0) & (fraction < 1.0) for _, fraction, offending, _ in evaluated])
+    for index in np.flatnonzero(failing.any(axis=0)):
+        path, method = features.keys[index]
+        operation_id = (features.operation_ids[index] if features.operation_ids is not None
+                        else _operation_id(spec, path, method))
+        for row in np.flatnonzero(failing[:, index]):
+            item, _, offending, message = evaluated[row]
+            count = int(offending[index])
+            yield {'path': path, 'method': method.upper(), 'operation_id': operation_id,
+                   'category': item.category, 'criterion': item.name, 'count': count,
+                   'message': f"{count} {message}"}
+
+
+def operation_percentiles(features: OperationFeatures) -> Dict[str, Dict[str, float]]:
+    """Distribution of operation scores and REPORTED_FEATURES over the operations: where the weak ones sit."""
+    return {
+        'score': features.percentiles(operation_scores(features)),
+        **{column: features.percentiles(column=column) for column in REPORTED_FEATURES},
+    }
+
+
+def _largest(values, indices, limit: int):
+    """The `limit` indices with the largest values, earlier indices first on ties, without sorting them all."""
+    import numpy as np
+
+    if len(indices) > limit:
+        selected = values[indices]
+        cutoff = np.partition(selected, len(indices) - limit)[len(indices) - limit]
+        above = indices[selected > cutoff]
+        indices = np.concatenate([above, indices[selected == cutoff][:limit - len(above)]])
+        indices.sort()
+    return indices[np.argsort(-values[indices], kind='stable')]
+
+
+def explain_criteria(features: OperationFeatures, metrics: Optional[SpecMetrics] = None,
+                     limit: int = EXPLAIN_OPERATIONS) -> List[Dict[str, Any]]:
+    """
+    One entry per criterion: points earned and lost, the seconds it took to
+    evaluate, and for operation-scoped criteria how many operations lost
+    points and the `limit` that lost the most (document order on ties).
+    """
+    import numpy as np
+
+    metrics = metrics or features.metrics()
+    operation_metrics = features.operation_metrics()
+    has_operations = bool(metrics['operations'])
+    rules = []
+    for item in CRITERIA:
+        start = time.perf_counter()
+        fraction = min(max(item.evaluate(metrics)[0], 0.0), 1.0) if has_operations else 0.0
+        responsible, top = 0, []
+        if item.scope == 'operation' and has_operations:
+            fractions, offending, _ = item.evaluate(operation_metrics)
+            lost = (1.0 - np.clip(np.broadcast_to(fractions, (len(features),)), 0.0, 1.0)) * item.points
+            lost = np.where(np.broadcast_to(offending, (len(features),)) > 0, lost, 0.0)
+            failing = np.flatnonzero(lost > 0)
+            responsible = len(failing)
+            for index in _largest(lost, failing, limit):
+                path, method = features.keys[index]
+                top.append({'method': method.upper(), 'path': path, 'points_lost': round(float(lost[index]), 2)})
+        rules.append({'category': item.category, 'name': item.name, 'scope': item.scope,
+                      'points': round(fraction * item.points, 2), 'max_points': item.points,
+                      'points_lost': round(item.points - fraction * item.points, 2),
+                      'seconds': time.perf_counter() - start, 'operations': responsible, 'top_operations': top})
+    return rules
+
+
+def _operation_id(spec: Dict[str, Any], path: str, method: str) -> str:
+    path_item = spec['paths'][path]
+    if '$ref' in path_item:
+        return ''
+    operation = path_item.get(method)
+    return str(operation.get('operationId') or '') if isinstance(operation, dict) else ''
+
+
+class QualityAnalyzer:
+    """Scores a parsed spec across the five categories from one metrics pass."""
+
+    def __init__(self, thresholds: Optional[Dict[str, int]] = None):
+        self.thresholds = thresholds
+
+    def analyze(self, spec: Dict[str, Any], detailed: bool = False, explain: bool = False) -> Dict[str, Any]:
+        """
+        Score a parsed spec. `detailed` adds the per-criterion breakdown and
+        operation percentiles; `explain` adds 'explain' with the time spent
+        collecting and scoring and the explain_criteria() rules.
+        """
+        start = time.perf_counter()
+        features = extract_features(spec, self.thresholds)
+        collected = time.perf_counter()
+        metrics = features.metrics()
+        results = score_metrics(metrics, detailed)
+        if detailed:
+            results['operation_percentiles'] = operation_percentiles(features)
+        if explain:
+            scored = time.perf_counter()
+            results['explain'] = {
+                'timings': {'collect': collected - start, 'score': scored - collected},
+                'rules': explain_criteria(features, metrics),
+            }
+        return results
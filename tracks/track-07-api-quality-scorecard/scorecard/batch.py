@@ -0,0 +1,224 @@
+"""
+Batch scoring of a whole API catalog on a shared worker pool.
+
+Workers are started once and keep their imports (yaml, the scoring engine)
+warm for every spec they score. Each worker returns one flat leaderboard
+row rather than the full results, so the parent holds a few hundred bytes
+per spec however large the catalog. Rows are handed back as each spec
+finishes, so progress and failures are reported while the rest of the
+batch is still running.
+"""
+
+import hashlib
+import os
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .analyzer import CATEGORIES, QualityAnalyzer
+from .parser import OpenAPIParser
+
+SPEC_EXTENSIONS = ('.yaml', '.yml', '.json')
+
+# Columns of a leaderboard row, in report order
+ROW_FIELDS = ('spec', 'title', 'version', 'status', 'overall_score') + tuple(key for key, _, _ in CATEGORIES) + (
+    'total_operations', 'issues_found', 'seconds', 'error')
+
+# Keys a leaderboard can be sorted by, and whether higher values rank first
+SORT_KEYS = {'overall_score': True, 'total_operations': True, 'issues_found': False, 'spec': False,
+             'title': False, 'seconds': True, **{key: True for key, _, _ in CATEGORIES}}
+
+_worker: Dict[str, Any] = {}
+
+
+def is_url(path: str) -> bool:
+    return path.startswith(('http://', 'https://'))
+
+
+def expand_catalog(target: str) -> List[str]:
+    """Spec files under a directory (recursively), in a stable order."""
+    specs = []
+    for root, dirs, files in os.walk(target):
+        dirs.sort()
+        specs.extend(os.path.join(root, name) for name in sorted(files) if name.lower().endswith(SPEC_EXTENSIONS))
+    return specs
+
+
+def read_manifest(manifest: str) -> List[str]:
+    """
+    Specs listed in a manifest: one path or URL per line, '#' comments.
+    Relative paths are resolved against the manifest's directory.
+    """
+    base = os.path.dirname(os.path.abspath(manifest))
+    specs = []
+    with open(manifest, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            specs.append(line if is_url(line) or os.path.isabs(line) else os.path.join(base, line))
+    return list(dict.fromkeys(specs))
+
+
+def _init_worker(thresholds: Optional[Dict[str, int]], cache_dir: Optional[str] = None,
+                 report_dir: Optional[str] = None, report_format: str = 'html', detailed: bool = False):
+    _worker['parser'] = OpenAPIParser()
+    _worker['analyzer'] = QualityAnalyzer(thresholds)
+    _worker['thresholds'] = thresholds
+    _worker['cache_dir'] = cache_dir
+    _worker['report'] = (report_dir, report_format, detailed) if report_dir else None
+
+
+def report_path(report_dir: str, spec_path: str, format: str) -> str:
+    """Report file of a spec in a batch report directory: its name plus a hash of its full path."""
+    stem = os.path.splitext(os.path.basename(spec_path.rstrip('/')))[0] or 'spec'
+    digest = hashlib.blake2b(spec_path.encode('utf-8'), digest_size=4).hexdigest()
+    return os.path.join(report_dir, f"{stem}-{digest}.{'md' if format == 'markdown' else format}")
+
+
+def _write_spec_report(spec_path: str, spec: Optional[Dict[str, Any]], results: Dict[str, Any],
+                       cache: Optional[Any] = None):
+    # The report templates are compiled once per worker and reused for every spec
+    from .analyzer import operation_issues
+    from .report import write_report
+
+    report_dir, format, detailed = _worker['report']
+    rows = None
+    if detailed:
+        if cache is not None:
+            # Cached specs are not parsed again: the cache keeps the operations' features
+            rows = operation_issues(None, features=cache.operation_features(_worker['thresholds']))
+        else:
+            rows = operation_issues(spec, _worker['thresholds'])
+    write_report(results, report_path(report_dir, spec_path, format), format, rows)
+
+
+def score_spec(spec_path: str) -> Dict[str, Any]:
+    """Leaderboard row for one spec; failures become rows with status 'error'."""
+    if not _worker:
+        _init_worker(None)
+    started = time.perf_counter()
+    row: Dict[str, Any] = {'spec': spec_path}
+    spec = cache = None
+    detailed = bool(_worker.get('report')) and _worker['report'][2]
+    try:
+        if _worker['cache_dir']:
+            from .cache import ScoreCache, analyze_cached
+
+            cache = ScoreCache.for_spec(_worker['cache_dir'], spec_path)
+            info, results = analyze_cached(spec_path, cache, _worker['thresholds'], detailed, _worker['parser'])
+        else:
+            spec = _worker['parser'].load(spec_path)
+            info, results = spec.get('info') or {}, _worker['analyzer'].analyze(spec, detailed)
+        if _worker['report']:
+            _write_spec_report(spec_path, spec, results, cache)
+    except Exception as e:  # one bad spec must not stop the catalog
+        row.update(status='error', error=f"{type(e).__name__}: {e}")
+    else:
+        row.update(title=str(info.get('title', '')), version=str(info.get('version', '')), status='scored',
+                   overall_score=results['overall_score'], **results['category_scores'],
+                   total_operations=results['total_operations'], issues_found=results['issues_found'])
+    row['seconds'] = round(time.perf_counter() - started, 4)
+    return row
+
+
+def run_batch(spec_paths: List[str], jobs: int, thresholds: Optional[Dict[str, int]] = None,
+              on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+              cache_dir: Optional[str] = None, report_dir: Optional[str] = None, report_format: str = 'html',
+              detailed: bool = False) -> List[Dict[str, Any]]:
+    """
+    Score every spec on up to `jobs` processes; returns the rows in completion order.
+
+    on_result is called in the parent as each spec completes. With a
+    cache_dir, specs are scored incrementally (see scorecard.cache). With a
+    report_dir, every scored spec also gets a report there (see report_path),
+    listing per-operation issues when detailed.
+    """
+    worker_args = (thresholds, cache_dir, report_dir, report_format, detailed)
+    if report_dir:
+        os.makedirs(report_dir, exist_ok=True)
+    rows = []
+    jobs = min(jobs, len(spec_paths))
+    if jobs <= 1:
+        _init_worker(*worker_args)
+        for path in spec_paths:
+            row = score_spec(path)
+            if on_result:
+                on_result(row)
+            rows.append(row)
+        return rows
+
+    import multiprocessing
+
+    # Several specs per task keep IPC overhead low for catalogs of small specs
+    chunksize = max(1, min(16, len(spec_paths) // (jobs * 8)))
+    method = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else None
+    with multiprocessing.get_context(method).Pool(jobs, initializer=_init_worker,
+                                                 initargs=worker_args) as pool:
+        for row in pool.imap_unordered(score_spec, spec_paths, chunksize):
+            if on_result:
+                on_result(row)
+            rows.append(row)
+    return rows
+
+
+def sort_rows(rows: List[Dict[str, Any]], key: str = 'overall_score',
+              descending: Optional[bool] = None) -> List[Dict[str, Any]]:
+    """
+    Rank rows by `key`; errored specs always come last. Ties are broken by
+    spec path so leaderboards are reproducible. Scored rows also get the
+    percentile rank of their overall score within the catalog.
+    """
+    from .features import percentile_ranks
+
+    if descending is None:
+        descending = SORT_KEYS[key]
+    scored = [row for row in rows if row['status'] == 'scored']
+    scored.sort(key=lambda row: row['spec'])
+    scored.sort(key=lambda row: row[key], reverse=descending)
+    errored = sorted((row for row in rows if row['status'] != 'scored'), key=lambda row: row['spec'])
+    percentiles = percentile_ranks([row['overall_score'] for row in scored])
+    for rank, (row, percentile) in enumerate(zip(scored, percentiles), 1):
+        row['rank'] = rank
+        row['percentile'] = percentile
+    return scored + errored
+
+
+def summarize_rows(rows: List[Dict[str, Any]], threshold: int) -> Dict[str, Any]:
+    """Aggregate figures the exit-code rules are evaluated on."""
+    scores = [row['overall_score'] for row in rows if row['status'] == 'scored']
+    count = len(scores)
+    below = sum(1 for score in scores if score < threshold)
+    return {
+        'total_specs': len(rows),
+        'scored': count,
+        'errored': len(rows) - count,
+        'threshold': threshold,
+        'below_threshold': below,
+        'below_threshold_share': round(below / count, 4) if count else 0.0,
+        'average_score': round(sum(scores) / count, 2) if count else 0.0,
+        'median_score': statistics.median(scores) if count else 0.0,
+        'total_operations': sum(row.get('total_operations', 0) for row in rows if row['status'] == 'scored'),
+    }
+
+
+def aggregate_failures(summary: Dict[str, Any], min_average: Optional[float] = None,
+                       max_below_share: Optional[float] = None, max_errors: Optional[int] = None) -> List[str]:
+    """
+    Aggregate threshold rules the batch broke (empty when it passes).
+
+    Individual specs scoring below the threshold do not fail a batch on
+    their own; only the rules given here do.
+    """
+    failures = []
+    if min_average is not None and summary['average_score'] < min_average:
+        failures.append(f"average score {summary['average_score']} is below {min_average}")
+    if max_below_share is not None and summary['below_threshold_share'] > max_below_share:
+        failures.append(f"{summary['below_threshold']} of {summary['scored']} specs "
+                        f"({summary['below_threshold_share']:.0%}) score below {summary['threshold']}, "
+                        f"more than the allowed {max_below_share:.0%}")
+    if max_errors is not None and summary['errored'] > max_errors:
+        failures.append(f"{summary['errored']} specs could not be scored (allowed: {max_errors})")
+    if not summary['scored']:
+        failures.append("no spec could be scored")
+    return failures
@@ -0,0 +1,298 @@
+"""
+Incremental scoring cache.
+
+The metrics of a spec are the sum of the counters of its units (operations,
+component schemas and the document-level rest, see spec_units). The cache
+keeps every unit's counters with a hash of its content and of everything
+it $refs, transitively, plus their total. On the next run only changed
+units are collected again, and the total is corrected by their difference
+before the criteria (which only read the total) rescore it. A spec whose
+source text is unchanged is not even parsed: its total is rescored
+directly. Operations also keep their feature row and operationId, so
+detailed results (operation percentiles) and per-operation issues come
+from the cache too.
+
+Entries are keyed by FRAMEWORK_VERSION, the collector's code and module
+source and the quality thresholds, so changing any of them starts a cold
+cache.
+"""
+
+import hashlib
+import json
+import os
+import re
+import types
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import metrics as _metrics_module
+from .analyzer import _operation_id, operation_percentiles, score_metrics
+from .features import OperationFeatures
+from .metrics import (FRAMEWORK_VERSION, OPERATION_COUNTERS, SpecMetrics, _Collector, iter_unit_features,
+                      spec_units)
+from .parser import OpenAPIParser
+
+# Bump when the cache layout changes
+CACHE_FORMAT_VERSION = 2
+
+# Local $refs in the repr() of a unit
+_REF_PATTERN = re.compile(r"""['"]\$ref['"]: ['"](#[^'"]*)['"]""")
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _canonical(value: Any) -> str:
+    # repr() is a third faster than json.dumps on parsed specs. Key order is
+    # kept, so reordering a spec's keys only costs a cache miss
+    return repr(value)
+
+
+def _hash_code(code: types.CodeType, digest: Any):
+    """Feed bytecode, names and constants (including nested functions) into digest."""
+    digest.update(code.co_code)
+    digest.update(' '.join(code.co_names).encode('utf-8'))
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _hash_code(const, digest)
+        elif isinstance(const, frozenset):
+            # Set iteration order depends on the string hash seed
+            digest.update(repr(sorted(map(repr, const))).encode('utf-8'))
+        else:
+            digest.update(repr(const).encode('utf-8'))
+
+
+@lru_cache(maxsize=None)
+def _module_source_digest() -> str:
+    """Hash of metrics.py, which holds the collector and the constants and helpers it reads."""
+    try:
+        with open(_metrics_module.__file__, 'rb') as f:
+            return hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+    except (OSError, TypeError):
+        return ''
+
+
+def framework_key(thresholds: Dict[str, int]) -> str:
+    """Identify what cached counters depend on: framework version, collector code and source, thresholds."""
+    parts = [str(CACHE_FORMAT_VERSION), str(FRAMEWORK_VERSION), json.dumps(thresholds, sort_keys=True),
+             _module_source_digest()]
+    for name, member in sorted(vars(_Collector).items()):
+        code = getattr(member, '__code__', None)
+        if code is not None:
+            digest = hashlib.blake2b(digest_size=8)
+            _hash_code(code, digest)
+            parts.append(f'{name}:{digest.hexdigest()}')
+    return _digest('\n'.join(parts))
+
+
+def _unit_id(unit: Tuple[str, ...]) -> str:
+    # Unambiguous: the kind comes first and an operation's method last
+    return ' '.join(unit)
+
+
+def _unit_value(spec: Dict[str, Any], unit: Tuple[str, ...]) -> Any:
+    """Everything a unit's counters are computed from, besides what it $refs."""
+    if unit[0] == 'operation':
+        path_item = spec['paths'][unit[1]]
+        if '$ref' in path_item:
+            return [path_item, unit[2]]
+        operation = path_item[unit[2]]
+        # Operations without their own security requirement inherit the global one
+        security = None if 'security' in operation else spec.get('security')
+        return [operation, path_item.get('parameters'), security]
+    if unit[0] == 'schema':
+        return spec['components']['schemas'][unit[1]]
+    components = spec.get('components') or {}
+    return [spec.get('tags'), components.get('securitySchemes') if isinstance(components, dict) else None]
+
+
+class _Fingerprints:
+    """Content hashes of units and of the transitive closure of the $refs they contain."""
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.spec = spec
+        self._targets: Dict[str, Tuple[str, List[str]]] = {}
+        self._closures: Dict[Tuple[str, ...], str] = {}
+
+    def unit(self, unit: Tuple[str, ...]) -> Tuple[str, str]:
+        """(hash of the unit's own content, hash of everything it $refs)."""
+        canonical = _canonical(_unit_value(self.spec, unit))
+        refs = tuple(sorted(set(_REF_PATTERN.findall(canonical)))) if '$ref' in canonical else ()
+        return _digest(canonical), self._closure(refs)
+
+    def _target(self, ref: str) -> Tuple[str, List[str]]:
+        if ref not in self._targets:
+            target: Any = self.spec
+            for part in ref[2:].split('/') if ref.startswith('#/') else ():
+                part = part.replace('~1', '/').replace('~0', '~')
+                target = target.get(part) if isinstance(target, dict) else None
+            canonical = _canonical(target)
+            self._targets[ref] = (_digest(canonical), sorted(set(_REF_PATTERN.findall(canonical))))
+        return self._targets[ref]
+
+    def _closure(self, refs: Tuple[str, ...]) -> str:
+        if not refs:
+            return ''
+        if refs not in self._closures:
+            hashes = {}
+            pending = list(refs)
+            while pending:
+                ref = pending.pop()
+                if ref in hashes:
+                    continue
+                hashes[ref], nested = self._target(ref)
+                pending.extend(nested)
+            self._closures[refs] = _digest(repr(sorted(hashes.items())))
+        return self._closures[refs]
+
+
+class ScoreCache:
+    """
+    Per-spec unit counters persisted as a JSON file, or kept in memory only
+    without a path. units maps unit ids, in document order, to (hash, refs
+    hash, counters, operation), where operation is [operationId, feature row]
+    for operation units and None otherwise. Most units of a spec share their
+    counters with many others, so the file stores every distinct counters
+    dict once and units refer to it by index.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.key = None
+        self.source = None
+        self.info: Dict[str, str] = {}
+        self.totals: Dict[str, int] = {}
+        self.units: Dict[str, Tuple[str, str, Dict[str, int], Optional[List[Any]]]] = {}
+        self.reused = 0
+        self.collected = 0
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.key, self.source, self.info = data['key'], data['source'], data['info']
+                self.totals = data['totals']
+                table = data['counts']
+                self.units = {uid: (digest, refs, table[index], operation)
+                              for uid, (digest, refs, index, operation) in data['units'].items()}
+            except (OSError, ValueError, KeyError, TypeError):
+                # A corrupt cache is just a cold cache
+                self.key, self.source, self.info, self.totals, self.units = None, None, {}, {}, {}
+
+    @classmethod
+    def for_spec(cls, cache_dir: str, spec_path: str) -> 'ScoreCache':
+        """Cache file for a spec inside a cache directory."""
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        source = spec_path if '://' in spec_path else os.path.abspath(spec_path)
+        name = hashlib.blake2b(source.encode('utf-8'), digest_size=12).hexdigest()
+        return cls(os.path.join(cache_dir, f'{name}.json'))
+
+    def save(self):
+        if not self.path:
+            return
+        tmp_path = f'{self.path}.tmp'
+        table: List[Dict[str, int]] = []
+        indexes: Dict[Tuple[Tuple[str, int], ...], int] = {}
+        units = {}
+        for uid, (digest, refs, counts, operation) in self.units.items():
+            shape = tuple(counts.items())
+            if shape not in indexes:
+                indexes[shape] = len(table)
+                table.append(counts)
+            units[uid] = (digest, refs, indexes[shape], operation)
+        payload = json.dumps({'key': self.key, 'source': self.source, 'info': self.info, 'totals': self.totals,
+                              'counts': table, 'units': units}, separators=(',', ':'))
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        os.replace(tmp_path, self.path)
+
+    def operation_features(self, thresholds: Optional[Dict[str, int]] = None) -> OperationFeatures:
+        """The spec's per-operation features rebuilt from the cached rows, without the spec."""
+        keys, rows, operation_ids = [], [], []
+        counts = Counter()
+        for uid, (_, _, unit_counts, operation) in self.units.items():
+            if operation is None:
+                counts.update(unit_counts)
+                continue
+            # Naming styles and status codes stay in the counters, the rest is summed from the rows
+            counts.update({key: count for key, count in unit_counts.items() if key not in OPERATION_COUNTERS})
+            path, method = uid[len('operation '):].rsplit(' ', 1)
+            keys.append((path, method))
+            operation_ids.append(operation[0])
+            rows.append(tuple(operation[1]))
+        return OperationFeatures(keys, rows, counts, SpecMetrics(thresholds).thresholds, operation_ids)
+
+
+def collect_incremental(spec: Dict[str, Any], cache: ScoreCache,
+                        thresholds: Optional[Dict[str, int]] = None) -> SpecMetrics:
+    """
+    Metrics of `spec`, collecting only units that changed since the cache
+    was written; updates the cache (without saving it).
+    """
+    metrics = SpecMetrics(thresholds)
+    key = framework_key(metrics.thresholds)
+    if cache.key != key:
+        cache.key, cache.totals, cache.units = key, {}, {}
+
+    fingerprints = _Fingerprints(spec)
+    units = spec_units(spec)
+    current = {}
+    dirty = []
+    for unit in units:
+        uid = _unit_id(unit)
+        digest, refs = fingerprints.unit(unit)
+        current[uid] = (digest, refs)
+        cached = cache.units.get(uid)
+        if cached is None or cached[0] != digest or cached[1] != refs:
+            dirty.append(unit)
+
+    totals = Counter(cache.totals)
+    for uid in set(cache.units) - set(current):
+        totals.subtract(cache.units.pop(uid)[2])
+    for unit, (counts, row) in zip(dirty, iter_unit_features(spec, dirty, metrics.thresholds)):
+        uid = _unit_id(unit)
+        if uid in cache.units:
+            totals.subtract(cache.units[uid][2])
+        totals.update(counts)
+        digest, refs = current[uid]
+        operation = None if row is None else [_operation_id(spec, unit[1], unit[2]), list(row)]
+        cache.units[uid] = (digest, refs, dict(sorted(counts.items())), operation)
+
+    # Document order, so cached operations come out as extract_features() lists them
+    cache.units = {uid: cache.units[uid] for uid in current}
+    cache.totals = dict(+totals)
+    cache.collected = len(dirty)
+    cache.reused = len(units) - len(dirty)
+    metrics.counts = Counter(cache.totals)
+    return metrics
+
+
+def analyze_cached(spec_path: str, cache: ScoreCache, thresholds: Optional[Dict[str, int]] = None,
+                   detailed: bool = False,
+                   parser: Optional[OpenAPIParser] = None) -> Tuple[Dict[str, str], Dict[str, Any]]:
+    """
+    Score a spec file or URL through the cache: ({'title', 'version'}, results).
+
+    Raises what OpenAPIParser.load raises. The cache is saved when it changed.
+    """
+    parser = parser or OpenAPIParser()
+    text, is_json = parser.read(spec_path)
+    source = _digest(text)
+    metrics = SpecMetrics(thresholds)
+    if cache.source == source and cache.key == framework_key(metrics.thresholds):
+        metrics.counts = Counter(cache.totals)
+        cache.collected, cache.reused = 0, len(cache.units)
+    else:
+        spec = parser.parse_source(spec_path, text, is_json)
+        metrics = collect_incremental(spec, cache, thresholds)
+        info = spec.get('info') or {}
+        cache.source = source
+        cache.info = {'title': str(info.get('title', '')), 'version': str(info.get('version', ''))}
+        cache.save()
+
+    results = score_metrics(metrics, detailed)
+    if detailed:
+        results['operation_percentiles'] = operation_percentiles(cache.operation_features(metrics.thresholds))
+    return cache.info, results
@@ -0,0 +1,115 @@
+"""
+Columnar per-operation features.
+
+The collector walks a spec once and hands back one row of
+OPERATION_FEATURES per operation. Here the rows become NumPy columns, and
+everything downstream works on whole columns:
+
+- threshold flags (described, well described, simple) are derived from the
+  raw description length, parameter count and schema depth;
+- spec counters are column sums;
+- operation-scoped criteria are evaluated once over all operations
+  (OperationMetrics), giving per-operation points, scores and issue counts;
+- percentiles of features and scores, and the percentile ranks of scores
+  across a catalog.
+
+NumPy is imported by the functions that need it, keeping start-up light.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .metrics import OPERATION_COUNTERS, OPERATION_FEATURES, SpecMetrics, _Collector, derived_features
+
+# Percentiles reported for per-operation features and scores
+PERCENTILES = (10, 25, 50, 75, 90)
+
+# Features whose distribution is reported in detailed results
+REPORTED_FEATURES = ('description_length', 'parameters', 'schema_depth', 'error_responses')
+
+
+class OperationFeatures:
+    """Per-operation feature columns of one spec, plus its document-level counters."""
+
+    def __init__(self, keys: List[Tuple[str, str]], rows: List[Tuple[int, ...]], counts, thresholds: Dict[str, int],
+                 operation_ids: Optional[List[str]] = None):
+        import numpy as np
+
+        self.keys = keys
+        # Known operationIds of the operations, when the spec itself is not at hand (cached runs)
+        self.operation_ids = operation_ids
+        self.thresholds = thresholds
+        self.counts = counts
+        # Transposed so every column is contiguous
+        matrix = np.array(rows, dtype=np.int64).reshape(len(rows), len(OPERATION_FEATURES)).T.copy()
+        self.columns: Dict[str, Any] = dict(zip(OPERATION_FEATURES, matrix))
+        for key, flags in derived_features(self.columns, thresholds).items():
+            self.columns[key] = flags.astype(np.int64)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def metrics(self) -> SpecMetrics:
+        """Spec metrics: the document-level counters plus the column sums."""
+        metrics = SpecMetrics(self.thresholds)
+        metrics.counts = self.counts.copy()
+        for key in OPERATION_COUNTERS:
+            total = int(self.columns[key].sum())
+            if total:
+                # Component schemas already put their object schemas in the counters
+                metrics.counts[key] += total
+        return metrics
+
+    def operation_metrics(self) -> 'OperationMetrics':
+        return OperationMetrics(self)
+
+    def percentiles(self, values=None, column: Optional[str] = None) -> Dict[str, float]:
+        """PERCENTILES of a column (or of given per-operation values), e.g. {'p50': 42.0}."""
+        import numpy as np
+
+        values = self.columns[column] if column else values
+        if not len(values):
+            return {f'p{q}': 0.0 for q in PERCENTILES}
+        return {f'p{q}': round(float(v), 2) for q, v in zip(PERCENTILES, np.percentile(values, PERCENTILES))}
+
+
+class OperationMetrics(SpecMetrics):
+    """
+    SpecMetrics whose counters are per-operation columns, so a criterion
+    evaluated on it returns arrays: one fraction and offending count per
+    operation. Only operation-scoped criteria make sense here.
+    """
+
+    def __init__(self, features: OperationFeatures):
+        super().__init__(features.thresholds)
+        self.features = features
+
+    def __getitem__(self, key: str):
+        import numpy as np
+
+        column = self.features.columns.get(key)
+        return column if column is not None else np.zeros(len(self.features), dtype=np.int64)
+
+    def ratio(self, part: str, whole: str, empty: float = 1.0):
+        import numpy as np
+
+        total = self[whole]
+        return np.divide(self[part], total, out=np.full(len(total), empty), where=total > 0)
+
+
+def extract_features(spec: Dict[str, Any], thresholds: Optional[Dict[str, int]] = None) -> OperationFeatures:
+    """One traversal of `spec` into per-operation columns and document-level counters."""
+    collector = _Collector(spec, SpecMetrics(thresholds))
+    keys, rows = collector.collect()
+    return OperationFeatures(keys, rows, collector.counts, collector.thresholds)
+
+
+def percentile_ranks(scores: Sequence[float]) -> List[float]:
+    """Percentile rank of every score: the share of scores at or below it, 0-100."""
+    import numpy as np
+
+    values = np.asarray(scores, dtype=float)
+    if not len(values):
+        return []
+    ranks = np.searchsorted(np.sort(values), values, side='right') / len(values) * 100
+    return [round(float(rank), 1) for rank in ranks]
+
@@ -0,0 +1,188 @@
+"""
+Score history: a local SQLite time series of scorecard runs.
+
+Every run appends one row per spec with the overall and category scores,
+operation and issue counts, keyed by API (info.title) and spec version
+(info.version). API names are stored once in their own table and scores as
+integers, so a row takes a few dozen bytes. Rows are queued and written in
+batches inside one transaction, so recording a catalog run costs a handful
+of commits rather than one per spec.
+
+Trends and regressions are read back from the store; old versions are never
+scored again.
+"""
+
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .analyzer import CATEGORIES
+
+_CATEGORY_KEYS = tuple(key for key, _, _ in CATEGORIES)
+_SCORE_COLUMNS = ('overall_score',) + _CATEGORY_KEYS + ('total_operations', 'issues_found')
+
+TREND_FORMATS = ('json', 'csv', 'markdown', 'html')
+
+
+class TrendStore:
+    """Append-only SQLite store of scorecard runs, indexed by API and version."""
+
+    BATCH_SIZE = 500
+
+    def __init__(self, path: str):
+        import sqlite3  # only runs with --history need it, not --help/--version
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        # Losing the last runs on power failure is acceptable; an fsync per batch is not
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        score_columns = ',\n'.join(f'                {column} INTEGER NOT NULL' for column in _SCORE_COLUMNS)
+        self.conn.executescript(f"""
+            CREATE TABLE IF NOT EXISTS apis (
+                api_id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE
+            );
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id INTEGER PRIMARY KEY,
+                api_id INTEGER NOT NULL REFERENCES apis (api_id),
+                version TEXT NOT NULL,
+                recorded_at INTEGER NOT NULL,
+{score_columns}
+            );
+            CREATE INDEX IF NOT EXISTS idx_runs_api_version ON runs (api_id, version);
+        """)
+        self._api_ids: Dict[str, int] = dict(self.conn.execute("SELECT name, api_id FROM apis"))
+        self._pending: List[Tuple[Any, ...]] = []
+        self.recorded = 0
+
+    def _api_id(self, name: str) -> int:
+        if name not in self._api_ids:
+            cursor = self.conn.execute("INSERT INTO apis (name) VALUES (?)", (name,))
+            self._api_ids[name] = cursor.lastrowid
+        return self._api_ids[name]
+
+    def record(self, api: str, version: str, scores: Dict[str, Any], recorded_at: Optional[int] = None):
+        """
+        Queue one run of an API version, flushing in batches. `scores` has
+        overall_score, total_operations, issues_found and either the
+        category keys (a batch row) or category_scores (analyze() results).
+        """
+        categories = scores.get('category_scores', scores)
+        self._pending.append((api, version, int(time.time()) if recorded_at is None else recorded_at,
+                              scores['overall_score'], *(categories[key] for key in _CATEGORY_KEYS),
+                              scores['total_operations'], scores['issues_found']))
+        if len(self._pending) >= self.BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        """Write queued runs in a single transaction."""
+        if not self._pending:
+            return
+        placeholders = ', '.join('?' * (3 + len(_SCORE_COLUMNS)))
+        with self.conn:
+            rows = [(self._api_id(api), *rest) for api, *rest in self._pending]
+            self.conn.executemany(
+                f"INSERT INTO runs (api_id, version, recorded_at, {', '.join(_SCORE_COLUMNS)}) "
+                f"VALUES ({placeholders})", rows)
+        self.recorded += len(self._pending)
+        self._pending = []
+
+    def apis(self) -> List[str]:
+        return [name for name, in self.conn.execute("SELECT name FROM apis ORDER BY name")]
+
+    def _latest_per_version(self, where: str, args: Tuple[Any, ...]) -> List[Dict[str, Any]]:
+        # The latest run of every version, versions in the order they were first recorded
+        rows = self.conn.execute(f"""
+            WITH versions AS (
+                SELECT api_id, version, MIN(run_id) AS first_run, MAX(run_id) AS last_run
+                FROM runs {where} GROUP BY api_id, version
+            )
+            SELECT apis.name, runs.version, runs.recorded_at, {', '.join('runs.' + c for c in _SCORE_COLUMNS)}
+            FROM versions
+            JOIN runs ON runs.run_id = versions.last_run
+            JOIN apis ON apis.api_id = versions.api_id
+            ORDER BY apis.name, versions.first_run
+        """, args)
+        columns = ('api', 'version', 'recorded_at') + _SCORE_COLUMNS
+        return [dict(zip(columns, row)) for row in rows]
+
+    def trend(self, api: str) -> List[Dict[str, Any]]:
+        """
+        One row per version of `api` (its latest run), oldest version first,
+        with the change of every score since the previous version.
+        """
+        self.flush()
+        if api not in self._api_ids:
+            raise KeyError(api)
+        return _with_deltas(self._latest_per_version("WHERE api_id = ?", (self._api_ids[api],)))
+
+    def regressions(self, min_drop: int = 1) -> List[Dict[str, Any]]:
+        """Latest version of every API whose overall score dropped by min_drop or more, worst first."""
+        self.flush()
+        latest = {}
+        for row in _with_deltas(self._latest_per_version("", ())):
+            latest[row['api']] = row
+        drops = [row for row in latest.values()
+                 if row['delta']['overall_score'] is not None and row['delta']['overall_score'] <= -min_drop]
+        return sorted(drops, key=lambda row: (row['delta']['overall_score'], row['api']))
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+
+def _with_deltas(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Add 'delta' (score changes since the previous row of the same API) to rows ordered by API."""
+    previous = None
+    for row in rows:
+        same_api = previous is not None and previous['api'] == row['api']
+        row['delta'] = {column: (row[column] - previous[column] if same_api else None) for column in _SCORE_COLUMNS}
+        previous = row
+    return rows
+
+
+def _signed(delta: Optional[int]) -> str:
+    return '' if delta is None else f'{delta:+d}'
+
+
+def trend_lines(rows: List[Dict[str, Any]], format: str) -> Iterator[str]:
+    """Lines of a trend or regression table in `format` (see TREND_FORMATS)."""
+    if format == 'json':
+        import json
+
+        yield json.dumps(rows, indent=2)
+        return
+    headers = ['API', 'Version', 'Recorded', 'Score', 'Change'] + [name for _, name, _ in CATEGORIES] + \
+        ['Operations', 'Issues']
+    table = []
+    for row in rows:
+        recorded = time.strftime('%Y-%m-%d %H:%M', time.gmtime(row['recorded_at']))
+        table.append([row['api'], row['version'], recorded, row['overall_score'], _signed(row['delta']['overall_score'])]
+                     + [f"{row[key]} ({_signed(row['delta'][key])})" if row['delta'][key] else str(row[key])
+                        for key in _CATEGORY_KEYS]
+                     + [row['total_operations'], f"{row['issues_found']} ({_signed(row['delta']['issues_found'])})"
+                        if row['delta']['issues_found'] else row['issues_found']])
+    if format == 'csv':
+        import csv
+        import io
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerow(['api', 'version', 'recorded_at'] + list(_SCORE_COLUMNS)
+                        + [f'{column}_delta' for column in _SCORE_COLUMNS])
+        for row in rows:
+            writer.writerow([row['api'], row['version'], row['recorded_at']] + [row[c] for c in _SCORE_COLUMNS]
+                            + [row['delta'][c] for c in _SCORE_COLUMNS])
+        yield buffer.getvalue().rstrip('\n')
+    elif format == 'markdown':
+        yield '| ' + ' | '.join(headers) + ' |'
+        yield '|' + '---|' * len(headers)
+        for cells in table:
+            yield '| ' + ' | '.join(str(cell).replace('|', '\\|') for cell in cells) + ' |'
+    else:
+        from html import escape
+
+        yield '<table>'
+        yield '    <tr>' + ''.join(f'<th>{escape(header)}</th>' for header in headers) + '</tr>'
+        for cells in table:
+            yield '    <tr>' + ''.join(f'<td>{escape(str(cell))}</td>' for cell in cells) + '</tr>'
+        yield '</table>'
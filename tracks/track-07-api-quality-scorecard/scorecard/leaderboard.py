@@ -0,0 +1,117 @@
+"""
+Leaderboard reports for batch runs, produced line by line.
+
+Every writer is a generator, so a catalog of thousands of specs is written
+in chunks as rows are formatted instead of being built up as one string.
+"""
+
+import csv
+import io
+import json
+from html import escape
+from typing import Any, Dict, Iterator, List
+
+from .analyzer import CATEGORIES
+from .batch import ROW_FIELDS
+
+LEADERBOARD_FORMATS = ('json', 'csv', 'markdown', 'html')
+
+# Lines written per chunk
+CHUNK_LINES = 1000
+
+_COLUMNS = ('rank', 'percentile') + ROW_FIELDS
+
+
+def leaderboard_lines(rows: List[Dict[str, Any]], summary: Dict[str, Any], format: str) -> Iterator[str]:
+    """Lines of a leaderboard in `format` (see LEADERBOARD_FORMATS); rows are already ranked."""
+    return {'json': _json_lines, 'csv': _csv_lines, 'markdown': _markdown_lines, 'html': _html_lines}[format](
+        rows, summary)
+
+
+def chunk_lines(lines: Iterator[str], size: int = CHUNK_LINES) -> Iterator[str]:
+    """Join lines into newline-terminated chunks of up to `size` lines."""
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= size:
+            yield '\n'.join(chunk) + '\n'
+            chunk = []
+    if chunk:
+        yield '\n'.join(chunk) + '\n'
+
+
+def _json_lines(rows, summary):
+    yield '{'
+    yield f'  "summary": {json.dumps(summary)},'
+    yield '  "leaderboard": ['
+    for i, row in enumerate(rows):
+        yield '    ' + json.dumps({key: row[key] for key in _COLUMNS if key in row}) + (',' if i < len(rows) - 1 else '')
+    yield '  ]'
+    yield '}'
+
+
+def _csv_lines(rows, summary):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=_COLUMNS, extrasaction='ignore', lineterminator='')
+    writer.writeheader()
+    yield buffer.getvalue()
+    for row in rows:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow(row)
+        yield buffer.getvalue()
+
+
+def _markdown_cell(value: Any) -> str:
+    return '' if value is None else str(value).replace('|', '\\|').replace('\n', ' ')
+
+
+def _markdown_lines(rows, summary):
+    yield '# API Quality Leaderboard'
+    yield ''
+    yield (f"{summary['scored']} of {summary['total_specs']} specs scored · average {summary['average_score']} · "
+           f"median {summary['median_score']} · {summary['below_threshold']} below {summary['threshold']}")
+    yield ''
+    headers = ['Rank', 'API', 'Version', 'Score', 'Percentile'] + [name for _, name, _ in CATEGORIES] + \
+        ['Operations', 'Spec']
+    yield '| ' + ' | '.join(headers) + ' |'
+    yield '|' + '---|' * len(headers)
+    for row in rows:
+        if row['status'] != 'scored':
+            cells = ['-', '', '', 'error', ''] + [''] * len(CATEGORIES) + ['', row['spec']]
+        else:
+            cells = [row['rank'], row['title'], row['version'], row['overall_score'], row['percentile']] + \
+                [row[key] for key, _, _ in CATEGORIES] + [row['total_operations'], row['spec']]
+        yield '| ' + ' | '.join(_markdown_cell(cell) for cell in cells) + ' |'
+
+
+def _html_lines(rows, summary):
+    yield '<!DOCTYPE html>'
+    yield '<html>'
+    yield '<head>'
+    yield '    <title>API Quality Leaderboard</title>'
+    yield '    <style>'
+    yield '        body { font-family: Arial, sans-serif; margin: 40px; }'
+    yield '        td, th { padding: 4px 12px; text-align: left; }'
+    yield '        .error { color: #d73527; }'
+    yield '    </style>'
+    yield '</head>'
+    yield '<body>'
+    yield '    <h1>API Quality Leaderboard</h1>'
+    yield (f"    <p>{summary['scored']} of {summary['total_specs']} specs scored &middot; "
+           f"average {summary['average_score']} &middot; {summary['below_threshold']} below {summary['threshold']}</p>")
+    yield '    <table>'
+    yield ('        <tr><th>Rank</th><th>API</th><th>Version</th><th>Score</th><th>Percentile</th>'
+           + ''.join(f'<th>{escape(name)}</th>' for _, name, _ in CATEGORIES) + '<th>Operations</th><th>Spec</th></tr>')
+    for row in rows:
+        if row['status'] != 'scored':
+            yield (f'        <tr class="error"><td>-</td><td colspan="{len(CATEGORIES) + 5}">'
+                   f'{escape(row.get("error", ""))}</td><td>{escape(row["spec"])}</td></tr>')
+            continue
+        yield (f"        <tr><td>{row['rank']}</td><td>{escape(row['title'])}</td><td>{escape(row['version'])}</td>"
+               f"<td>{row['overall_score']}</td><td>{row['percentile']}</td>"
+               + ''.join(f'<td>{row[key]}</td>' for key, _, _ in CATEGORIES)
+               + f"<td>{row['total_operations']}</td><td>{escape(row['spec'])}</td></tr>")
+    yield '    </table>'
+    yield '</body>'
+    yield '</html>'
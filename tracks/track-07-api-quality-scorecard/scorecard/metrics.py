@@ -0,0 +1,454 @@
+"""
+Single-pass metrics collection.
+
+Every scoring criterion is a function of a handful of counters (operations
+with descriptions, typed parameters, 4xx/5xx coverage, ...). Instead of
+each category walking the spec on its own, collect_metrics() traverses the
+document once. Per-operation features come out as rows that
+scorecard.features turns into NumPy columns and sums. The document-level
+counters go straight into one SpecMetrics object that every category
+reads.
+
+Counters are plain additive counts, so the metrics of a spec are the sum of
+the metrics of its units (see spec_units): each operation, each component
+schema, and the document-level rest. Naming styles and status codes are
+counted under prefixed keys ('param_style:camel', 'status:404').
+"""
+
+import os
+import re
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Bump when what the collector counts changes; cached unit counters are keyed by it
+FRAMEWORK_VERSION = 2
+
+HTTP_METHODS = ('get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace')
+_METHOD_SET = frozenset(HTTP_METHODS)
+
+QUALITY_THRESHOLDS = {
+    'min_description_length': 10,
+    'good_description_length': 50,
+    'max_parameters_per_operation': 10,
+    'max_schema_depth': 5,
+}
+
+# .env settings overriding QUALITY_THRESHOLDS (see .env.example)
+THRESHOLD_ENV = {
+    'MIN_DESCRIPTION_LENGTH': 'min_description_length',
+    'GOOD_DESCRIPTION_LENGTH': 'good_description_length',
+    'MAX_OPERATION_PARAMETERS': 'max_parameters_per_operation',
+    'MAX_SCHEMA_DEPTH': 'max_schema_depth',
+}
+
+# Per-operation features, in the order _Collector.operation returns them.
+# All are counts (0/1 flags for the operation itself) except the raw
+# description_length and schema_depth, which derived_features() compares
+# against the thresholds.
+OPERATION_FEATURES = (
+    'operations', 'description_length', 'operations_summarized', 'operations_tagged', 'operations_with_id',
+    'parameters', 'parameters_described', 'parameters_typed', 'request_bodies', 'request_bodies_typed',
+    'responses', 'responses_with_schema', 'error_responses', 'error_responses_with_schema',
+    'error_responses_with_examples', 'operations_with_4xx', 'operations_with_5xx', 'operations_with_examples',
+    'schema_depth', 'operations_secured', 'secured_operations_with_401', 'object_schemas',
+    'object_schemas_with_required',
+)
+RAW_FEATURES = ('description_length', 'schema_depth')
+DERIVED_FEATURES = ('operations_described', 'operations_well_described', 'operations_simple')
+# Per-operation counters that add up to spec counters
+OPERATION_COUNTERS = tuple(key for key in OPERATION_FEATURES if key not in RAW_FEATURES) + DERIVED_FEATURES
+
+# Responses that legitimately carry no body
+NO_CONTENT_STATUSES = ('204', '205', '304')
+
+# Schema keywords holding a single nested schema / a list of them
+_SCHEMA_SINGLE = ('items', 'not', 'additionalProperties')
+_SCHEMA_LIST = ('allOf', 'oneOf', 'anyOf')
+
+_STYLES = (
+    ('lower', re.compile(r'^[a-z][a-z0-9]*$')),
+    ('camel', re.compile(r'^[a-z][a-z0-9]*(?:[A-Z][a-z0-9]*)+$')),
+    ('pascal', re.compile(r'^(?:[A-Z][a-z0-9]*)+$')),
+    ('snake', re.compile(r'^[a-z][a-z0-9]*(?:_[a-z0-9]+)+$')),
+    ('kebab', re.compile(r'^[a-z][a-z0-9]*(?:-[a-z0-9]+)+$')),
+)
+
+
+def thresholds_from_env(environ=os.environ) -> Dict[str, int]:
+    """QUALITY_THRESHOLDS with overrides from the environment."""
+    thresholds = dict(QUALITY_THRESHOLDS)
+    for variable, key in THRESHOLD_ENV.items():
+        value = environ.get(variable)
+        if value:
+            thresholds[key] = int(value)
+    return thresholds
+
+
+def naming_style(name: str) -> str:
+    """'lower', 'camel', 'pascal', 'snake', 'kebab' or 'other'."""
+    for style, pattern in _STYLES:
+        if pattern.match(name):
+            return style
+    return 'other'
+
+
+def derived_features(features: Dict[str, Any], thresholds: Dict[str, int]) -> Dict[str, Any]:
+    """
+    Threshold flags computed from raw features. Works the same on scalars
+    (one operation) and on NumPy columns (every operation at once).
+    """
+    description = features['description_length']
+    return {
+        'operations_described': description >= thresholds['min_description_length'],
+        'operations_well_described': description >= thresholds['good_description_length'],
+        'operations_simple': ((features['parameters'] <= thresholds['max_parameters_per_operation'])
+                              & (features['schema_depth'] <= thresholds['max_schema_depth'])),
+    }
+
+
+def _text_length(value: Any) -> int:
+    return len(value.strip()) if isinstance(value, str) else 0
+
+
+class SpecMetrics:
+    """Counters collected from one traversal of a spec."""
+
+    def __init__(self, thresholds: Optional[Dict[str, int]] = None):
+        self.thresholds = dict(QUALITY_THRESHOLDS, **(thresholds or {}))
+        self.counts: Counter = Counter()
+
+    def __getitem__(self, key: str) -> int:
+        return self.counts[key]
+
+    def ratio(self, part: str, whole: str, empty: float = 1.0) -> float:
+        """counts[part] / counts[whole], or `empty` when there is nothing to count."""
+        total = self.counts[whole]
+        return self.counts[part] / total if total else empty
+
+    def prefixed(self, prefix: str) -> Dict[str, int]:
+        """Counters under 'prefix:', keyed by the rest of the name."""
+        start = prefix + ':'
+        return {key[len(start):]: count for key, count in self.counts.items() if key.startswith(start)}
+
+    def style_consistency(self, prefix: str) -> float:
+        """
+        Share of names following the dominant naming style. All-lowercase
+        names ('id', 'limit') fit camel, snake and kebab case alike.
+        """
+        styles = self.prefixed(prefix)
+        total = sum(styles.values())
+        if not total:
+            return 1.0
+        lower = styles.get('lower', 0)
+        dominant = max(max(styles.get(style, 0) for style in ('camel', 'snake', 'kebab')) + lower,
+                       styles.get('pascal', 0))
+        return dominant / total
+
+    def status_codes(self) -> List[str]:
+        return sorted(self.prefixed('status'))
+
+
+class _Collector:
+    """
+    Walks a spec once, resolving local $refs to parameters, bodies and
+    responses. Operations come out as rows of OPERATION_FEATURES; naming
+    styles, status codes and component-level counts go to the counters.
+    """
+
+    def __init__(self, spec: Dict[str, Any], metrics: SpecMetrics):
+        self.spec = spec
+        self.metrics = metrics
+        self.counts = metrics.counts
+        self.thresholds = metrics.thresholds
+        self._resolved: Dict[str, Any] = {}
+        # Object schemas seen so far; operations and units count their share by difference
+        self.object_schemas = 0
+        self.object_schemas_with_required = 0
+
+    def resolve(self, node: Any) -> Any:
+        """Follow local $refs (memoized); external or broken refs are returned as-is."""
+        seen = 0
+        while isinstance(node, dict) and isinstance(node.get('$ref'), str) and seen < 32:
+            ref = node['$ref']
+            if ref not in self._resolved:
+                target = None
+                if ref.startswith('#/'):
+                    target = self.spec
+                    for part in ref[2:].split('/'):
+                        part = part.replace('~1', '/').replace('~0', '~')
+                        target = target.get(part) if isinstance(target, dict) else None
+                self._resolved[ref] = target
+            if self._resolved[ref] is None:
+                return node
+            node = self._resolved[ref]
+            seen += 1
+        return node
+
+    def collect(self) -> Tuple[List[Tuple[str, str]], List[Tuple[int, ...]]]:
+        """
+        Walk the whole spec: returns the (path, method) of every operation and
+        its OPERATION_FEATURES row; everything else is added to the counters.
+        """
+        spec = self.spec
+        global_security = spec.get('security')
+        keys, rows = [], []
+        paths = spec.get('paths') or {}
+        for path, path_item in paths.items() if isinstance(paths, dict) else ():
+            path_item = self.resolve(path_item)
+            if not isinstance(path_item, dict):
+                continue
+            shared = path_item.get('parameters') or []
+            for method, operation in path_item.items():
+                if method in _METHOD_SET and isinstance(operation, dict):
+                    keys.append((path, method))
+                    rows.append(self.operation(operation, shared, global_security))
+
+        self.component_schemas(_component_schemas(spec).values())
+        self.document()
+        return keys, rows
+
+    def unit(self, unit: Tuple[str, ...]) -> Tuple[Counter, Optional[Tuple[int, ...]]]:
+        """
+        Counters of one unit of spec_units(), collected on their own, and for
+        an operation its OPERATION_FEATURES row (None for other units).
+        """
+        self.counts = Counter()
+        row = None
+        if unit[0] == 'operation':
+            path_item = self.resolve(self.spec['paths'][unit[1]])
+            row = self.operation(path_item[unit[2]], path_item.get('parameters') or [], self.spec.get('security'))
+            features = dict(zip(OPERATION_FEATURES, row))
+            features.update(derived_features(features, self.thresholds))
+            self.counts.update({key: int(features[key]) for key in OPERATION_COUNTERS if features[key]})
+        elif unit[0] == 'schema':
+            self.component_schemas([self.spec['components']['schemas'][unit[1]]])
+        else:
+            self.document()
+        return self.counts, row
+
+    def document(self):
+        """Document-level counters: declared tags and security schemes."""
+        for tag in self.spec.get('tags') or ():
+            if isinstance(tag, dict):
+                self.counts['tags_declared'] += 1
+                if _text_length(tag.get('description')):
+                    self.counts['tags_described'] += 1
+
+        components = self.spec.get('components') or {}
+        for scheme in (components.get('securitySchemes') or {}).values():
+            self.security_scheme(self.resolve(scheme))
+
+    def component_schemas(self, schemas):
+        before = self.object_schemas, self.object_schemas_with_required
+        for schema in schemas:
+            self.schema(schema, 1)
+        self.counts['object_schemas'] += self.object_schemas - before[0]
+        self.counts['object_schemas_with_required'] += self.object_schemas_with_required - before[1]
+
+    def operation(self, operation: Dict[str, Any], shared: List[Any], global_security: Any) -> Tuple[int, ...]:
+        """Features of one operation, in OPERATION_FEATURES order; names and statuses go to the counters."""
+        counts = self.counts
+        objects_before = self.object_schemas, self.object_schemas_with_required
+
+        operation_id = operation.get('operationId')
+        has_id = isinstance(operation_id, str) and bool(operation_id)
+        if has_id:
+            counts['operation_id_style:' + naming_style(operation_id)] += 1
+
+        # Operation parameters override path-level ones with the same name and location
+        parameters = {}
+        for parameter in list(shared) + list(operation.get('parameters') or []):
+            parameter = self.resolve(parameter)
+            if isinstance(parameter, dict):
+                parameters[(parameter.get('name'), parameter.get('in'))] = parameter
+        described = typed = 0
+        has_example = False
+        for parameter in parameters.values():
+            parameter_described, parameter_typed, parameter_example = self.parameter(parameter)
+            described += parameter_described
+            typed += parameter_typed
+            has_example = has_example or parameter_example
+
+        depth = 0
+        bodies = bodies_typed = 0
+        body = self.resolve(operation.get('requestBody'))
+        if isinstance(body, dict):
+            bodies = 1
+            body_typed, body_example, depth = self.content(body.get('content'))
+            bodies_typed = int(body_typed)
+            has_example = has_example or body_example
+
+        responses_total = responses_typed = errors = errors_typed = errors_with_examples = 0
+        has_4xx = has_5xx = has_401 = False
+        responses = operation.get('responses') or {}
+        for status, response in responses.items() if isinstance(responses, dict) else ():
+            status = str(status)
+            response = self.resolve(response)
+            if not isinstance(response, dict):
+                continue
+            counts['status:' + status] += 1
+            typed_response, response_example, response_depth = self.content(response.get('content'))
+            depth = max(depth, response_depth)
+            has_example = has_example or response_example
+            if status not in NO_CONTENT_STATUSES:
+                responses_total += 1
+                responses_typed += typed_response
+            if status[0] in '45' or status == 'default':
+                errors += 1
+                errors_typed += typed_response
+                errors_with_examples += response_example
+                has_4xx = has_4xx or status[0] == '4'
+                has_5xx = has_5xx or status[0] == '5' or status == 'default'
+                has_401 = has_401 or status in ('401', '4XX')
+
+        security = operation.get('security', global_security)
+        secured = isinstance(security, list) and any(requirement for requirement in security)
+
+        return (1, _text_length(operation.get('description')), int(bool(_text_length(operation.get('summary')))),
+                int(bool(operation.get('tags'))), int(has_id), len(parameters), described, typed, bodies, bodies_typed,
+                responses_total, responses_typed, errors, errors_typed, errors_with_examples, int(has_4xx),
+                int(has_5xx), int(has_example), depth, int(secured), int(secured and has_401),
+                self.object_schemas - objects_before[0],
+                self.object_schemas_with_required - objects_before[1])
+
+    def parameter(self, parameter: Dict[str, Any]) -> Tuple[bool, bool, bool]:
+        """(described, typed, has an example) for one parameter; its name style goes to the counters."""
+        described = _text_length(parameter.get('description')) >= self.thresholds['min_description_length']
+        schema = self.resolve(parameter.get('schema'))
+        typed = (isinstance(schema, dict) and _is_typed(schema)) or bool(parameter.get('content'))
+        name = parameter.get('name')
+        if isinstance(name, str) and name:
+            self.counts['param_style:' + naming_style(name)] += 1
+        return described, typed, 'example' in parameter or bool(parameter.get('examples'))
+
+    def content(self, content: Any) -> Tuple[bool, bool, int]:
+        """(every media type has a typed schema, any has an example, deepest inline schema)."""
+        if not isinstance(content, dict) or not content:
+            return False, False, 0
+        typed, has_example, depth = True, False, 0
+        for media in content.values():
+            if not isinstance(media, dict):
+                typed = False
+                continue
+            schema = media.get('schema')
+            if not (isinstance(schema, dict) and _is_typed(self.resolve(schema))):
+                typed = False
+            if 'example' in media or media.get('examples'):
+                has_example = True
+            if isinstance(schema, dict):
+                if 'example' in schema:
+                    has_example = True
+                depth = max(depth, self.schema(schema, 1))
+        return typed, has_example, depth
+
+    def schema(self, schema: Any, depth: int) -> int:
+        """Count an inline schema tree (without following $refs); returns its depth."""
+        if not isinstance(schema, dict) or '$ref' in schema:
+            return depth - 1
+        counts = self.counts
+        deepest = depth
+        properties = schema.get('properties')
+        if isinstance(properties, dict) and properties:
+            self.object_schemas += 1
+            if schema.get('required'):
+                self.object_schemas_with_required += 1
+            for name, value in properties.items():
+                counts['property_style:' + naming_style(str(name))] += 1
+                deepest = max(deepest, self.schema(value, depth + 1))
+        for key in _SCHEMA_SINGLE:
+            if isinstance(schema.get(key), dict):
+                deepest = max(deepest, self.schema(schema[key], depth + 1))
+        for key in _SCHEMA_LIST:
+            for item in schema.get(key) or ():
+                deepest = max(deepest, self.schema(item, depth))
+        return deepest
+
+    def security_scheme(self, scheme: Any):
+        if not isinstance(scheme, dict):
+            return
+        counts = self.counts
+        counts['security_schemes'] += 1
+        if _text_length(scheme.get('description')) >= self.thresholds['min_description_length']:
+            counts['security_schemes_described'] += 1
+        kind = scheme.get('type')
+        if kind == 'oauth2':
+            counts['oauth_schemes'] += 1
+            flows = scheme.get('flows') or {}
+            complete = bool(flows)
+            for flow_name, flow in flows.items() if isinstance(flows, dict) else ():
+                if not isinstance(flow, dict):
+                    complete = False
+                    continue
+                needs = {'implicit': ('authorizationUrl',), 'password': ('tokenUrl',),
+                         'clientCredentials': ('tokenUrl',),
+                         'authorizationCode': ('authorizationUrl', 'tokenUrl')}.get(flow_name, ())
+                complete = complete and all(flow.get(key) for key in needs)
+                for description in (flow.get('scopes') or {}).values():
+                    counts['oauth_scopes'] += 1
+                    if _text_length(description):
+                        counts['oauth_scopes_described'] += 1
+        elif kind == 'apiKey':
+            complete = bool(scheme.get('name')) and scheme.get('in') in ('query', 'header', 'cookie')
+        elif kind == 'http':
+            complete = bool(scheme.get('scheme'))
+        elif kind == 'openIdConnect':
+            complete = bool(scheme.get('openIdConnectUrl'))
+        else:
+            complete = kind == 'mutualTLS'
+        if complete:
+            counts['security_schemes_complete'] += 1
+
+
+def _component_schemas(spec: Dict[str, Any]) -> Dict[str, Any]:
+    components = spec.get('components')
+    schemas = components.get('schemas') if isinstance(components, dict) else None
+    return schemas if isinstance(schemas, dict) else {}
+
+
+def spec_units(spec: Dict[str, Any]) -> List[Tuple[str, ...]]:
+    """
+    Units whose counters add up to the metrics of a spec:
+    ('operation', path, method), ('schema', name) and ('document',).
+    """
+    units: List[Tuple[str, ...]] = [('document',)]
+    paths = spec.get('paths')
+    collector = _Collector(spec, SpecMetrics())
+    for path, path_item in paths.items() if isinstance(paths, dict) else ():
+        if isinstance(path_item, dict) and '$ref' in path_item:
+            path_item = collector.resolve(path_item)
+        if isinstance(path_item, dict):
+            for method, operation in path_item.items():
+                if method in _METHOD_SET and isinstance(operation, dict):
+                    units.append(('operation', path, method))
+    units.extend(('schema', name) for name in _component_schemas(spec))
+    return units
+
+
+def iter_unit_metrics(spec: Dict[str, Any], units: List[Tuple[str, ...]],
+                      thresholds: Optional[Dict[str, int]] = None) -> Iterator[Counter]:
+    """Counters of each of `units` (from spec_units), in order, collected as they are consumed."""
+    return (counts for counts, _ in iter_unit_features(spec, units, thresholds))
+
+
+def iter_unit_features(spec: Dict[str, Any], units: List[Tuple[str, ...]],
+                       thresholds: Optional[Dict[str, int]] = None) -> Iterator[Tuple[Counter, Any]]:
+    """(counters, OPERATION_FEATURES row or None) of each of `units`, in order, collected as they are consumed."""
+    collector = _Collector(spec, SpecMetrics(thresholds))
+    return (collector.unit(unit) for unit in units)
+
+
+def collect_unit_metrics(spec: Dict[str, Any], units: List[Tuple[str, ...]],
+                         thresholds: Optional[Dict[str, int]] = None) -> List[Counter]:
+    """Counters of each of `units` (from spec_units), in order."""
+    return list(iter_unit_metrics(spec, units, thresholds))
+
+
+def _is_typed(schema: Dict[str, Any]) -> bool:
+    return any(key in schema for key in ('type', '$ref', 'properties', 'allOf', 'oneOf', 'anyOf', 'enum'))
+
+
+def collect_metrics(spec: Dict[str, Any], thresholds: Optional[Dict[str, int]] = None) -> SpecMetrics:
+    """Collect every scoring counter in one traversal of `spec`."""
+    from .features import extract_features
+
+    return extract_features(spec, thresholds).metrics()
@@ -0,0 +1,79 @@
+"""
+Loading OpenAPI specifications for scoring.
+
+Specs are read from local YAML/JSON files or URLs. JSON is parsed with the
+json module (much faster than YAML for large specs); everything else with
+yaml's C loader when it is available.
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Tuple
+
+SUPPORTED_VERSIONS = ('3.0', '3.1')
+
+
+class OpenAPIParser:
+    """Loads and minimally validates OpenAPI 3.x documents."""
+
+    def load(self, spec_path: str) -> Dict[str, Any]:
+        """Load and validate a spec from a file path or URL; raises ValueError if it is not OpenAPI 3.x."""
+        return self.parse_source(spec_path, *self.read(spec_path))
+
+    def read(self, spec_path: str) -> Tuple[str, bool]:
+        """Source text of a spec file or URL, and whether it is JSON."""
+        if spec_path.startswith(('http://', 'https://')):
+            import requests
+
+            response = requests.get(spec_path, timeout=30)
+            response.raise_for_status()
+            text = response.text
+            is_json = 'json' in response.headers.get('Content-Type', '') or spec_path.endswith('.json')
+        else:
+            with open(spec_path, 'r', encoding='utf-8-sig') as f:
+                text = f.read()
+            is_json = os.path.splitext(spec_path)[1].lower() == '.json'
+        return text, is_json
+
+    def parse_source(self, spec_path: str, text: str, is_json: bool) -> Dict[str, Any]:
+        """Parse and validate source text read from spec_path."""
+        spec = self.parse_content(text, is_json)
+        problems = self.problems(spec)
+        if problems:
+            raise ValueError(f"{spec_path} is not a valid OpenAPI 3.x document: {'; '.join(problems)}")
+        return spec
+
+    def parse_content(self, text: str, is_json: bool = False) -> Dict[str, Any]:
+        """Parse spec source text; raises ValueError on malformed JSON/YAML."""
+        if is_json:
+            try:
+                spec = json.loads(text)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON: {e}") from e
+        else:
+            import yaml
+
+            loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+            try:
+                spec = yaml.load(text, Loader=loader)
+            except yaml.YAMLError as e:
+                raise ValueError(f"Invalid YAML: {e}") from e
+        if not isinstance(spec, dict):
+            raise ValueError("Expected a mapping at the root of the document")
+        return spec
+
+    def problems(self, spec: Dict[str, Any]) -> List[str]:
+        """Structural problems that make a document unscoreable (empty if none)."""
+        problems = []
+        version = str(spec.get('openapi', ''))
+        if not version.startswith(SUPPORTED_VERSIONS):
+            problems.append(f"unsupported OpenAPI version {version or '(missing)'!r}, expected 3.0 or 3.1")
+        info = spec.get('info')
+        if not isinstance(info, dict) or not info.get('title') or not info.get('version'):
+            problems.append("info.title and info.version are required")
+        if not isinstance(spec.get('paths', {}), dict):
+            problems.append("paths must be a mapping")
+        return problems
+
+    def validate(self, spec: Dict[str, Any]) -> bool:
+        return not self.problems(spec)
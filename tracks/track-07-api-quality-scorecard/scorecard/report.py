@@ -0,0 +1,120 @@
+"""
+Scorecard reports rendered from compiled Jinja2 templates.
+
+The templates in templates/ are compiled once per process and reused for
+every report, so a batch run writing thousands of reports compiles each
+of them once. Reports are streamed to the file while they are rendered,
+and per-operation issue rows are pulled from an iterator as the template
+reaches them, so a table of tens of thousands of rows is never held in
+memory.
+
+HTML reports page the operation table: the first file holds the summary
+and the first PAGE_SIZE rows, and each further page is a sibling file
+(report-page2.html, ...) linked with previous/next links. A browser never
+has to lay out the whole table at once.
+"""
+
+import json
+import os
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .analyzer import CATEGORIES
+
+REPORT_FORMATS = ('html', 'json', 'markdown')
+
+# Operation issue rows per HTML page
+PAGE_SIZE = 1000
+
+_TEMPLATES = {'html': 'report.html.j2', 'markdown': 'report.md.j2'}
+
+
+@lru_cache(maxsize=None)
+def _environment():
+    import jinja2
+
+    environment = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(os.path.join(os.path.dirname(__file__), 'templates')),
+        autoescape=jinja2.select_autoescape(['html.j2']),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+        keep_trailing_newline=True,
+    )
+    environment.filters['md'] = lambda value: str(value).replace('|', '\\|')
+    return environment
+
+
+def template(format: str):
+    """Compiled template for an html or markdown report (cached by the environment)."""
+    return _environment().get_template(_TEMPLATES[format])
+
+
+def page_path(output_path: str, page: int) -> str:
+    """File of an HTML report page: the output itself for page 1, report-pageN.html after."""
+    if page == 1:
+        return output_path
+    root, ext = os.path.splitext(output_path)
+    return f'{root}-page{page}{ext}'
+
+
+def _pages(rows: Iterable[Dict[str, Any]], page_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Rows in pages of page_size; always at least one (possibly empty) page."""
+    rows = iter(rows)
+    page = list(islice(rows, page_size))
+    yield page
+    while True:
+        page = list(islice(rows, page_size))
+        if not page:
+            return
+        yield page
+
+
+def write_report(results: Dict[str, Any], output_path: str, format: str,
+                 operation_rows: Optional[Iterable[Dict[str, Any]]] = None, page_size: int = PAGE_SIZE) -> List[str]:
+    """
+    Write a report of analyze() results; returns the files written.
+
+    operation_rows (e.g. analyzer.operation_issues) adds the per-operation
+    issue table: streamed into markdown, paged across files in HTML, and
+    added to JSON as 'operation_issues'.
+    """
+    if format == 'json':
+        with open(output_path, 'w', encoding='utf-8') as f:
+            if operation_rows is None:
+                json.dump(results, f, indent=2)
+            else:
+                # One row per line, written as the rows are produced
+                f.write(json.dumps(results, indent=2)[:-2] + ',\n  "operation_issues": [')
+                for i, row in enumerate(operation_rows):
+                    f.write((',\n    ' if i else '\n    ') + json.dumps(row))
+                f.write('\n  ]\n}')
+        return [output_path]
+
+    if format == 'markdown' or operation_rows is None:
+        _render(format, output_path, results, operation_rows)
+        return [output_path]
+
+    written = []
+    pages = _pages(operation_rows, page_size)
+    page, current = 1, next(pages)
+    while True:
+        following = next(pages, None)
+        path = page_path(output_path, page)
+        _render(format, path, results, current, page=page,
+                prev_href=os.path.basename(page_path(output_path, page - 1)) if page > 1 else None,
+                next_href=os.path.basename(page_path(output_path, page + 1)) if following is not None else None)
+        written.append(path)
+        if following is None:
+            return written
+        page, current = page + 1, following
+
+
+def _render(format: str, path: str, results: Dict[str, Any], rows: Optional[Iterable[Dict[str, Any]]],
+            page: int = 1, prev_href: Optional[str] = None, next_href: Optional[str] = None):
+    stream = template(format).stream(results=results, categories=CATEGORIES, rows=rows, page=page,
+                                     prev_href=prev_href, next_href=next_href)
+    stream.enable_buffering(100)
+    with open(path, 'w', encoding='utf-8') as f:
+        stream.dump(f)
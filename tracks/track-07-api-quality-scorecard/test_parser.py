@@ -6,21 +6,18 @@ This helps verify that your parser can load and understand OpenAPI specification
 
 import os
 import sys
-from pathlib import Path
 
 def test_parser_implementation():
     """Test that the parser can be imported and basic functionality works."""
     print("🔍 Testing OpenAPI Parser Implementation...")
     
     try:
-        # TODO: Import your actual parser
-        # from scorecard.parser import OpenAPIParser
+        from scorecard.parser import OpenAPIParser
         
         print("✅ Parser import successful")
         
-        # TODO: Test basic functionality
-        # parser = OpenAPIParser()
-        # print("✅ Parser initialization successful")
+        parser = OpenAPIParser()
+        print("✅ Parser initialization successful")
         
         return True
     except ImportError as e:
@@ -50,14 +47,14 @@ def test_example_specs():
         print(f"Testing: {spec_file}")
         
         try:
-            # TODO: Replace with actual parser testing
-            # parser = OpenAPIParser()
-            # spec = parser.load(spec_file)
-            # 
-            # # Basic validation
-            # assert 'openapi' in spec
-            # assert 'info' in spec
-            # assert 'paths' in spec
+            from scorecard.parser import OpenAPIParser
+            parser = OpenAPIParser()
+            spec = parser.load(spec_file)
+            
+            # Basic validation
+            assert 'openapi' in spec
+            assert 'info' in spec
+            assert 'paths' in spec
             
             print(f"  ✅ {spec_file} parsed successfully")
             results.append(True)
@@ -106,12 +103,9 @@ def test_spec_validation():
         print(f"Testing: {test_case['name']}")
         
         try:
-            # TODO: Replace with actual validation logic
-            # parser = OpenAPIParser()
-            # is_valid = parser.validate(test_case['spec'])
-            
-            # For now, just assume basic validation
-            is_valid = 'openapi' in test_case['spec'] and 'info' in test_case['spec']
+            from scorecard.parser import OpenAPIParser
+            parser = OpenAPIParser()
+            is_valid = parser.validate(test_case['spec'])
             
             if is_valid == test_case['should_pass']:
                 print(f"  ✅ Validation result as expected")
@@ -151,17 +145,15 @@ def test_error_handling():
         print(f"Testing: {test_case['name']}")
         
         try:
-            # TODO: Replace with actual error handling tests
-            # parser = OpenAPIParser()
+            from scorecard.parser import OpenAPIParser
+            parser = OpenAPIParser()
             
             if test_case['type'] == 'file':
                 # Should raise FileNotFoundError
-                # parser.load(test_case['input'])
-                pass
+                parser.load(test_case['input'])
             else:
-                # Should handle parsing errors gracefully
-                # parser.parse_content(test_case['input'])
-                pass
+                # Should handle parsing errors gracefully (ValueError)
+                parser.parse_content(test_case['input'], is_json=test_case['name'] == 'Invalid JSON')
             
             print(f"  ✅ Error handled appropriately")
             
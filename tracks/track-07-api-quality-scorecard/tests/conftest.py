@@ -0,0 +1,65 @@
+"""Shared fixtures for the scorecard tests."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+TRACK_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TRACK_DIR))
+
+
+@pytest.fixture(scope='session')
+def cli():
+    """The scorecard.py CLI module (the scorecard/ package shadows it on import)."""
+    spec = importlib.util.spec_from_file_location('scorecard_cli', TRACK_DIR / 'scorecard.py')
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['scorecard_cli'] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def petstore():
+    return {
+        'openapi': '3.0.3',
+        'info': {'title': 'Pets', 'version': '1.0.0'},
+        'security': [{'ApiKey': []}],
+        'tags': [{'name': 'pets', 'description': 'Pets in the store'}],
+        'paths': {
+            '/pets/{petId}': {
+                'parameters': [{'name': 'petId', 'in': 'path', 'required': True, 'schema': {'type': 'integer'}}],
+                'get': {
+                    'operationId': 'getPet',
+                    'summary': 'Get a pet',
+                    'description': 'Fetch a single pet by its identifier, including its owner and tags',
+                    'tags': ['pets'],
+                    'parameters': [{'$ref': '#/components/parameters/PetId'}],
+                    'responses': {
+                        '200': {'description': 'The pet', 'content': {'application/json': {
+                            'schema': {'$ref': '#/components/schemas/Pet'}, 'example': {'id': 1}}}},
+                        '401': {'$ref': '#/components/responses/Error'},
+                        '404': {'$ref': '#/components/responses/Error'},
+                        '500': {'$ref': '#/components/responses/Error'},
+                    },
+                },
+                'delete': {
+                    'security': [],
+                    'responses': {'204': {'description': 'Deleted'}},
+                },
+            },
+        },
+        'components': {
+            'parameters': {'PetId': {'name': 'petId', 'in': 'path', 'required': True,
+                                     'description': 'Identifier of the pet', 'schema': {'type': 'integer'}}},
+            'responses': {'Error': {'description': 'Error', 'content': {'application/json': {
+                'schema': {'type': 'object', 'required': ['code'],
+                           'properties': {'code': {'type': 'string'}, 'message': {'type': 'string'}}}}}}},
+            'schemas': {'Pet': {'type': 'object', 'properties': {'id': {'type': 'integer'},
+                                                                  'owner_name': {'type': 'string'},
+                                                                  'ownerId': {'type': 'integer'}}}},
+            'securitySchemes': {'ApiKey': {'type': 'apiKey', 'name': 'X-API-Key', 'in': 'header',
+                                           'description': 'Key from the developer portal'}},
+        },
+    }
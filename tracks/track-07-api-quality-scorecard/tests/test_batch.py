@@ -0,0 +1,64 @@
+"""Tests for batch scoring and leaderboards."""
+
+import csv
+import json
+
+import pytest
+
+from scorecard import aggregate_failures, run_batch, sort_rows, summarize_rows
+from scorecard.batch import expand_catalog, read_manifest
+from scorecard.leaderboard import chunk_lines, leaderboard_lines
+
+
+@pytest.fixture
+def catalog(tmp_path, petstore):
+    specs = tmp_path / 'specs'
+    (specs / 'nested').mkdir(parents=True)
+    (specs / 'pets.json').write_text(json.dumps(petstore))
+    bare = {'openapi': '3.0.0', 'info': {'title': 'Bare', 'version': '1'},
+            'paths': {'/ping': {'get': {'responses': {'200': {'description': 'ok'}}}}}}
+    (specs / 'nested' / 'bare.json').write_text(json.dumps(bare))
+    (specs / 'broken.yaml').write_text('openapi: [')
+    (specs / 'notes.txt').write_text('not a spec')
+    return specs
+
+
+def test_catalog_and_manifest_expansion(catalog):
+    assert [path.rsplit('/', 2)[-2:] for path in expand_catalog(str(catalog))] == [
+        ['specs', 'broken.yaml'], ['specs', 'pets.json'], ['nested', 'bare.json']]
+    manifest = catalog / 'catalog.txt'
+    manifest.write_text('# catalog\npets.json\n\nhttps://example.com/openapi.json\npets.json\n')
+    assert read_manifest(str(manifest)) == [str(catalog / 'pets.json'), 'https://example.com/openapi.json']
+
+
+def test_pool_rows_are_ranked_and_summarized(catalog):
+    seen = []
+    rows = run_batch(expand_catalog(str(catalog)), jobs=2, on_result=seen.append)
+    assert len(seen) == 3
+    rows = sort_rows(rows)
+    assert [row['status'] for row in rows] == ['scored', 'scored', 'error']
+    assert [row['title'] for row in rows[:2]] == ['Pets', 'Bare']
+    assert rows[0]['overall_score'] > rows[1]['overall_score'] and rows[0]['rank'] == 1
+    assert 'Invalid YAML' in rows[2]['error']
+
+    summary = summarize_rows(rows, threshold=50)
+    assert (summary['scored'], summary['errored'], summary['below_threshold']) == (2, 1, 1)
+    assert aggregate_failures(summary) == []
+    assert len(aggregate_failures(summary, min_average=99, max_below_share=0.25, max_errors=0)) == 3
+
+    lines = ''.join(chunk_lines(leaderboard_lines(rows, summary, 'csv'), size=2)).splitlines()
+    table = list(csv.DictReader(lines))
+    assert [row['rank'] for row in table] == ['1', '2', '']
+    assert json.loads(''.join(leaderboard_lines(rows, summary, 'json')))['summary'] == summary
+
+
+def test_batch_exit_code_follows_aggregate_rules(cli, catalog, tmp_path):
+    from click.testing import CliRunner
+
+    output = tmp_path / 'leaderboard.md'
+    result = CliRunner().invoke(cli.main, [str(catalog), '-q', '-j', '1', '-t', '100', '-o', str(output),
+                                           '-f', 'markdown'])
+    assert result.exit_code == 0  # every spec is below 100, but no aggregate rule was given
+    assert output.read_text().count('\n| ') == 1 + 3  # header and one row per spec
+    result = CliRunner().invoke(cli.main, [str(catalog), '-q', '-j', '1', '--max-errors', '0'])
+    assert result.exit_code == 1
@@ -0,0 +1,79 @@
+"""Tests for incremental scoring with the per-unit counters cache."""
+
+import copy
+import json
+
+from scorecard import QualityAnalyzer, ScoreCache, analyze_cached, collect_incremental, collect_metrics
+
+
+def _write(path, spec):
+    path.write_text(json.dumps(spec))
+    return str(path)
+
+
+def test_unchanged_spec_is_replayed_without_collecting(tmp_path, petstore):
+    spec_path = _write(tmp_path / 'pets.json', petstore)
+    info, first = analyze_cached(spec_path, ScoreCache.for_spec(str(tmp_path / 'cache'), spec_path))
+    assert info == {'title': 'Pets', 'version': '1.0.0'}
+    assert first == QualityAnalyzer().analyze(petstore)
+
+    cache = ScoreCache.for_spec(str(tmp_path / 'cache'), spec_path)
+    _, again = analyze_cached(spec_path, cache)
+    assert again == first
+    assert (cache.collected, cache.reused) == (0, 4)  # document, two operations, one schema
+
+
+def test_only_changed_units_and_their_ref_dependents_are_collected(petstore):
+    cache = ScoreCache()
+    collect_incremental(petstore, cache)
+
+    edited = copy.deepcopy(petstore)
+    edited['paths']['/pets/{petId}']['delete']['description'] = 'Remove the pet from the store for good'
+    metrics = collect_incremental(edited, cache)
+    assert cache.collected == 1
+    assert metrics.counts == collect_metrics(edited).counts
+
+    # Only the GET operation $refs the shared Error response
+    edited['components']['responses']['Error']['content']['application/json']['schema']['required'] = []
+    metrics = collect_incremental(edited, cache)
+    assert cache.collected == 1
+    assert metrics.counts == collect_metrics(edited).counts
+
+    del edited['paths']['/pets/{petId}']['get']
+    metrics = collect_incremental(edited, cache)
+    assert cache.collected == 0
+    assert metrics.counts == collect_metrics(edited).counts
+
+
+def test_threshold_change_invalidates_the_cache(petstore):
+    cache = ScoreCache()
+    collect_incremental(petstore, cache)
+    metrics = collect_incremental(petstore, cache, {'good_description_length': 5})
+    assert cache.reused == 0
+    assert metrics.counts == collect_metrics(petstore, {'good_description_length': 5}).counts
+
+
+def test_detailed_results_and_operation_issues_come_from_the_cache(tmp_path, petstore):
+    from scorecard.analyzer import operation_issues
+
+    spec_path = _write(tmp_path / 'pets.json', petstore)
+    expected = QualityAnalyzer().analyze(petstore, detailed=True)
+    for run in ('cold', 'warm'):
+        cache = ScoreCache.for_spec(str(tmp_path / 'cache'), spec_path)
+        _, results = analyze_cached(spec_path, cache, detailed=True)
+        assert results == expected, run
+
+        features = cache.operation_features()
+        assert features.metrics().counts == collect_metrics(petstore).counts
+        assert list(operation_issues(None, features=features)) == list(operation_issues(petstore))
+
+
+def test_framework_key_covers_collector_constants(monkeypatch):
+    from scorecard import cache as cache_module
+
+    before = cache_module.framework_key({})
+    method = cache_module._Collector.document
+    code = method.__code__
+    monkeypatch.setattr(method, '__code__', code.replace(co_consts=tuple(
+        'tags_listed' if const == 'tags_declared' else const for const in code.co_consts)))
+    assert cache_module.framework_key({}) != before
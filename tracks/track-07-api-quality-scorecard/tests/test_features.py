@@ -0,0 +1,45 @@
+"""Tests for the columnar per-operation features."""
+
+from scorecard import CRITERIA, extract_features, percentile_ranks, sort_rows
+from scorecard.analyzer import operation_issues, operation_scores
+from scorecard.metrics import SpecMetrics, collect_metrics, collect_unit_metrics, spec_units
+
+
+def test_columns_add_up_to_the_spec_counters(petstore):
+    features = extract_features(petstore)
+    assert features.keys == [('/pets/{petId}', 'get'), ('/pets/{petId}', 'delete')]
+    assert list(features.columns['parameters']) == [1, 1]
+    assert list(features.columns['operations_well_described']) == [1, 0]
+    assert features.metrics().counts == collect_metrics(petstore).counts
+
+
+def test_vectorized_criteria_match_per_operation_counters(petstore):
+    features = extract_features(petstore)
+    vectorized = features.operation_metrics()
+    units = [unit for unit in spec_units(petstore) if unit[0] == 'operation']
+    for index, counts in enumerate(collect_unit_metrics(petstore, units)):
+        single = SpecMetrics()
+        single.counts = counts
+        for item in CRITERIA:
+            if item.scope == 'operation':
+                fraction, offending, _ = item.evaluate(single)
+                fractions, offendings, _ = item.evaluate(vectorized)
+                assert abs(min(max(fraction, 0.0), 1.0) - min(max(float(fractions[index]), 0.0), 1.0)) < 1e-9
+                assert offending == offendings[index]
+
+    scores = operation_scores(features)
+    assert all(0 <= score <= 100 for score in scores)
+    assert {(row['path'], row['method']) for row in operation_issues(petstore)} <= \
+        {('/pets/{petId}', 'GET'), ('/pets/{petId}', 'DELETE')}
+
+
+def test_percentiles_and_catalog_ranks(petstore):
+    features = extract_features(petstore)
+    assert features.percentiles(column='parameters') == {'p10': 1.0, 'p25': 1.0, 'p50': 1.0, 'p75': 1.0, 'p90': 1.0}
+    assert features.percentiles([0, 10, 20, 30, 40]) == {'p10': 4.0, 'p25': 10.0, 'p50': 20.0, 'p75': 30.0, 'p90': 36.0}
+    assert percentile_ranks([50, 70, 70, 90]) == [25.0, 75.0, 75.0, 100.0]
+
+    rows = [{'spec': name, 'status': 'scored', 'overall_score': score} for name, score in (('a', 40), ('b', 80))]
+    rows.append({'spec': 'c', 'status': 'error'})
+    ranked = sort_rows(rows)
+    assert [(row['spec'], row.get('percentile')) for row in ranked] == [('b', 100.0), ('a', 50.0), ('c', None)]
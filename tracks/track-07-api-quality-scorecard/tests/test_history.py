@@ -0,0 +1,69 @@
+"""Tests for the SQLite score history."""
+
+import json
+
+from scorecard import TrendStore
+from scorecard.history import trend_lines
+
+
+def _scores(overall, documentation=20, issues=5):
+    return {'overall_score': overall, 'total_operations': 10, 'issues_found': issues,
+            'category_scores': {'documentation': documentation, 'schemas': 20, 'errors': 15, 'usability': 15,
+                                'auth': overall - documentation - 50}}
+
+
+def test_trend_keeps_the_latest_run_per_version_with_deltas(tmp_path):
+    store = TrendStore(str(tmp_path / 'scores.db'))
+    store.record('Pets', '1.0', _scores(80), recorded_at=100)
+    store.record('Pets', '1.1', _scores(70, documentation=15, issues=9), recorded_at=200)
+    store.record('Pets', '1.0', _scores(82), recorded_at=300)  # re-run of an old version
+    assert store.recorded == 0  # still queued
+    store.close()
+
+    store = TrendStore(str(tmp_path / 'scores.db'))
+    rows = store.trend('Pets')
+    assert [(row['version'], row['overall_score'], row['recorded_at']) for row in rows] == [
+        ('1.0', 82, 300), ('1.1', 70, 200)]
+    assert rows[0]['delta']['overall_score'] is None
+    assert (rows[1]['delta']['overall_score'], rows[1]['delta']['documentation'],
+            rows[1]['delta']['issues_found']) == (-12, -5, 4)
+    store.close()
+
+
+def test_regressions_and_batched_writes(tmp_path):
+    store = TrendStore(str(tmp_path / 'scores.db'))
+    store.BATCH_SIZE = 2
+    store.record('Pets', '1', _scores(80))
+    store.record('Pets', '2', _scores(75))
+    assert store.recorded == 2
+    store.record('Shop', '1', _scores(60))
+    # Batch rows carry the category scores flat
+    store.record('Shop', '2', {'overall_score': 90, 'total_operations': 3, 'issues_found': 0, 'documentation': 25,
+                               'schemas': 25, 'errors': 20, 'usability': 15, 'auth': 5})
+    store.record('Solo', '1', _scores(50))
+    assert [(row['api'], row['delta']['overall_score']) for row in store.regressions()] == [('Pets', -5)]
+    assert store.apis() == ['Pets', 'Shop', 'Solo']
+
+    rows = store.trend('Shop')
+    assert json.loads('\n'.join(trend_lines(rows, 'json')))[1]['delta']['overall_score'] == 30
+    assert list(trend_lines(rows, 'markdown'))[3].startswith('| Shop | 2 |')
+    store.close()
+
+
+def test_cli_records_runs_and_reports_regressions(cli, tmp_path, petstore):
+    from click.testing import CliRunner
+
+    db = str(tmp_path / 'scores.db')
+    for version, description in (('1.0.0', 'Identifier of the pet'), ('1.1.0', None)):
+        petstore['info']['version'] = version
+        petstore['components']['parameters']['PetId']['description'] = description
+        spec_path = tmp_path / f'pets-{version}.json'
+        spec_path.write_text(json.dumps(petstore))
+        CliRunner().invoke(cli.main, [str(spec_path), '-q', '-t', '0', '--history', db])
+
+    result = CliRunner().invoke(cli.main, ['--history', db, '--trend', 'Pets'])
+    assert result.exit_code == 0
+    assert '1.1.0' in result.output
+    result = CliRunner().invoke(cli.main, ['--history', db, '--regressions'])
+    assert result.exit_code == 1
+    assert 'Pets 1.1.0' in result.output
@@ -0,0 +1,56 @@
+"""Tests for template-rendered reports and per-operation issue rows."""
+
+import json
+
+from scorecard import QualityAnalyzer
+from scorecard.analyzer import operation_issues
+from scorecard.report import template, write_report
+
+
+def test_operation_issues_come_from_operation_scoped_criteria(petstore):
+    rows = list(operation_issues(petstore))
+    assert {(row['method'], row['criterion']) for row in rows} >= {
+        ('DELETE', 'Operation descriptions'), ('DELETE', 'Operation naming'), ('GET', 'Error examples')}
+    assert not any(row['criterion'] in ('Security schemes', 'Status code coverage') for row in rows)
+    assert next(row for row in rows if row['method'] == 'GET')['operation_id'] == 'getPet'
+
+
+def test_html_report_pages_operation_rows(tmp_path, petstore):
+    results = QualityAnalyzer().analyze(petstore, detailed=True)
+    rows = ({'path': f'/items/{i}', 'method': 'GET', 'operation_id': f'op{i}', 'category': 'documentation',
+             'criterion': 'Examples', 'count': 1, 'message': '1 operations without any example'} for i in range(5))
+    output = str(tmp_path / 'report.html')
+    written = write_report(results, output, 'html', rows, page_size=2)
+    assert [path.rsplit('/', 1)[1] for path in written] == ['report.html', 'report-page2.html', 'report-page3.html']
+    first, middle, last = (open(path).read() for path in written)
+    assert 'Overall Score' in first and 'Overall Score' not in middle
+    assert '/items/2' in middle and 'href="report.html"' in middle and 'href="report-page3.html"' in middle
+    assert '/items/4' in last and 'next' not in last
+    assert template('html') is template('html')  # compiled once
+
+
+def test_markdown_and_json_include_streamed_rows(tmp_path, petstore):
+    results = QualityAnalyzer().analyze(petstore)
+    markdown = tmp_path / 'report.md'
+    write_report(results, str(markdown), 'markdown', operation_issues(petstore))
+    assert '| DELETE /pets/{petId} |  | documentation | Operation descriptions |' in markdown.read_text()
+
+    report = tmp_path / 'report.json'
+    write_report(results, str(report), 'json', operation_issues(petstore))
+    data = json.loads(report.read_text())
+    assert data['overall_score'] == results['overall_score']
+    assert data['operation_issues'] == list(operation_issues(petstore))
+
+
+def test_batch_writes_a_report_per_scored_spec(tmp_path, petstore):
+    from scorecard import run_batch
+    from scorecard.batch import report_path
+
+    spec_path = tmp_path / 'pets.json'
+    spec_path.write_text(json.dumps(petstore))
+    (tmp_path / 'broken.json').write_text('{')
+    run_batch([str(spec_path), str(tmp_path / 'broken.json')], jobs=1, report_dir=str(tmp_path / 'reports'),
+              report_format='markdown', detailed=True)
+    report = report_path(str(tmp_path / 'reports'), str(spec_path), 'markdown')
+    assert [path.name for path in (tmp_path / 'reports').iterdir()] == [report.rsplit('/', 1)[1]]
+    assert '## Operation Issues' in open(report).read()
@@ -0,0 +1,77 @@
+"""Tests for the single-pass metrics collector and the scoring engine."""
+
+import json
+
+from scorecard import CATEGORY_MAX, CRITERIA, QualityAnalyzer, collect_metrics
+
+
+def test_metrics_come_from_one_pass_with_resolved_refs(petstore):
+    metrics = collect_metrics(petstore)
+    counts = metrics.counts
+    assert (counts['operations'], counts['operations_well_described'], counts['operations_with_id']) == (2, 1, 1)
+    # The operation's $ref'd petId overrides the undescribed path-level one
+    assert (counts['parameters'], counts['parameters_described'], counts['parameters_typed']) == (2, 1, 2)
+    assert (counts['error_responses'], counts['error_responses_with_schema']) == (3, 3)
+    assert (counts['responses'], counts['responses_with_schema']) == (4, 4)  # 204 needs no body
+    assert (counts['operations_secured'], counts['secured_operations_with_401']) == (1, 1)
+    assert (counts['object_schemas'], counts['object_schemas_with_required']) == (4, 3)
+    assert metrics.status_codes() == ['200', '204', '401', '404', '500']
+    # Lowercase names fit any style; owner_name and ownerId disagree
+    assert metrics.style_consistency('property_style') == 8 / 9
+
+
+def test_criteria_add_up_to_category_maxima():
+    totals = {}
+    for item in CRITERIA:
+        totals[item.category] = totals.get(item.category, 0) + item.points
+    assert totals == CATEGORY_MAX
+
+
+def test_scores_issues_and_bounds(petstore):
+    results = QualityAnalyzer().analyze(petstore, detailed=True)
+    assert results['overall_score'] == sum(results['category_scores'].values())
+    assert all(0 <= results['category_scores'][key] <= maximum for key, maximum in CATEGORY_MAX.items())
+    messages = [issue['message'] for issue in results['issues']]
+    assert '1 operations without an operationId' in messages
+    assert results['issues_found'] == sum(issue['count'] for issue in results['issues'])
+    assert sum(item['max_points'] for item in results['criteria']) == 100
+
+    empty = QualityAnalyzer().analyze({'openapi': '3.0.0', 'info': {'title': 'x', 'version': '1'}, 'paths': {}})
+    assert (empty['total_operations'], empty['overall_score']) == (0, 0)
+    assert empty['issues'][0]['message'] == 'no operations to score'
+
+
+def test_cli_scores_and_saves_report(cli, tmp_path):
+    from click.testing import CliRunner
+
+    spec_path = tmp_path / 'api.json'
+    report_path = tmp_path / 'report.json'
+    spec_path.write_text(json.dumps({'openapi': '3.0.0', 'info': {'title': 'x', 'version': '1'}, 'paths': {
+        '/a': {'get': {'responses': {'200': {'description': 'OK'}}}}}}))
+    result = CliRunner().invoke(cli.main, [str(spec_path), '-q', '-f', 'json', '-o', str(report_path),
+                                           '--threshold', '90'])
+    report = json.loads(report_path.read_text())
+    assert result.exit_code == 1 and report['total_operations'] == 1
+    assert set(report['category_scores']) == set(CATEGORY_MAX)
+
+
+def test_explain_breaks_the_score_down_by_rule(cli, tmp_path, petstore):
+    from click.testing import CliRunner
+
+    results = QualityAnalyzer().analyze(petstore, detailed=True, explain=True)
+    rules = results['explain']['rules']
+    assert [(rule['name'], rule['points']) for rule in rules] == \
+        [(item['name'], item['points']) for item in results['criteria']]
+    assert set(results['explain']['timings']) == {'collect', 'score'}
+    assert all(rule['seconds'] >= 0 for rule in rules)
+    # Only the DELETE operation lacks a description; spec-wide rules name no operations
+    descriptions = next(rule for rule in rules if rule['name'] == 'Operation descriptions')
+    assert descriptions['operations'] == 1
+    assert [(op['method'], op['path']) for op in descriptions['top_operations']] == [('DELETE', '/pets/{petId}')]
+    assert all(not rule['top_operations'] for rule in rules if rule['scope'] == 'spec')
+
+    spec_path = tmp_path / 'pets.json'
+    spec_path.write_text(json.dumps(petstore))
+    result = CliRunner().invoke(cli.main, [str(spec_path), '--explain', '-t', '0'])
+    assert result.exit_code == 0 and 'parse' in result.output and 'Operation descriptions' in result.output
+    assert CliRunner().invoke(cli.main, [str(tmp_path), '--explain']).exit_code == 2
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+CLI start-up benchmark and import regression guard.
+
+Most validator runs are short (pre-commit hooks, CI steps, editor saves),
+so interpreter start-up and imports are a large share of their runtime.
+This runs each CLI command under `python -X importtime`, sums the import
+cost of everything the command loads beyond a bare interpreter, and times
+the command end to end. It fails when a fast command (--help, --version)
+imports one of the heavy dependencies that only validation needs, and,
+given a baseline, when import time or wall time grows by more than the
+tolerance.
+
+Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --save-baseline benchmarks/startup-baseline.json
+    python benchmarks/bench_startup.py --baseline benchmarks/startup-baseline.json --tolerance 0.25
+    python benchmarks/bench_startup.py --cli validator.py   # the validator only
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import click
+
+TRACK_DIR = Path(__file__).resolve().parent.parent
+
+# Measured when no --cli is given: this validator and the API quality scorecard
+DEFAULT_CLIS = (TRACK_DIR / 'validator.py', TRACK_DIR.parent / 'track-07-api-quality-scorecard' / 'scorecard.py')
+
+# Imported only by the code paths that need them; --help and --version must not load them
+HEAVY_MODULES = ('yaml', 'jsonschema', 'fastjsonschema', 'openapi_spec_validator', 'referencing',
+                 'requests', 'multiprocessing', 'xml.sax', 'dotenv', 'numpy', 'jinja2', 'sqlite3')
+
+# Arguments that must be served without the heavy modules
+FAST_COMMANDS = (('--version',), ('--help',))
+
+# Absolute slack on top of the relative tolerance, for noise on very fast commands
+MIN_REGRESSION_MS = 5.0
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """Top-level modules and their cumulative import time in microseconds."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # Nested imports are indented under the module that triggered them
+        if name.startswith('  ') or not cumulative.strip().isdigit():
+            continue
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def imported_modules(stderr: str) -> List[str]:
+    """Every module (nested ones included) named in -X importtime output."""
+    return [line.rsplit('|', 1)[1].strip() for line in stderr.splitlines()
+            if line.startswith('import time:') and line.count('|') == 2 and 'imported package' not in line]
+
+
+def _importtime(argv: Sequence[str]) -> str:
+    process = subprocess.run([sys.executable, '-X', 'importtime', *argv], cwd=TRACK_DIR,
+                             capture_output=True, text=True)
+    return process.stderr
+
+
+def measure_command(cli: str, args: Sequence[str], repeat: int,
+                    interpreter: Dict[str, int]) -> Dict[str, Any]:
+    """Median import cost beyond a bare interpreter and wall time, and the heavy modules loaded."""
+    imports, wall, loaded = [], [], set()
+    for _ in range(repeat):
+        stderr = _importtime([cli, *args])
+        imports.append(sum(cost for name, cost in parse_importtime(stderr).items() if name not in interpreter))
+        loaded.update(imported_modules(stderr))
+
+        start = time.perf_counter()
+        subprocess.run([sys.executable, cli, *args], cwd=TRACK_DIR, capture_output=True)
+        wall.append(time.perf_counter() - start)
+
+    return {
+        'import_ms': round(statistics.median(imports) / 1000, 2),
+        'wall_ms': round(statistics.median(wall) * 1000, 1),
+        'heavy': sorted(name for name in HEAVY_MODULES if name in loaded),
+    }
+
+
+def run_benchmarks(clis: Sequence[str], repeat: int, spec: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Measure the fast commands of every CLI and, given a spec, one validation
+    run of the first CLI for comparison.
+    """
+    interpreter = parse_importtime(_importtime(['-c', 'pass']))
+    results = {}
+    for cli in clis:
+        for args in FAST_COMMANDS:
+            results[f'{os.path.basename(cli)} {" ".join(args)}'] = measure_command(cli, args, repeat, interpreter)
+    if spec:
+        results[f'{os.path.basename(clis[0])} SPEC'] = measure_command(clis[0], [spec], repeat, interpreter)
+    return {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+
+
+def check_fast_commands(current: Dict[str, Any]) -> List[str]:
+    """Fast commands that imported heavy modules."""
+    fast = tuple(' '.join(args) for args in FAST_COMMANDS)
+    return [f"{case} imported {', '.join(result['heavy'])}"
+            for case, result in current['results'].items()
+            if case.endswith(fast) and result['heavy']]
+
+
+def compare_to_baseline(current: Dict[str, Any], baseline: Dict[str, Any],
+                        tolerance: float) -> List[Dict[str, Any]]:
+    """Cases whose import or wall time grew by more than `tolerance` (a fraction) against the baseline."""
+    regressions = []
+    for case, result in current['results'].items():
+        before = baseline.get('results', {}).get(case)
+        if not before:
+            continue
+        for metric in ('import_ms', 'wall_ms'):
+            if not before[metric]:
+                continue
+            change = result[metric] / before[metric] - 1
+            if change > tolerance and result[metric] - before[metric] > MIN_REGRESSION_MS:
+                regressions.append({'case': case, 'metric': metric, 'baseline': before[metric],
+                                    'current': result[metric], 'change': round(change, 3)})
+    return regressions
+
+
+def format_table(current: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> str:
+    lines = [f"{'Case':<34} {'Imports ms':>11} {'Wall ms':>9} {'vs base':>8}  Heavy modules"]
+    for case, result in current['results'].items():
+        before = (baseline or {}).get('results', {}).get(case)
+        change = f"{result['wall_ms'] / before['wall_ms'] - 1:+.1%}" if before and before['wall_ms'] else ''
+        lines.append(f"{case:<34} {result['import_ms']:>11.1f} {result['wall_ms']:>9.1f} {change:>8}  "
+                     f"{', '.join(result['heavy']) or '-'}")
+    return "\n".join(lines)
+
+
+@click.command()
+@click.option('--cli', 'clis', multiple=True, type=click.Path(exists=True, dir_okay=False),
+              help='CLI scripts to measure (default: validator.py and the scorecard.py of track 07)')
+@click.option('--spec', type=click.Path(exists=True, dir_okay=False),
+              help='Also time a validation run of this spec, for comparison')
+@click.option('--repeat', type=click.IntRange(min=1), default=9, help='Timed runs per case; the median counts')
+@click.option('--baseline', type=click.Path(exists=True, dir_okay=False), help='Baseline JSON to compare against')
+@click.option('--tolerance', type=float, default=0.25, help='Allowed slowdown vs baseline (default: 0.25)')
+@click.option('--save-baseline', type=click.Path(dir_okay=False), help='Write results as a new baseline')
+@click.option('--output', '-o', type=click.Path(dir_okay=False), help='Write results as JSON')
+def main(clis, spec, repeat, baseline, tolerance, save_baseline, output):
+    """Benchmark CLI start-up and guard the fast paths against heavy imports."""
+    clis = [os.path.abspath(cli) for cli in clis] or [str(cli) for cli in DEFAULT_CLIS if cli.exists()]
+    current = run_benchmarks(clis, repeat, spec and os.path.abspath(spec))
+    baseline_data = None
+    if baseline:
+        with open(baseline, 'r', encoding='utf-8') as f:
+            baseline_data = json.load(f)
+
+    click.echo(format_table(current, baseline_data))
+    for path in filter(None, (output, save_baseline)):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+        click.echo(f"✅ Results saved to: {path}")
+
+    failures = check_fast_commands(current)
+    for failure in failures:
+        click.echo(f"❌ {failure}", err=True)
+    if baseline_data:
+        regressions = compare_to_baseline(current, baseline_data, tolerance)
+        for regression in regressions:
+            click.echo(f"❌ {regression['case']}: {regression['metric']} {regression['current']:.1f}, "
+                       f"{regression['change']:+.1%} vs baseline", err=True)
+        failures += regressions
+        if not regressions:
+            click.echo(f"✅ No case slowed down by more than {tolerance:.0%}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Validator benchmark corpus and regression harness.
+
+Generates specs that stress different parts of the engine (deep $ref
+chains, wide enums, thousands of paths, allOf/oneOf composition) at several
+scales, runs every validation level over them and reports throughput in
+operations per second and peak memory. Results can be saved as a baseline
+and later runs compared against it, failing when throughput drops by more
+than the tolerance.
+
+Usage:
+    python benchmarks/bench_validator.py --scale medium
+    python benchmarks/bench_validator.py --save-baseline benchmarks/baseline.json
+    python benchmarks/bench_validator.py --baseline benchmarks/baseline.json --tolerance 0.15
+"""
+
+import gc
+import importlib.util
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import click
+
+TRACK_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TRACK_DIR))
+
+from validator import LEVELS  # noqa: E402
+
+METHODS = ('get', 'post', 'put', 'delete')
+
+# Fast cases are repeated until at least this much time was spent timing them
+MIN_TIMED_SECONDS = 0.5
+
+# Generator arguments per scale; "large" is sized for release checks
+SCALES = {
+    'small': {'ref_chains': (20, 200), 'wide_enums': (500, 200), 'many_paths': (500,), 'composition': (5, 200)},
+    'medium': {'ref_chains': (50, 500), 'wide_enums': (2000, 250), 'many_paths': (2500,), 'composition': (6, 300)},
+    'large': {'ref_chains': (200, 2000), 'wide_enums': (10000, 1000), 'many_paths': (10000,), 'composition': (8, 1500)},
+}
+
+
+def _document(paths: Dict[str, Any], schemas: Dict[str, Any], title: str) -> Dict[str, Any]:
+    return {
+        'openapi': '3.0.3',
+        'info': {'title': title, 'version': '1.0.0', 'description': f'Benchmark corpus: {title}'},
+        'paths': paths,
+        'components': {'schemas': schemas},
+    }
+
+
+def _operation(name: str, schema_ref: Optional[str] = None, parameters: Optional[List] = None) -> Dict[str, Any]:
+    content = {'application/json': {'schema': {'$ref': schema_ref} if schema_ref else {'type': 'object'}}}
+    return {
+        'operationId': name,
+        'description': f'Benchmark operation {name} with a realistic description',
+        'parameters': parameters or [],
+        'responses': {
+            '200': {'description': 'Success', 'content': content},
+            '404': {'description': 'Not found'},
+        },
+    }
+
+
+def ref_chains(depth: int, paths: int) -> Dict[str, Any]:
+    """Operations whose response schema is the head of a `depth`-long $ref chain."""
+    schemas = {f'Link{i}': {'type': 'object', 'properties': {
+        'id': {'type': 'integer'},
+        'next': {'$ref': f'#/components/schemas/Link{i + 1}'}}} for i in range(depth - 1)}
+    schemas[f'Link{depth - 1}'] = {'type': 'object', 'properties': {'id': {'type': 'integer'}}}
+    spec_paths = {f'/chain{i}/{{id}}': {'get': _operation(
+        f'getChain{i}', '#/components/schemas/Link0',
+        [{'name': 'id', 'in': 'path', 'required': True, 'description': 'Chain id', 'schema': {'type': 'integer'}}])}
+        for i in range(paths)}
+    return _document(spec_paths, schemas, 'ref chains')
+
+
+def wide_enums(width: int, paths: int) -> Dict[str, Any]:
+    """Parameters and schemas carrying enums with `width` values."""
+    values = [f'value_{i}' for i in range(width)]
+    schemas = {'Status': {'type': 'string', 'enum': values}}
+    spec_paths = {f'/things{i}': {'get': _operation(
+        f'listThings{i}', '#/components/schemas/Status',
+        [{'name': 'status', 'in': 'query', 'description': 'Filter by status',
+          'schema': {'type': 'string', 'enum': values}}])}
+        for i in range(paths)}
+    return _document(spec_paths, schemas, 'wide enums')
+
+
+def many_paths(paths: int) -> Dict[str, Any]:
+    """Thousands of path items with four operations each."""
+    schemas = {'Item': {'type': 'object', 'properties': {'id': {'type': 'integer'}, 'name': {'type': 'string'}}}}
+    spec_paths = {}
+    for i in range(paths):
+        parameter = {'name': 'itemId', 'in': 'path', 'required': True, 'description': 'Item id',
+                     'schema': {'type': 'integer'}}
+        spec_paths[f'/resource{i}/{{itemId}}'] = {
+            method: _operation(f'{method}Resource{i}', '#/components/schemas/Item', [parameter])
+            for method in METHODS
+        }
+    return _document(spec_paths, schemas, 'many paths')
+
+
+def composition(depth: int, paths: int) -> Dict[str, Any]:
+    """Schemas nesting allOf/oneOf/anyOf `depth` levels deep."""
+    def composed(level: int) -> Dict[str, Any]:
+        if level == 0:
+            return {'type': 'object', 'properties': {'leaf': {'type': 'string'}}}
+        keyword = ('allOf', 'oneOf', 'anyOf')[level % 3]
+        return {keyword: [composed(level - 1), {'$ref': '#/components/schemas/Base'}]}
+
+    schemas = {'Base': {'type': 'object', 'properties': {'id': {'type': 'integer'}}}}
+    schemas.update({f'Composite{i}': composed(depth) for i in range(paths)})
+    spec_paths = {f'/composite{i}': {'post': _operation(f'createComposite{i}', f'#/components/schemas/Composite{i}')}
+                  for i in range(paths)}
+    return _document(spec_paths, schemas, 'composition')
+
+
+CORPUS: Dict[str, Callable[..., Dict[str, Any]]] = {
+    'ref_chains': ref_chains,
+    'wide_enums': wide_enums,
+    'many_paths': many_paths,
+    'composition': composition,
+}
+
+
+def load_cli():
+    """validator.py, which the validator/ package shadows on a plain import."""
+    spec = importlib.util.spec_from_file_location('validator_cli', TRACK_DIR / 'validator.py')
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['validator_cli'] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def measure(run: Callable[[], Dict[str, Any]], repeat: int) -> Dict[str, Any]:
+    """
+    Best wall time over at least `repeat` runs (more for fast cases, until
+    MIN_TIMED_SECONDS have passed), then peak traced memory of one more run.
+    """
+    best = float('inf')
+    results = None
+    runs = 0
+    started = time.perf_counter()
+    while runs < repeat or time.perf_counter() - started < MIN_TIMED_SECONDS:
+        gc.collect()
+        start = time.perf_counter()
+        results = run()
+        best = min(best, time.perf_counter() - start)
+        runs += 1
+
+    # tracemalloc slows allocation down, so memory is measured on a separate run
+    gc.collect()
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    operations = results['summary']['total_operations']
+    return {
+        'operations': operations,
+        'findings': sum(len(results[bucket]) for bucket in ('errors', 'warnings', 'info')),
+        'seconds': round(best, 5),
+        'ops_per_sec': round(operations / best, 1) if best else 0.0,
+        'peak_mb': round(peak / 2 ** 20, 2),
+    }
+
+
+def run_benchmarks(scale: str, repeat: int, levels=LEVELS, names=None) -> Dict[str, Any]:
+    """
+    Time load + validation of every corpus spec at every level.
+
+    Specs are written to JSON files first so each case measures what a CLI
+    run does: parse, position index, rules and result bucketing.
+    """
+    cli = load_cli()
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='validator-bench-') as workdir:
+        for name, generator in CORPUS.items():
+            if names and name not in names:
+                continue
+            spec_path = os.path.join(workdir, f'{name}.json')
+            with open(spec_path, 'w', encoding='utf-8') as f:
+                json.dump(generator(*SCALES[scale][name]), f)
+
+            for level in levels:
+                def run():
+                    spec, positions = cli.load_document(spec_path)
+                    return cli.run_validation(spec, level, None, False, positions=positions)
+                results[f'{name}/{level}'] = measure(run, repeat)
+    return {
+        'scale': scale,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+
+
+def compare_to_baseline(current: Dict[str, Any], baseline: Dict[str, Any],
+                        tolerance: float) -> List[Dict[str, Any]]:
+    """Cases whose throughput dropped by more than `tolerance` (a fraction) against the baseline."""
+    regressions = []
+    for case, result in current['results'].items():
+        before = baseline.get('results', {}).get(case)
+        if not before or not before['ops_per_sec']:
+            continue
+        change = result['ops_per_sec'] / before['ops_per_sec'] - 1
+        if change < -tolerance:
+            regressions.append({'case': case, 'baseline_ops_per_sec': before['ops_per_sec'],
+                                'ops_per_sec': result['ops_per_sec'], 'change': round(change, 3)})
+    return regressions
+
+
+def format_table(current: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> str:
+    lines = [f"{'Case':<28} {'Ops':>7} {'Findings':>9} {'Ops/sec':>11} {'Peak MB':>9} {'vs base':>8}"]
+    for case, result in current['results'].items():
+        before = (baseline or {}).get('results', {}).get(case)
+        change = f"{result['ops_per_sec'] / before['ops_per_sec'] - 1:+.1%}" if before else ''
+        lines.append(f"{case:<28} {result['operations']:>7} {result['findings']:>9} "
+                     f"{result['ops_per_sec']:>11,.0f} {result['peak_mb']:>9.1f} {change:>8}")
+    return "\n".join(lines)
+
+
+@click.command()
+@click.option('--scale', type=click.Choice(list(SCALES)), default='small', help='Corpus size (default: small)')
+@click.option('--repeat', type=click.IntRange(min=1), default=3, help='Timed runs per case; the best counts')
+@click.option('--level', 'levels', multiple=True, type=click.Choice(LEVELS), help='Levels to run (default: all)')
+@click.option('--case', 'names', multiple=True, type=click.Choice(list(CORPUS)), help='Corpus specs to run (default: all)')
+@click.option('--baseline', type=click.Path(exists=True, dir_okay=False), help='Baseline JSON to compare against')
+@click.option('--tolerance', type=float, default=0.15, help='Allowed throughput drop vs baseline (default: 0.15)')
+@click.option('--save-baseline', type=click.Path(dir_okay=False), help='Write results as a new baseline')
+@click.option('--output', '-o', type=click.Path(dir_okay=False), help='Write results as JSON')
+def main(scale, repeat, levels, names, baseline, tolerance, save_baseline, output):
+    """Benchmark validator throughput and memory across a generated corpus."""
+    current = run_benchmarks(scale, repeat, levels or LEVELS, names)
+    baseline_data = None
+    if baseline:
+        with open(baseline, 'r', encoding='utf-8') as f:
+            baseline_data = json.load(f)
+        if baseline_data.get('scale') != scale:
+            click.echo(f"⚠️  Baseline was recorded at scale {baseline_data.get('scale')}, not {scale}", err=True)
+
+    click.echo(format_table(current, baseline_data))
+    for path in filter(None, (output, save_baseline)):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+        click.echo(f"✅ Results saved to: {path}")
+
+    if baseline_data:
+        regressions = compare_to_baseline(current, baseline_data, tolerance)
+        for regression in regressions:
+            click.echo(f"❌ {regression['case']}: {regression['ops_per_sec']:,.0f} ops/sec, "
+                       f"{regression['change']:+.1%} vs baseline", err=True)
+        if regressions:
+            sys.exit(1)
+        click.echo(f"✅ No case regressed by more than {tolerance:.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""Shared fixtures for the validator tests."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+TRACK_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TRACK_DIR))
+
+
+@pytest.fixture(scope='session')
+def cli():
+    """The validator.py CLI module (the validator/ package shadows it on import)."""
+    spec = importlib.util.spec_from_file_location('validator_cli', TRACK_DIR / 'validator.py')
+    module = importlib.util.module_from_spec(spec)
+    # Registered so batch workers can pickle functions defined in the CLI
+    sys.modules['validator_cli'] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def petstore():
+    return {
+        'openapi': '3.0.0',
+        'info': {'title': 'Pets', 'version': '1.0.0'},
+        'paths': {
+            '/pets': {
+                'get': {
+                    'operationId': 'listPets',
+                    'description': 'List every pet in the store',
+                    'parameters': [{'name': 'limit', 'in': 'query', 'schema': {'type': 'integer'}}],
+                    'requestBody': {'content': {'application/json': {'schema': {'type': 'object'}}}},
+                    'responses': {'200': {'description': 'OK'}}
+                }
+            },
+            '/pets/{petId}': {
+                'delete': {
+                    'responses': {
+                        '204': {'description': 'Deleted'},
+                        '404': {'$ref': '#/components/responses/Missing'}
+                    }
+                }
+            }
+        },
+        'components': {
+            'schemas': {'Pet': {'type': 'object', 'properties': {'id': {'type': 'integer'}}}},
+            'responses': {}
+        }
+    }
+
+
+class SpecServer:
+    """Local HTTP server for remote-spec tests: ETag/Last-Modified, gzip, request log."""
+
+    def __init__(self):
+        import gzip
+        import hashlib
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        self.documents = {}
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # keep-alive, so the client's connection pool is exercised
+
+            def do_GET(self):
+                if self.path not in server.documents:
+                    server.requests.append((self.path, 404))
+                    self.send_error(404)
+                    return
+                body, content_type = server.documents[self.path]
+                etag = '"%s"' % hashlib.md5(body).hexdigest()
+                if self.headers.get('If-None-Match') == etag:
+                    server.requests.append((self.path, 304))
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                server.requests.append((self.path, 200))
+                if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                    body = gzip.compress(body)
+                    self.send_response(200)
+                    self.send_header('Content-Encoding', 'gzip')
+                else:
+                    self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('ETag', etag)
+                self.send_header('Last-Modified', 'Mon, 19 Oct 2026 09:00:00 GMT')
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, args=(0.05,), daemon=True)
+        self.thread.start()
+
+    def url(self, path):
+        return f'http://127.0.0.1:{self.httpd.server_port}{path}'
+
+    def publish(self, path, text, content_type='application/json'):
+        self.documents[path] = (text.encode('utf-8'), content_type)
+        return self.url(path)
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def spec_server():
+    server = SpecServer()
+    yield server
+    server.close()
@@ -0,0 +1,56 @@
+"""Tests for batch validation of directories and globs."""
+
+import json
+import xml.etree.ElementTree as ET
+
+from click.testing import CliRunner
+
+from validator.batch import expand_spec_paths, is_batch_request, run_batch, summarize_batch
+
+
+def write_specs(tmp_path, petstore):
+    good = dict(petstore, paths={'/pets': petstore['paths']['/pets']})
+    broken = dict(good, info={'title': 'Broken'})  # missing info.version
+    (tmp_path / 'nested').mkdir()
+    (tmp_path / 'good.json').write_text(json.dumps(good))
+    (tmp_path / 'nested' / 'broken.json').write_text(json.dumps(broken))
+    (tmp_path / 'nested' / 'garbage.yaml').write_text('- just\n- a list\n')
+    (tmp_path / 'notes.txt').write_text('not a spec')
+
+
+def test_expand_spec_paths(tmp_path, petstore):
+    write_specs(tmp_path, petstore)
+    from_dir = expand_spec_paths([str(tmp_path)])
+    assert [p[len(str(tmp_path)) + 1:] for p in from_dir] == [
+        'good.json', 'nested/broken.json', 'nested/garbage.yaml']
+    from_glob = expand_spec_paths([str(tmp_path / '**' / '*.json'), str(tmp_path / 'good.json')])
+    assert len(from_glob) == 2
+    assert is_batch_request([str(tmp_path)]) and not is_batch_request([str(tmp_path / 'good.json')])
+
+
+def test_batch_summary_matches_per_file_runs(cli, tmp_path, petstore):
+    write_specs(tmp_path, petstore)
+    paths = expand_spec_paths([str(tmp_path)])
+    seen = []
+    worker = lambda path: cli.validate_spec_file(path, 'semantic', None, False)
+    results = run_batch(paths, worker, 1, seen.append)
+
+    assert [r['spec'] for r in results] == sorted(paths) and len(seen) == 3
+    assert [r['status'] for r in results] == ['passed', 'failed', 'error']
+    summary = summarize_batch(results, 'semantic')['summary']
+    assert (summary['passed'], summary['failed'], summary['errored']) == (1, 1, 1)
+
+
+def test_batch_cli_junit(cli, tmp_path, petstore):
+    write_specs(tmp_path, petstore)
+    report = tmp_path / 'report.xml'
+    result = CliRunner().invoke(cli.main, [str(tmp_path / 'nested'), str(tmp_path / 'good.json'),
+                                           '--format', 'junit', '--output', str(report), '-j', '2'])
+    assert result.exit_code == 1
+
+    root = ET.parse(report).getroot()
+    assert root.get('tests') == '3' and root.get('failures') == '1' and root.get('errors') == '1'
+    suites = {suite.get('name').rsplit('/', 1)[-1]: suite for suite in root}
+    assert suites['broken.json'].find('testcase/failure') is not None
+    assert 'info.version' in suites['broken.json'].find('testcase/failure').text
+    assert suites['garbage.yaml'].find('testcase/error') is not None
@@ -0,0 +1,20 @@
+"""Tests for the benchmark corpus and baseline comparison."""
+
+from benchmarks.bench_validator import CORPUS, compare_to_baseline
+
+
+def test_corpus_specs_are_clean(cli):
+    # A clean corpus means timings measure traversal, not finding construction
+    for name, generator in CORPUS.items():
+        args = (3,) if name == 'many_paths' else (3, 4)
+        results = cli.run_validation(generator(*args), 'agent-ready', None, False)
+        assert results['summary']['total_operations'] > 0
+        assert not results['errors'] and not results['warnings'], name
+
+
+def test_compare_to_baseline_flags_only_regressions():
+    baseline = {'results': {'a/syntax': {'ops_per_sec': 1000.0}, 'b/syntax': {'ops_per_sec': 1000.0}}}
+    current = {'results': {'a/syntax': {'ops_per_sec': 800.0}, 'b/syntax': {'ops_per_sec': 900.0},
+                           'c/syntax': {'ops_per_sec': 1.0}}}
+    regressions = compare_to_baseline(current, baseline, tolerance=0.15)
+    assert [(r['case'], r['change']) for r in regressions] == [('a/syntax', -0.2)]
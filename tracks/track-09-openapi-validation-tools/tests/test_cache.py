@@ -0,0 +1,148 @@
+"""Tests for the incremental findings cache."""
+
+import copy
+import importlib.util
+import sys
+
+from validator import registry
+from validator.cache import FindingsCache, ruleset_key, run_incremental
+from validator.engine import Rule
+
+
+def make_spec():
+    return {
+        'openapi': '3.0.0',
+        'info': {'title': 'Shop', 'version': '1.0.0'},
+        'paths': {
+            '/orders': {'get': {'responses': {'200': {'$ref': '#/components/responses/Orders'}}}},
+            '/users': {'get': {'responses': {'200': {'description': 'Users'}}}},
+        },
+        'components': {
+            'responses': {'Orders': {'description': 'Orders', 'content': {
+                'application/json': {'schema': {'$ref': '#/components/schemas/Order'}}}}},
+            'schemas': {'Order': {'type': 'object'}},
+        }
+    }
+
+
+def validate(spec, cache, level='agent-ready'):
+    return run_incremental(spec, registry.select(level), None, cache, level)
+
+
+def test_unchanged_spec_replays_every_unit(tmp_path):
+    path = str(tmp_path / 'cache.json')
+    first = validate(make_spec(), FindingsCache(path))
+
+    cache = FindingsCache(path)
+    second = validate(make_spec(), cache)
+
+    assert second == first
+    assert cache.checked == 0
+    assert cache.reused == 5
+
+
+def test_changed_component_rechecks_its_ref_dependents(tmp_path):
+    path = str(tmp_path / 'cache.json')
+    validate(make_spec(), FindingsCache(path))
+
+    spec = make_spec()
+    del spec['components']['schemas']['Order']
+    cache = FindingsCache(path)
+    result = validate(spec, cache)
+
+    # The root sees component names, the response $refs the removed schema
+    # and /orders $refs the response
+    assert cache.checked == 3
+    assert cache.reused == 1
+    assert any(f['rule'] == 'reference_resolution' for f in result['findings'])
+
+
+def test_incremental_results_match_a_full_run(tmp_path):
+    path = str(tmp_path / 'cache.json')
+    validate(make_spec(), FindingsCache(path))
+
+    spec = make_spec()
+    spec['paths']['/users']['get']['operationId'] = 'listUsers'
+    spec['paths']['/users']['get']['description'] = 'List every registered user'
+    cache = FindingsCache(path)
+    incremental = validate(spec, cache)
+    full = validate(copy.deepcopy(spec), FindingsCache(str(tmp_path / 'cold.json')))
+
+    assert cache.checked == 1
+    assert incremental == full
+
+
+def test_rule_set_change_invalidates_the_cache(tmp_path):
+    path = str(tmp_path / 'cache.json')
+    validate(make_spec(), FindingsCache(path), level='syntax')
+
+    cache = FindingsCache(path)
+    validate(make_spec(), cache, level='semantic')
+    assert cache.reused == 0
+
+
+def test_refs_outside_unit_sections_and_non_ascii_refs_are_tracked(tmp_path):
+    def spec_with(example):
+        spec = make_spec()
+        spec['paths']['/users']['get']['responses']['200'] = {'description': 'Users', 'content': {
+            'application/json': {'examples': {'one': {'$ref': '#/components/examples/User'}}}}}
+        spec['paths']['/kunden'] = {'get': {'responses': {'200': {'$ref': '#/components/responses/Kündigung'}}}}
+        spec['components']['responses']['Kündigung'] = {'description': 'Gekündigt'}
+        spec['components']['examples'] = {'User': {'value': example}}
+        return spec
+
+    path = str(tmp_path / 'cache.json')
+    validate(spec_with({'name': 'Ada'}), FindingsCache(path))
+
+    # The example belongs to the document unit, which /users now depends on
+    cache = FindingsCache(path)
+    validate(spec_with({'name': 'Grace'}), cache)
+    assert cache.checked == 2
+
+    spec = spec_with({'name': 'Grace'})
+    spec['components']['responses']['Kündigung']['description'] = 'Storniert'
+    cache = FindingsCache(path)
+    validate(spec, cache)
+    assert cache.checked == 2  # the response and /kunden, which $refs it
+
+
+def test_spec_version_is_part_of_every_unit_key(tmp_path):
+    path = str(tmp_path / 'cache.json')
+    settings = {'schema_check': 'collect-all'}
+    run_incremental(make_spec(), registry.select('syntax'), settings, FindingsCache(path), 'syntax')
+
+    spec = make_spec()
+    spec['openapi'] = '3.1.0'
+    cache = FindingsCache(path)
+    incremental = run_incremental(spec, registry.select('syntax'), settings, cache, 'syntax')
+    full = run_incremental(copy.deepcopy(spec), registry.select('syntax'), settings,
+                           FindingsCache(str(tmp_path / 'cold.json')), 'syntax')
+    assert cache.reused == 0
+    assert incremental == full
+
+
+def test_rule_set_key_covers_constants_and_module_source(tmp_path):
+    def check_length(node, context):
+        return node if len(node) > 10 else None
+
+    def check_longer(node, context):
+        return node if len(node) > 20 else None
+
+    def key(check):
+        return ruleset_key([Rule('length', check, 'syntax', ('document',))], None)
+
+    assert key(check_length) != key(check_longer)
+
+    # A module-level constant the check reads is not part of its code object
+    source = tmp_path / 'length_rules.py'
+    source.write_text('MIN_LENGTH = 10\n\n\ndef check(node, context):\n    return len(node) > MIN_LENGTH\n')
+    module_spec = importlib.util.spec_from_file_location('length_rules', source)
+    module = importlib.util.module_from_spec(module_spec)
+    sys.modules['length_rules'] = module
+    try:
+        module_spec.loader.exec_module(module)
+        before = key(module.check)
+        source.write_text('MIN_LENGTH = 20\n\n\ndef check(node, context):\n    return len(node) > MIN_LENGTH\n')
+        assert key(module.check) != before
+    finally:
+        del sys.modules['length_rules']
@@ -0,0 +1,80 @@
+"""Tests for the validation daemon and its thin client."""
+
+import json
+import socket
+import threading
+import time
+
+import pytest
+
+from validator import client, daemon
+
+from test_parallel import make_spec
+
+
+@pytest.fixture
+def daemon_socket(cli, tmp_path):
+    """A daemon served from a background thread; yields its socket path."""
+    socket_path = str(tmp_path / 'validator.sock')
+    thread = threading.Thread(target=cli.serve_daemon, args=(socket_path, None, 1, False), daemon=True)
+    thread.start()
+    for _ in range(100):
+        try:
+            daemon.request(socket_path, {'command': 'ping'}, timeout=1)
+            break
+        except OSError:
+            time.sleep(0.02)
+    yield socket_path
+    daemon.request(socket_path, {'command': 'shutdown'})
+    thread.join(timeout=5)
+
+
+def test_warm_requests_reuse_documents_and_findings(daemon_socket, tmp_path):
+    spec_path = tmp_path / 'api.json'
+    spec = make_spec(20)
+    spec_path.write_text(json.dumps(spec))
+
+    first = daemon.request(daemon_socket, {'path': str(spec_path), 'format': 'json'})
+    second = daemon.request(daemon_socket, {'path': str(spec_path), 'format': 'json'})
+    assert first['ok'] and json.loads(first['report'])['errors'] == json.loads(second['report'])['errors']
+    assert second['summary']['cache']['checked_units'] == 0
+
+    spec['paths']['/items3/{id}']['get']['description'] = 'Changed description of this operation'
+    spec_path.write_text(json.dumps(spec))
+    third = daemon.request(daemon_socket, {'path': str(spec_path)})
+    assert third['summary']['cache']['checked_units'] == 1
+
+    stats = daemon.request(daemon_socket, {'command': 'stats'})
+    assert (stats['parsed'], stats['reused'], stats['requests']) == (2, 1, 3)
+
+
+def test_buffers_and_bad_requests(daemon_socket, tmp_path):
+    spec_path = tmp_path / 'api.yaml'
+    spec_path.write_text('openapi: 3.0.0\ninfo: {title: Disk, version: "1"}\npaths: {}\n')
+    buffer = 'openapi: 3.0.0\ninfo:\n  title: Buffer\npaths: {}\n'
+
+    response = daemon.request(daemon_socket, {'path': str(spec_path), 'content': buffer, 'level': 'syntax',
+                                              'format': 'json'})
+    report = json.loads(response['report'])
+    assert report['spec_info']['title'] == 'Buffer' and response['exit_code'] == 1
+    assert [f['field'] for f in report['errors']] == ['info.version']
+
+    assert not daemon.request(daemon_socket, {'path': str(spec_path), 'level': 'pedantic'})['ok']
+    assert 'FileNotFoundError' in daemon.request(daemon_socket, {'path': str(tmp_path / 'gone.yaml')})['error']
+    with pytest.raises(RuntimeError, match='already listening'):
+        daemon.serve(daemon_socket, lambda request: {})
+
+
+def test_client_prints_report_and_exits_like_the_cli(daemon_socket, tmp_path, capsys):
+    spec_path = tmp_path / 'api.yaml'
+    spec_path.write_text('openapi: 3.0.0\ninfo: {title: Pets, version: "1"}\npaths: {}\n')
+    assert client.main(['--socket', daemon_socket, '--ping']) == 0
+    assert client.main(['--socket', daemon_socket, str(spec_path), '--level', 'syntax']) == 0
+    assert 'Validation Report' in capsys.readouterr().out
+
+    stale = str(tmp_path / 'stale.sock')
+    dead = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    dead.bind(stale)
+    dead.close()
+    assert client.main(['--socket', stale, str(spec_path)]) == 1
+    assert 'cannot reach' in capsys.readouterr().err
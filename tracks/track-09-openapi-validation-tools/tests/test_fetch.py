@@ -0,0 +1,59 @@
+"""Tests for fetching remote specs against a local HTTP server."""
+
+import json
+
+import yaml
+from click.testing import CliRunner
+
+from validator.fetch import SpecFetcher
+
+
+def test_unchanged_spec_costs_a_304(spec_server, tmp_path, petstore):
+    url = spec_server.publish('/specs/pets.json', json.dumps(petstore))
+    with SpecFetcher(str(tmp_path)) as fetcher:
+        first = fetcher.fetch(url)
+        second = fetcher.fetch(url)
+    assert not first.from_cache and second.from_cache
+    assert json.loads(second.text) == petstore and second.is_json
+    assert spec_server.requests == [('/specs/pets.json', 200), ('/specs/pets.json', 304)]
+
+    # A changed document is downloaded again; a new fetcher reuses the disk cache
+    spec_server.publish('/specs/pets.json', json.dumps(dict(petstore, openapi='3.1.0')))
+    with SpecFetcher(str(tmp_path)) as fetcher:
+        assert json.loads(fetcher.fetch(url).text)['openapi'] == '3.1.0'
+        assert fetcher.downloads == 1 and fetcher.not_modified == 0
+
+
+def test_fetch_many_reports_failures(spec_server, tmp_path, petstore):
+    urls = [spec_server.publish(f'/specs/{i}.yaml', yaml.safe_dump(petstore), 'application/yaml')
+            for i in range(5)]
+    missing = spec_server.url('/specs/missing.yaml')
+    with SpecFetcher(str(tmp_path)) as fetcher:
+        errors = fetcher.fetch_many(urls + [missing])
+    assert [url for url, error in errors.items() if error] == [missing]
+    assert 'HTTP 404' in errors[missing]
+
+    # Workers read prefetched bodies without going back to the server
+    requests_before = len(spec_server.requests)
+    with SpecFetcher(str(tmp_path), revalidate=False) as fetcher:
+        assert yaml.safe_load(fetcher.fetch(urls[0]).text) == petstore
+    assert len(spec_server.requests) == requests_before
+
+
+def test_cli_validates_remote_specs(cli, spec_server, tmp_path, petstore):
+    url = spec_server.publish('/pets.yaml', yaml.safe_dump(petstore), 'application/yaml')
+    cache_dir = str(tmp_path / 'cache')
+    runner = CliRunner()
+    args = [url, '--cache', cache_dir, '-f', 'json', '-o', str(tmp_path / 'out.json')]
+    runner.invoke(cli.main, args)
+    runner.invoke(cli.main, args)
+    assert [status for _, status in spec_server.requests] == [200, 304]
+    results = json.loads((tmp_path / 'out.json').read_text())
+    assert results['errors'] and all('line' in error for error in results['errors'])
+
+    missing = spec_server.url('/gone.json')
+    result = runner.invoke(cli.main, [url, missing, '-f', 'json', '-o', str(tmp_path / 'batch.json')])
+    assert result.exit_code == 1 and 'HTTP 404' in result.output
+    statuses = {entry['spec']: entry['status'] for entry in
+                json.loads((tmp_path / 'batch.json').read_text())['files']}
+    assert statuses == {url: 'failed', missing: 'error'}
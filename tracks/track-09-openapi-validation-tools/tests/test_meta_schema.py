@@ -0,0 +1,66 @@
+"""Tests for validation against the OpenAPI meta-schema."""
+
+import copy
+
+import pytest
+
+from validator import meta_schema
+
+SPEC = {
+    'openapi': '3.0.3',
+    'info': {'title': 'Pets', 'version': '1.0.0'},
+    'paths': {
+        '/pets': {'get': {'operationId': 'listPets', 'responses': {'200': {'description': 'OK'}}}},
+    },
+    'components': {
+        'schemas': {'Pet': {'type': 'object', 'properties': {'id': {'type': 'integer'}}}},
+        'parameters': {'limit': {'name': 'limit', 'in': 'query', 'schema': {'type': 'integer'}}},
+    },
+}
+
+
+def schema_findings(cli, spec, mode):
+    results = cli.run_validation(spec, 'syntax', None, False, schema_check=mode)
+    return [f for f in results['errors'] if f['rule'] == 'openapi_schema']
+
+
+def test_valid_spec_passes_both_versions(cli):
+    assert schema_findings(cli, SPEC, 'collect-all') == []
+    spec31 = dict(copy.deepcopy(SPEC), openapi='3.1.0')
+    assert schema_findings(cli, spec31, 'collect-all') == []
+    # Validators are compiled once per version and unit kind
+    before = meta_schema.compiled_validator.cache_info().currsize
+    schema_findings(cli, SPEC, 'collect-all')
+    assert meta_schema.compiled_validator.cache_info().currsize == before
+
+
+def test_violations_point_at_the_offending_field(cli):
+    spec = copy.deepcopy(SPEC)
+    operation = spec['paths']['/pets']['get']
+    operation['responses'] = 'none'
+    operation['deprecated'] = 'yes'
+    spec['components']['parameters']['limit']['in'] = 'body'
+    spec['info']['title'] = 42
+
+    collected = schema_findings(cli, spec, 'collect-all')
+    pointers = {f['pointer'] for f in collected}
+    assert {'/info/title', '/paths/~1pets/get/deprecated', '/paths/~1pets/get/responses'} <= pointers
+    assert any(p.startswith('/components/parameters/limit') for p in pointers)
+
+    # fail-fast stops at the first violation of each unit (root, path item, component)
+    assert len(schema_findings(cli, spec, 'fail-fast')) == 3
+    assert schema_findings(cli, spec, 'off') == []
+
+
+def test_schema_check_setting_from_config(cli, tmp_path):
+    config = tmp_path / 'validator.yaml'
+    config.write_text('settings:\n  schema_check: fail-fast\n')
+    spec = copy.deepcopy(SPEC)
+    spec['paths']['/pets']['get']['deprecated'] = 'yes'
+    results = cli.run_validation(spec, 'syntax', str(config), False)
+    assert [f['pointer'] for f in results['errors'] if f['rule'] == 'openapi_schema'] == \
+        ['/paths/~1pets/get/deprecated']
+
+    config.write_text('settings:\n  schema_check: sometimes\n')
+    with pytest.raises(ValueError, match='schema_check'):
+        cli.load_config(str(config))
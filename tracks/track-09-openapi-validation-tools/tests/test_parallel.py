@@ -0,0 +1,74 @@
+"""Tests for parallel rule execution."""
+
+import multiprocessing
+
+from validator import parallel
+from validator.parallel import chunk_units, run_parallel
+
+
+def make_spec(count):
+    paths = {
+        f'/items{i}/{{id}}': {
+            'get': {'requestBody': {}, 'responses': {'200': {'description': 'OK'}}},
+            'delete': {'operationId': f'delete{i}', 'responses': {'204': {}}}
+        }
+        for i in range(count)
+    }
+    return {'openapi': '3.0.0', 'info': {'title': 'Big', 'version': '1'}, 'paths': paths}
+
+
+def test_chunks_are_contiguous_and_cover_all_units():
+    units = list(range(10))
+    chunks = chunk_units(units, 4)
+    assert chunks == [[0, 1, 2], [3, 4, 5], [6, 7], [8, 9]]
+    assert chunk_units(units[:2], 4) == [[0], [1]]
+
+
+def test_parallel_findings_match_serial_order(monkeypatch):
+    monkeypatch.setattr(parallel, 'MIN_UNITS_PER_JOB', 5)
+    spec = make_spec(60)
+
+    serial = run_parallel(spec, 'agent-ready', jobs=1)
+    pooled = run_parallel(spec, 'agent-ready', jobs=3)
+
+    assert pooled == serial
+    assert pooled['stats']['total_operations'] == 120
+
+
+def test_small_specs_stay_in_process(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError('pool should not be started')
+
+    monkeypatch.setattr(multiprocessing, 'get_context', fail)
+    result = run_parallel(make_spec(3), 'semantic', jobs=8)
+    assert result['stats']['total_operations'] == 6
+
+
+PLUGIN = '''
+from validator import rule
+
+@rule('plugin_operation', level='semantic', kinds=('operation',), severity='info')
+def check_plugin_operation(node, context):
+    """Flags every operation."""
+    return [node.finding('plugin', 'seen by plugin')]
+'''
+
+
+def test_spawned_workers_load_the_parent_plugins(tmp_path, monkeypatch):
+    from validator import plugins, registry
+
+    monkeypatch.setattr(registry, 'rules', dict(registry.rules))
+    monkeypatch.setattr(plugins, '_PLUGIN_RULES', {})
+    monkeypatch.setattr(plugins, '_PLUGIN_DIRS', {})
+    monkeypatch.setattr(plugins, '_PLUGIN_STAMPS', {})
+    monkeypatch.setattr(parallel, 'MIN_UNITS_PER_JOB', 5)
+    # Spawned workers (the default on macOS and Windows) start with the built-in rules only
+    get_context = multiprocessing.get_context
+    monkeypatch.setattr(multiprocessing, 'get_context', lambda method=None: get_context('spawn'))
+    (tmp_path / 'flag_all.py').write_text(PLUGIN)
+    plugins.load_rule_plugin('flag_all.py', str(tmp_path))
+
+    serial = run_parallel(make_spec(20), 'semantic', jobs=1)
+    pooled = run_parallel(make_spec(20), 'semantic', jobs=2)
+    assert sum(finding['rule'] == 'plugin_operation' for finding in pooled['findings']) == 40
+    assert pooled == serial
@@ -0,0 +1,64 @@
+"""Tests for the parse-time position index."""
+
+import json
+
+import yaml
+
+from validator.cache import FindingsCache
+from validator.positions import PositionIndex, load_yaml_with_positions
+
+YAML_SPEC = """\
+openapi: 3.0.0
+info:
+  title: Pets
+paths:
+  /pets/{petId}:
+    get:
+      parameters:
+        - name: petId
+          in: path
+      responses:
+        404:
+          $ref: '#/components/responses/Missing'
+"""
+
+
+def test_yaml_index_matches_a_plain_load():
+    spec, index = load_yaml_with_positions(YAML_SPEC)
+    assert spec == yaml.safe_load(YAML_SPEC)
+    assert index.lookup('') == (1, 1)
+    assert index.lookup('/paths/~1pets~1{petId}/get') == (6, 5)
+    assert index.lookup('/paths/~1pets~1{petId}/get/parameters/0') == (8, 11)
+    assert index.lookup('/paths/~1pets~1{petId}/get/responses/404') == (11, 9)
+    # Missing nodes fall back to the closest ancestor
+    assert index.lookup('/info/version') == (2, 1)
+
+
+def test_json_index_handles_arrays_and_escapes():
+    text = json.dumps({'a': [1, {'b\\"/c': [None, 'x']}], 'd': {}}, indent=2)
+    index = PositionIndex.from_json(text)
+    lines = text.splitlines()
+    line, column = index.lookup('/a/1/b\\"~1c/1')
+    assert lines[line - 1][column - 1:] == '"x"'
+    line, column = index.lookup('/d')
+    assert lines[line - 1][column - 1:].startswith('"d"')
+    assert index.lookup('/a/0') == (3, 5)
+
+
+def test_findings_get_current_positions_from_cache(cli, tmp_path, petstore):
+    spec_path = tmp_path / 'spec.json'
+    spec_path.write_text(json.dumps(petstore, indent=2))
+    cache = FindingsCache(str(tmp_path / 'cache.json'))
+    spec, positions = cli.load_document(str(spec_path))
+    first = cli.run_validation(spec, 'semantic', None, False, cache=cache, positions=positions)
+
+    # Same content, shifted down two lines: findings are replayed, positions move
+    spec_path.write_text('\n\n' + json.dumps(petstore, indent=2))
+    cache = FindingsCache(str(tmp_path / 'cache.json'))
+    spec, positions = cli.load_document(str(spec_path))
+    second = cli.run_validation(spec, 'semantic', None, False, cache=cache, positions=positions)
+
+    assert cache.checked == 0 and first['errors']
+    for before, after in zip(first['errors'], second['errors']):
+        assert after['line'] == before['line'] + 2 and after['column'] == before['column']
+    assert '(line ' in cli.generate_console_report(second)
@@ -0,0 +1,56 @@
+"""Tests for per-rule timing and time budgets."""
+
+from validator import parallel, plugins, registry
+from validator.parallel import run_parallel
+
+from test_parallel import make_spec
+
+SLOW_PLUGIN = '''
+import time
+from validator import rule
+
+@rule('sleepy_operation', level='semantic', kinds=('operation',), severity='info')
+def check_sleepy_operation(node, context):
+    """Deliberately slow custom rule."""
+    time.sleep(0.01)
+    return ()
+'''
+
+
+def test_profile_counts_calls_and_findings(cli, petstore):
+    results = cli.run_validation(petstore, 'agent-ready', None, False, profile=True)
+    performance = results['summary']['performance']
+    rules = {entry['rule']: entry for entry in performance['rules']}
+
+    assert set(rules) == {r.id for r in registry.select('agent-ready')}
+    assert rules['missing_operation_id']['calls'] == results['summary']['total_operations']
+    found = sum(len(results[bucket]) for bucket in ('errors', 'warnings', 'info'))
+    assert sum(entry['findings'] for entry in rules.values()) == found
+    assert performance['over_budget'] == []
+    assert 'Rule Timings' in cli.generate_console_report(results)
+    assert 'performance' not in cli.run_validation(petstore, 'agent-ready', None, False)['summary']
+
+
+def test_pooled_timings_match_serial_counts(monkeypatch):
+    monkeypatch.setattr(parallel, 'MIN_UNITS_PER_JOB', 5)
+    spec = make_spec(60)
+    serial = run_parallel(spec, 'agent-ready', jobs=1, profile=True)['stats']['rule_timings']
+    pooled = run_parallel(spec, 'agent-ready', jobs=3, profile=True)['stats']['rule_timings']
+    assert {k: v[1:] for k, v in pooled.items()} == {k: v[1:] for k, v in serial.items()}
+
+
+def test_slow_plugin_rule_warns(cli, tmp_path, petstore, monkeypatch, capsys):
+    monkeypatch.setattr(registry, 'rules', dict(registry.rules))
+    monkeypatch.setattr(plugins, '_PLUGIN_RULES', {})
+    monkeypatch.setattr(plugins, '_PLUGIN_DIRS', {})
+    monkeypatch.setattr(plugins, '_PLUGIN_STAMPS', {})
+    (tmp_path / 'plugins').mkdir()
+    (tmp_path / 'plugins' / 'sleepy.py').write_text(SLOW_PLUGIN)
+    config = tmp_path / 'validator.yaml'
+    config.write_text('plugins:\n  - plugins/sleepy.py\nperformance:\n  budgets:\n    sleepy_operation: 5\n')
+
+    assert cli.load_config(str(config))['budgets'] == {'sleepy_operation': 5}
+    results = cli.run_validation(petstore, 'semantic', str(config), False)
+    over = results['summary']['performance']['over_budget']
+    assert [entry['rule'] for entry in over] == ['sleepy_operation'] and over[0]['time_ms'] >= 10
+    assert 'sleepy_operation took' in capsys.readouterr().err
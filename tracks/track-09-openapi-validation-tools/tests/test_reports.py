@@ -0,0 +1,31 @@
+"""Tests for the streaming reporters."""
+
+import json
+
+from click.testing import CliRunner
+
+
+def test_streamed_json_matches_results(cli, petstore):
+    results = cli.run_validation(petstore, 'agent-ready', None, False)
+    chunks = list(cli.chunk_lines(cli.json_report_lines(results), size=3))
+    assert len(chunks) > 1 and all(chunk.endswith('\n') for chunk in chunks)
+    assert json.loads(''.join(chunks)) == json.loads(json.dumps(results))
+
+
+def test_jsonl_one_finding_per_line(cli, petstore):
+    results = cli.run_validation(petstore, 'agent-ready', None, False)
+    records = [json.loads(line) for line in cli.generate_report(results, 'jsonl', False).splitlines()]
+    findings, trailer = records[:-1], records[-1]
+    assert len(findings) == sum(results['summary'][key] for key in
+                                ('total_errors', 'total_warnings', 'total_info'))
+    assert trailer['summary'] == results['summary'] and 'errors' not in trailer
+
+
+def test_cli_writes_streamed_report(cli, tmp_path, petstore):
+    spec_path = tmp_path / 'spec.json'
+    spec_path.write_text(json.dumps(petstore))
+    report = tmp_path / 'report.jsonl'
+    CliRunner().invoke(cli.main, [str(spec_path), '-f', 'jsonl', '-o', str(report)])
+    lines = report.read_text().splitlines()
+    assert all('line' in json.loads(line) for line in lines[:-1])
+    assert json.loads(lines[-1])['spec_info']['path'] == str(spec_path)
@@ -0,0 +1,146 @@
+"""Tests for the rule registry, single-pass engine and built-in rules."""
+
+from validator import RuleEngine, RuleRegistry, registry
+from validator.engine import OPERATION, SCHEMA, walk_spec
+
+
+def rule_ids(findings):
+    return sorted(finding['rule'] for finding in findings)
+
+
+def test_levels_include_lower_level_rules():
+    syntax = {r.id for r in registry.select('syntax')}
+    semantic = {r.id for r in registry.select('semantic')}
+    agent_ready = {r.id for r in registry.select('agent-ready')}
+
+    assert 'required_fields' in syntax and 'get_with_body' not in syntax
+    assert syntax < semantic < agent_ready
+    assert {r.level for r in registry.select('semantic', exact=True)} == {'semantic'}
+
+
+def test_overrides_change_severity_or_disable_rules():
+    rules = {r.id: r for r in registry.select('agent-ready', {'get_with_body': 'error',
+                                                              'missing_operation_id': 'off'})}
+    assert rules['get_with_body'].severity == 'error'
+    assert 'missing_operation_id' not in rules
+
+
+def test_engine_traverses_once_and_dispatches_by_kind(petstore):
+    seen = []
+    local = RuleRegistry()
+
+    @local.register('spy_operations', level='syntax', kinds=(OPERATION,))
+    def spy_operations(node, context):
+        seen.append((node.kind, node.location))
+        return ()
+
+    @local.register('spy_schemas', level='syntax', kinds=(SCHEMA,))
+    def spy_schemas(node, context):
+        seen.append((node.kind, node.location))
+        return ()
+
+    run = RuleEngine(local.select('syntax')).run(petstore)
+
+    assert run['stats']['total_operations'] == 2
+    assert ('operation', 'paths./pets.get') in seen
+    assert ('operation', 'paths./pets/{petId}.delete') in seen
+    assert ('schema', 'paths./pets.get.parameters[0].schema') in seen
+    assert ('schema', 'components.schemas.Pet.properties.id') in seen
+    assert not any(kind == 'parameter' for kind, _ in seen)
+
+
+def test_walker_only_descends_into_requested_kinds(petstore):
+    kinds = {node.kind for node in walk_spec(petstore, {OPERATION})}
+    assert kinds == {OPERATION}
+
+
+def test_builtin_rules_report_expected_findings(petstore):
+    findings = RuleEngine(registry.select('agent-ready')).run(petstore)['findings']
+    ids = rule_ids(findings)
+
+    assert 'get_with_body' in ids
+    assert 'reference_resolution' in ids
+    assert 'path_parameters_defined' in ids
+    assert 'missing_operation_id' in ids
+    assert 'missing_parameter_description' in ids
+    unresolved = next(f for f in findings if f['rule'] == 'reference_resolution')
+    assert unresolved['location'] == 'paths./pets/{petId}.delete.responses.404'
+    assert unresolved['severity'] == 'error'
+
+
+def test_run_validation_buckets_by_severity(cli, petstore):
+    results = cli.run_validation(petstore, 'semantic', None, False)
+
+    assert results['summary']['total_operations'] == 2
+    assert results['summary']['total_errors'] == len(results['errors'])
+    assert all(f['severity'] == 'error' for f in results['errors'])
+    assert all(f['severity'] == 'warning' for f in results['warnings'])
+    assert 'missing_operation_id' not in rule_ids(results['warnings'])
+
+
+def test_level_wrappers_run_only_their_own_rules(cli, petstore):
+    assert rule_ids(cli.validate_syntax(petstore, False)['errors']) == ['reference_resolution']
+    semantic = cli.validate_semantics(petstore, False)
+    assert 'get_with_body' in rule_ids(semantic['warnings'])
+    assert 'reference_resolution' not in rule_ids(semantic['errors'])
+
+
+def test_load_config_flattens_levels(cli, tmp_path):
+    config = tmp_path / 'config.yaml'
+    config.write_text(
+        'rules:\n'
+        '  semantic:\n'
+        '    get_with_body: error\n'
+        '  agent_ready:\n'
+        '    missing_parameter_description: off\n'
+        'settings:\n'
+        '  min_description_length: 40\n'
+    )
+    loaded = cli.load_config(str(config))
+    assert loaded['rules'] == {'get_with_body': 'error', 'missing_parameter_description': 'off'}
+    assert loaded['settings'] == {'min_description_length': 40}
+
+
+def test_trace_operations_are_checked_and_counted(cli, petstore):
+    petstore['paths']['/pets']['trace'] = {'responses': {'200': {'description': 'Echo'}}}
+    run = RuleEngine(registry.select('syntax')).run(petstore)
+    assert run['stats']['total_operations'] == 3
+    assert cli.count_operations(petstore) == 3
+
+
+def test_validate_url(cli):
+    assert cli.validate_url('https://api.example.com/openapi.yaml')
+    assert cli.validate_url('HTTP://localhost:8080/spec.json')
+    assert not cli.validate_url('http://')
+    assert not cli.validate_url('ftp://example.com/spec.yaml')
+    assert not cli.validate_url('specs/http-api.yaml')
+
+
+def test_same_plugin_path_in_different_config_dirs(cli, tmp_path, monkeypatch):
+    from validator import plugins
+
+    monkeypatch.setattr(registry, 'rules', dict(registry.rules))
+    monkeypatch.setattr(plugins, '_PLUGIN_RULES', {})
+    monkeypatch.setattr(plugins, '_PLUGIN_DIRS', {})
+    monkeypatch.setattr(plugins, '_PLUGIN_STAMPS', {})
+    plugin = (
+        'from validator.engine import rule\n\n\n'
+        "@rule('team_{name}', level='semantic', kinds=('operation',), severity='info')\n"
+        'def check(node, context):\n'
+        "    return [node.finding('team', '{name}')]\n"
+    )
+    configs = {}
+    for team in ('alpha', 'beta'):
+        (tmp_path / team / 'plugins').mkdir(parents=True)
+        (tmp_path / team / 'plugins' / 'rules.py').write_text(plugin.format(name=team))
+        configs[team] = tmp_path / team / 'validator.yaml'
+        configs[team].write_text('plugins:\n  - plugins/rules.py\n')
+
+    cli.load_config(str(configs['alpha']))
+    cli.load_config(str(configs['beta']))
+    assert {'team_alpha', 'team_beta'} <= set(registry.rules)
+
+    # An edited plugin is imported again and its old rules are dropped
+    (tmp_path / 'alpha' / 'plugins' / 'rules.py').write_text(plugin.format(name='gamma') + '\n')
+    cli.load_config(str(configs['alpha']))
+    assert 'team_gamma' in registry.rules and 'team_alpha' not in registry.rules
@@ -0,0 +1,31 @@
+"""Tests for the start-up benchmark and the CLI fast paths it guards."""
+
+from benchmarks.bench_startup import (DEFAULT_CLIS, check_fast_commands, compare_to_baseline,
+                                      imported_modules, parse_importtime, run_benchmarks)
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _json
+import time:       600 |        720 | json
+import time:      4000 |       4000 |     yaml.reader
+import time:       900 |       4900 | yaml
+"""
+
+
+def test_parse_importtime():
+    assert parse_importtime(IMPORTTIME) == {'json': 720, 'yaml': 4900}
+    assert imported_modules(IMPORTTIME) == ['_json', 'json', 'yaml.reader', 'yaml']
+
+
+def test_fast_commands_skip_heavy_imports():
+    current = run_benchmarks([str(cli) for cli in DEFAULT_CLIS], repeat=1)
+    assert set(current['results']) == {'validator.py --version', 'validator.py --help',
+                                       'scorecard.py --version', 'scorecard.py --help'}
+    assert check_fast_commands(current) == []
+
+
+def test_compare_to_baseline_ignores_noise_on_fast_commands():
+    baseline = {'results': {'a': {'import_ms': 10.0, 'wall_ms': 100.0}, 'b': {'import_ms': 2.0, 'wall_ms': 50.0}}}
+    current = {'results': {'a': {'import_ms': 40.0, 'wall_ms': 104.0}, 'b': {'import_ms': 4.0, 'wall_ms': 51.0}}}
+    regressions = compare_to_baseline(current, baseline, tolerance=0.25)
+    assert [(r['case'], r['metric']) for r in regressions] == [('a', 'import_ms')]
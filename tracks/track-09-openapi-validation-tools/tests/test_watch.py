@@ -0,0 +1,125 @@
+"""Tests for split-spec bundling and --watch."""
+
+import os
+import threading
+import time
+
+import yaml
+
+from validator import registry
+from validator.bundle import DocumentStore, SpecBundle
+from validator.cache import FindingsCache, run_incremental
+from validator.watch import watch_changes
+
+ROOT = {
+    'openapi': '3.0.3',
+    'info': {'title': 'Split', 'version': '1.0.0'},
+    'paths': {
+        '/users': {'$ref': 'paths/users.yaml'},
+        '/pets': {'$ref': 'paths/pets.yaml'},
+    },
+    'components': {'schemas': {'Pet': {'$ref': 'schemas.yaml#/Pet'}}},
+}
+
+
+def operation(name, description='An operation described well enough'):
+    return {'get': {'operationId': name, 'description': description,
+                    'responses': {'200': {'description': 'OK', 'content': {'application/json': {
+                        'schema': {'$ref': '../openapi.yaml#/components/schemas/Pet'}}}},
+                                  '404': {'description': 'Not found'}}}}
+
+
+def write_split_spec(directory):
+    (directory / 'paths').mkdir()
+    (directory / 'openapi.yaml').write_text(yaml.safe_dump(ROOT))
+    (directory / 'paths' / 'users.yaml').write_text(yaml.safe_dump(operation('listUsers')))
+    (directory / 'paths' / 'pets.yaml').write_text(yaml.safe_dump(operation('listPets')))
+    (directory / 'schemas.yaml').write_text(yaml.safe_dump({'Pet': {'$ref': '#/Animal'},
+                                                            'Animal': {'type': 'object'}}))
+    return str(directory / 'openapi.yaml')
+
+
+def test_bundle_inlines_refs_and_rebuilds_only_changed_files(cli, tmp_path):
+    root = write_split_spec(tmp_path)
+    store = DocumentStore(lambda text, name: cli.parse_document(text, False, name))
+    bundle = SpecBundle(root, store)
+    spec, positions = bundle.build()
+    assert spec['paths']['/users']['get']['operationId'] == 'listUsers'
+    assert spec['components']['schemas']['Pet'] == {'type': 'object'}
+    assert spec['paths']['/pets']['get']['responses']['200']['content']['application/json']['schema'] == \
+        {'$ref': '#/components/schemas/Pet'}
+    assert positions.lookup('/paths/~1pets/get/operationId') == (3, 3, os.path.join('paths', 'pets.yaml'))
+    assert len(bundle.files) == 4 and bundle.unresolved == []
+
+    cache = FindingsCache()
+    rules = registry.select('agent-ready')
+    run_incremental(spec, rules, None, cache, 'agent-ready')
+    users = spec['paths']['/users']
+    (tmp_path / 'paths' / 'pets.yaml').write_text(yaml.safe_dump(operation('listPets', 'Short')))
+    spec, positions = bundle.build()  # changes are detected by stat
+    assert spec['paths']['/users'] is users
+    run = run_incremental(spec, rules, None, cache, 'agent-ready')
+    assert (cache.checked, cache.reused) == (1, 3)
+    cli.attach_positions(run['findings'], positions)
+    assert [(f['location'], f['file'], f['line']) for f in run['findings']] == \
+        [('paths./pets.get', os.path.join('paths', 'pets.yaml'), 1)]
+
+
+def test_missing_ref_targets_are_reported_and_picked_up(cli, tmp_path):
+    root = write_split_spec(tmp_path)
+    os.remove(tmp_path / 'paths' / 'users.yaml')
+    bundle = SpecBundle(root, DocumentStore(lambda text, name: cli.parse_document(text, False, name)))
+    spec, _ = bundle.build()
+    assert bundle.unresolved == [(root, 'paths/users.yaml', 'file not found')]
+    assert spec['paths']['/users'] == {'$ref': 'paths/users.yaml'}
+
+    (tmp_path / 'paths' / 'users.yaml').write_text(yaml.safe_dump(operation('listUsers')))
+    spec, _ = bundle.build()
+    assert spec['paths']['/users']['get']['operationId'] == 'listUsers' and bundle.unresolved == []
+
+
+def test_save_storms_are_debounced(tmp_path):
+    path = tmp_path / 'api.yaml'
+    path.write_text('a: 1\n')
+    stop = threading.Event()
+    changes = []
+
+    def watch():
+        for changed in watch_changes(lambda: [str(path)], debounce=0.2, interval=0.01, stop=stop):
+            changes.append(changed)
+
+    thread = threading.Thread(target=watch)
+    thread.start()
+    time.sleep(0.05)
+    for i in range(3):
+        path.write_text(f'a: {i + 10}\n')
+        time.sleep(0.03)
+    time.sleep(0.4)
+    stop.set()
+    thread.join(timeout=2)
+    assert changes == [{str(path)}]
+
+
+def test_watch_revalidates_after_edits(cli, tmp_path, capsys):
+    write_split_spec(tmp_path)
+    stop = threading.Event()
+    thread = threading.Thread(target=cli.watch_specs,
+                              args=(str(tmp_path), 'agent-ready', None, 1, None, 10, False, stop))
+    thread.start()
+    try:
+        for _ in range(100):
+            if 'Watching' in capsys.readouterr().out:
+                break
+            time.sleep(0.02)
+        (tmp_path / 'paths' / 'users.yaml').write_text(yaml.safe_dump(operation('listUsers', 'Short')))
+        output = ''
+        for _ in range(100):
+            output += capsys.readouterr().out
+            if 'units checked' in output:
+                break
+            time.sleep(0.02)
+    finally:
+        stop.set()
+        thread.join(timeout=2)
+    assert 'changed: ' in output and 'paths/users.yaml, line 1' in output
+    assert '1 units checked, 3 reused' in output
@@ -1,29 +1,51 @@
 #!/usr/bin/env python3
 """
 OpenAPI Validation Tool - Main CLI Interface
-TODO: Implement comprehensive OpenAPI specification validation
+
+Validates OpenAPI specs (files, URLs, directories or globs) at the syntax,
+semantic or agent-ready level with the rule engine of the validator
+package, and writes console, JSON, JSONL, JUnit or HTML reports. Also runs the
+validation daemon (--serve) and watch mode (--watch).
 """
 
 import click
+import functools
+import itertools
+import os
 import sys
 import json
-from pathlib import Path
-from typing import Dict, List, Any, Optional
+import time
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple, Union
+
+from validator import LEVELS, RuleEngine, __version__, registry
+from validator.batch import expand_spec_paths, is_batch_request, run_batch, summarize_batch
+from validator.cache import FindingsCache, run_incremental
+from validator.engine import HTTP_METHODS
+from validator.meta_schema import MODES as SCHEMA_CHECK_MODES
+from validator.parallel import default_jobs, run_parallel
+from validator.plugins import load_rule_plugin
+from validator.positions import PositionIndex, attach_positions, load_yaml_with_positions
+
+SEVERITY_BUCKETS = {'error': 'errors', 'warning': 'warnings', 'info': 'info'}
+
+# Result lists that reporters stream element by element (files: batch mode)
+STREAMED_LISTS = ('errors', 'warnings', 'info', 'files')
 
-# TODO: Import your validation modules
-# from validator.syntax import SyntaxValidator
-# from validator.semantic import SemanticValidator  
-# from validator.agent_ready import AgentReadyValidator
-# from validator.reporter import ValidationReporter
+# Report lines written per chunk
+REPORT_CHUNK_LINES = 1000
+
+# Default time budget for rules loaded from config plugins, in milliseconds
+PLUGIN_RULE_BUDGET_MS = 1000
 
 @click.command()
-@click.argument('spec_path')
+@click.version_option(__version__, prog_name='validator')
+@click.argument('spec_paths', nargs=-1)
 @click.option('--level', '-l', 
               type=click.Choice(['syntax', 'semantic', 'agent-ready'], case_sensitive=False),
               default='semantic',
               help='Validation level (default: semantic)')
 @click.option('--format', '-f',
-              type=click.Choice(['console', 'json', 'junit', 'html'], case_sensitive=False),
+              type=click.Choice(['console', 'json', 'jsonl', 'junit', 'html'], case_sensitive=False),
               default='console',
               help='Output format (default: console)')
 @click.option('--output', '-o',
@@ -34,18 +56,55 @@ from typing import Dict, List, Any, Optional
               help='Path to configuration file')
 @click.option('--verbose', '-v', is_flag=True,
               help='Verbose output')
-def main(spec_path, level, format, output, strict, config, verbose):
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=default_jobs,
+              help='Worker processes for large specs (default: CPU count)')
+@click.option('--cache', 'cache_dir', metavar='DIR',
+              help='Cache directory for findings (unchanged path items and components are not '
+                   're-checked) and remote specs (revalidated with conditional requests)')
+@click.option('--profile', is_flag=True,
+              help='Time every rule and report the slowest (adds about 30% to rule time)')
+@click.option('--schema-check', type=click.Choice(SCHEMA_CHECK_MODES),
+              help='Check the document against the OpenAPI meta-schema, stopping at the first '
+                   'error per path item/component (fail-fast) or reporting all (default: the '
+                   'schema_check config setting, else off)')
+@click.option('--serve', 'socket_path', metavar='SOCKET',
+              help='Run as a daemon answering validation requests on a Unix socket, with parsed '
+                   'specs and findings kept warm (query it with python -m validator.client)')
+@click.option('--watch', is_flag=True,
+              help='Re-validate whenever the spec, a file it $refs, or (for a directory) any spec '
+                   'in the directory changes')
+@click.option('--debounce', type=click.IntRange(min=0), default=50, metavar='MS',
+              help='With --watch, wait until files have been quiet this long (default: 50)')
+def main(spec_paths, level, format, output, strict, config, verbose, jobs, cache_dir, profile, schema_check,
+         socket_path, watch, debounce):
     """
     Validate OpenAPI specifications for syntax, semantics, and agent-readiness.
     
-    SPEC_PATH can be a local file path or URL to an OpenAPI specification.
+    SPEC_PATHS can be local files, URLs, directories or glob patterns. More
+    than one spec, a directory or a glob runs in batch mode on a worker pool.
     
     Examples:
         validator api.yaml
         validator https://api.example.com/openapi.json --level agent-ready
         validator spec.yaml --format json --output results.json
+        validator specs/ 'vendor/**/*.yaml' --format junit --output results.xml
+        validator --serve /tmp/validator.sock
+        validator api/openapi.yaml --watch
     """
     
+    if socket_path:
+        sys.exit(serve_daemon(socket_path, cache_dir, jobs, verbose))
+    if not spec_paths:
+        raise click.UsageError("Missing argument 'SPEC_PATHS...'.")
+    if watch:
+        if len(spec_paths) != 1 or validate_url(spec_paths[0]):
+            raise click.UsageError("--watch takes one spec file or directory")
+        sys.exit(watch_specs(spec_paths[0], level, config, jobs, schema_check, debounce, verbose))
+    if is_batch_request(spec_paths):
+        sys.exit(validate_batch(spec_paths, level, format, output, strict, config, verbose, jobs, cache_dir,
+                                profile, schema_check))
+    spec_path = spec_paths[0]
+    
     if verbose:
         click.echo("🔍 OpenAPI Validation Tool")
         click.echo("=" * 50)
@@ -55,18 +114,25 @@ def main(spec_path, level, format, output, strict, config, verbose):
         click.echo()
     
     try:
-        # TODO: Implement the main validation logic
-        
         # 1. Load the specification
-        spec = load_specification(spec_path)
+        if validate_url(spec_path):
+            from validator.fetch import SpecFetcher
+            with SpecFetcher(http_cache_dir(cache_dir)) as fetcher:
+                spec, positions = load_document(spec_path, fetcher)
+            if verbose and fetcher.not_modified:
+                click.echo("♻️  Remote specification not modified since last fetch")
+        else:
+            spec, positions = load_document(spec_path)
         if verbose:
             click.echo("✅ Specification loaded successfully")
         
         # 2. Run validation based on level
-        results = run_validation(spec, level, config, verbose)
+        cache = FindingsCache.for_spec(cache_dir, spec_path) if cache_dir else None
+        results = run_validation(spec, level, config, verbose, jobs, cache, positions, profile, schema_check)
+        results['spec_info']['path'] = spec_path
         
         # 3. Generate report in requested format
-        report = generate_report(results, format, verbose)
+        report = stream_report(results, format, verbose)
         
         # 4. Output results
         output_results(report, output, format)
@@ -85,222 +151,427 @@ def main(spec_path, level, format, output, strict, config, verbose):
             traceback.print_exc()
         sys.exit(1)
 
+def validate_spec_file(spec_path: str, level: str, config: Optional[str], strict: bool,
+                       cache_dir: Optional[str] = None, http_cache: Optional[str] = None,
+                       profile: bool = False, schema_check: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Validate one spec for batch mode; never raises, failures are reported in the result.
+    
+    Remote specs are read from http_cache without revalidation: batch mode
+    has just fetched them.
+    """
+    start = time.perf_counter()
+    try:
+        if validate_url(spec_path):
+            from validator.fetch import SpecFetcher
+            with SpecFetcher(http_cache, revalidate=False) as fetcher:
+                spec, positions = load_document(spec_path, fetcher)
+        else:
+            spec, positions = load_document(spec_path)
+        cache = FindingsCache.for_spec(cache_dir, spec_path) if cache_dir else None
+        results = run_validation(spec, level, config, False, 1, cache, positions, profile, schema_check)
+        status = 'failed' if determine_exit_code(results, strict) else 'passed'
+        return {'spec': spec_path, 'status': status, 'results': results,
+                'duration': time.perf_counter() - start}
+    except Exception as e:
+        return {'spec': spec_path, 'status': 'error', 'message': f"{type(e).__name__}: {e}",
+                'duration': time.perf_counter() - start}
+
+def validate_batch(spec_paths, level: str, format_type: str, output: Optional[str], strict: bool,
+                   config: Optional[str], verbose: bool, jobs: int, cache_dir: Optional[str],
+                   profile: bool = False, schema_check: Optional[str] = None) -> int:
+    """Validate many specs on a worker pool, streaming failures; returns the exit code."""
+    paths = expand_spec_paths(spec_paths)
+    if not paths:
+        click.echo("❌ Error: No specification files found", err=True)
+        return 1
+    if format_type == 'html':
+        click.echo("❌ Error: HTML reports are not supported in batch mode", err=True)
+        return 1
+    
+    if verbose:
+        click.echo(f"🔍 Validating {len(paths)} specifications with {min(jobs, len(paths))} workers...", err=True)
+    
+    def report_progress(result):
+        if result['status'] == 'passed':
+            if verbose:
+                click.echo(f"✅ {result['spec']}", err=True)
+        elif result['status'] == 'failed':
+            summary = result['results']['summary']
+            click.echo(f"❌ {result['spec']}: {summary['total_errors']} errors, "
+                       f"{summary['total_warnings']} warnings", err=True)
+        else:
+            click.echo(f"💥 {result['spec']}: {result['message']}", err=True)
+    
+    import tempfile
+
+    with tempfile.TemporaryDirectory(prefix='openapi-validator-') as scratch:
+        # Remote specs are fetched concurrently up front; workers read them from the HTTP cache
+        http_cache = http_cache_dir(cache_dir) or scratch
+        fetch_failures = []
+        urls = [path for path in paths if validate_url(path)]
+        if urls:
+            from validator.fetch import SpecFetcher
+            with SpecFetcher(http_cache) as fetcher:
+                errors = fetcher.fetch_many(urls)
+            if verbose:
+                click.echo(f"🌐 Fetched {fetcher.downloads} remote specs, "
+                           f"{fetcher.not_modified} not modified", err=True)
+            for url, message in errors.items():
+                if message:
+                    fetch_failures.append({'spec': url, 'status': 'error', 'message': message, 'duration': 0.0})
+                    report_progress(fetch_failures[-1])
+        
+        failed_urls = {failure['spec'] for failure in fetch_failures}
+        worker = functools.partial(validate_spec_file, level=level, config=config, strict=strict,
+                                   cache_dir=cache_dir, http_cache=http_cache, profile=profile,
+                                   schema_check=schema_check)
+        runs = run_batch([path for path in paths if path not in failed_urls], worker, jobs, report_progress)
+    runs = sorted(runs + fetch_failures, key=lambda run: run['spec'])
+    batch = summarize_batch(runs, level)
+    
+    if format_type == 'junit':
+        report = chunk_lines(junit_report_lines({'level': level, 'runs': runs}))
+    elif format_type in ('json', 'jsonl'):
+        report = stream_report(batch, format_type)
+    else:
+        report = chunk_lines(batch_console_report_lines(batch))
+    output_results(report, output, format_type)
+    
+    totals = batch['summary']
+    return 1 if totals['failed'] or totals['errored'] else 0
+
+def serve_daemon(socket_path: str, cache_dir: Optional[str], jobs: int, verbose: bool) -> int:
+    """
+    Answer validate requests on a Unix socket until asked to shut down.
+    
+    Parsed specs are reused until the file (or sent buffer) changes, split
+    specs are bundled incrementally as in watch mode, and a findings cache
+    per spec, level and config stays in memory, so a request after a small
+    edit only re-checks the changed units. With --cache the findings caches
+    are also persisted. See validator/daemon.py for the protocol.
+    """
+    from validator.bundle import DocumentStore, SpecBundle
+    from validator.daemon import serve
+    
+    documents = DocumentStore(lambda text, name: parse_document(text, is_json_file(name), name))
+    bundles: Dict[str, SpecBundle] = {}
+    caches: Dict[Tuple[str, ...], FindingsCache] = {}
+    
+    def handle(request):
+        command = request.get('command', 'validate')
+        if command != 'validate':
+            raise ValueError(f"Unknown command: {command}")
+        if not request.get('path'):
+            raise ValueError("validate requests need a path")
+        path = os.path.abspath(request['path'])
+        level = request.get('level', 'semantic')
+        format_type = request.get('format', 'console')
+        config = request.get('config')
+        schema_check = request.get('schema_check')
+        if level not in LEVELS:
+            raise ValueError(f"Unknown level: {level}")
+        if format_type not in ('console', 'json', 'jsonl', 'junit', 'html'):
+            raise ValueError(f"Unknown format: {format_type}")
+        
+        if path not in bundles:
+            bundles[path] = SpecBundle(path, documents)
+        spec, positions = bundles[path].build(content=request.get('content'))
+        key = (path, level, config or '', schema_check or '')
+        if key not in caches:
+            caches[key] = FindingsCache.for_spec(cache_dir, path) if cache_dir else FindingsCache()
+        results = run_validation(spec, level, config, False, jobs, caches[key], positions,
+                                 schema_check=schema_check)
+        results['spec_info']['path'] = path
+        return {'ok': True,
+                'exit_code': determine_exit_code(results, bool(request.get('strict'))),
+                'report': generate_report(results, format_type, bool(request.get('verbose'))),
+                'summary': results['summary']}
+    
+    def stats():
+        return {'documents': len(documents), 'parsed': documents.parsed, 'reused': documents.reused,
+                'caches': len(caches)}
+    
+    def ready():
+        if verbose:
+            click.echo(f"🛰️  Validation daemon listening on {socket_path}", err=True)
+    
+    try:
+        serve(socket_path, handle, on_ready=ready, stats=stats)
+    except (OSError, RuntimeError) as e:
+        click.echo(f"❌ Error: {e}", err=True)
+        return 1
+    return 0
+
+def watch_specs(spec_path: str, level: str, config: Optional[str], jobs: int, schema_check: Optional[str],
+                debounce_ms: int, verbose: bool, stop=None) -> int:
+    """
+    Validate a spec, or every root spec in a directory of split specs, and
+    re-validate after each change until interrupted (or `stop` is set).
+    
+    Files are parsed once and re-parsed only when they change. External
+    $refs are inlined (see validator/bundle.py) and unchanged parts of the
+    bundle keep their identity, so the in-memory findings cache only hashes
+    and re-checks the units built from changed files.
+    """
+    from validator.bundle import DocumentStore, SpecBundle
+    from validator.watch import watch_changes
+    
+    store = DocumentStore(lambda text, name: parse_document(text, is_json_file(name), name))
+    directory = os.path.isdir(spec_path)
+    bundles: Dict[str, SpecBundle] = {}
+    caches: Dict[str, FindingsCache] = {}
+    
+    def discover():
+        """The spec itself, or the files in the directory with a top-level openapi field."""
+        if not directory:
+            return [os.path.abspath(spec_path)]
+        roots = []
+        for path in expand_spec_paths([spec_path]):
+            path = os.path.abspath(path)
+            try:
+                document, _ = store.load(path)
+            except Exception:
+                continue  # fragments may not parse on their own; the bundle reports them
+            if isinstance(document, dict) and 'openapi' in document:
+                roots.append(path)
+        return roots
+    
+    def watched_files():
+        files = set().union(*(bundle.files for bundle in bundles.values()))
+        if directory:
+            files.update(os.path.abspath(path) for path in expand_spec_paths([spec_path]))
+        return files
+    
+    def validate(root, changed=None):
+        start = time.perf_counter()
+        bundle, cache = bundles[root], caches[root]
+        try:
+            spec, positions = bundle.build(changed)
+            results = run_validation(spec, level, config, False, jobs, cache, positions,
+                                     schema_check=schema_check)
+        except Exception as e:
+            click.echo(f"❌ Error: {os.path.relpath(root)}: {e}", err=True)
+            return
+        results['spec_info']['path'] = os.path.relpath(root)
+        output_results(stream_report(results, 'console', verbose), None, 'console')
+        for path, ref, reason in bundle.unresolved:
+            click.echo(f"⚠️  {os.path.relpath(path)}: cannot resolve $ref {ref} ({reason})", err=True)
+        click.echo(f"⏱️  Validated in {(time.perf_counter() - start) * 1000:.0f}ms "
+                   f"({cache.checked} units checked, {cache.reused} reused)")
+    
+    roots = discover()
+    if not roots:
+        click.echo(f"❌ Error: No OpenAPI documents found in {spec_path}", err=True)
+        return 1
+    for root in roots:
+        bundles[root], caches[root] = SpecBundle(root, store), FindingsCache()
+        validate(root)
+    
+    click.echo(f"👀 Watching {len(watched_files())} files for changes (Ctrl+C to stop)...")
+    try:
+        for changed in watch_changes(watched_files, debounce_ms / 1000, stop=stop):
+            click.echo(f"\n🔄 {time.strftime('%H:%M:%S')} changed: "
+                       f"{', '.join(sorted(os.path.relpath(path) for path in changed))}")
+            if directory:
+                roots = discover()
+                for root in set(bundles) - set(roots):
+                    del bundles[root], caches[root]
+                for root in roots:
+                    if root not in bundles:
+                        bundles[root], caches[root] = SpecBundle(root, store), FindingsCache()
+                        changed.add(root)
+            for root, bundle in bundles.items():
+                if root in changed or bundle.files & changed:
+                    validate(root, changed)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
 def load_specification(spec_path: str) -> Dict[str, Any]:
     """
-    Load OpenAPI specification from file or URL.
+    Load OpenAPI specification from a local YAML or JSON file or a URL.
     
-    TODO: Implement specification loading logic
-    - Support YAML and JSON formats
-    - Handle local files and remote URLs
-    - Validate basic file structure
+    JSON is detected by extension (or Content-Type for URLs); anything else
+    is parsed as YAML (which also accepts JSON).
     """
-    click.echo("TODO: Implement load_specification")
+    return load_document(spec_path)[0]
+
+def load_document(spec_path: str, fetcher=None) -> Tuple[Dict[str, Any], PositionIndex]:
+    """
+    Load a specification together with a line/column index of its nodes.
     
-    # Hints:
-    # - Use yaml.safe_load() for YAML files
-    # - Use json.load() for JSON files  
-    # - Use requests.get() for remote URLs
-    # - Check file extensions or content-type
-    # - Handle encoding issues
+    The index comes out of the same parse (see validator/positions.py) and
+    is used to attach positions to findings after validation. URLs are
+    fetched with `fetcher` (a validator.fetch.SpecFetcher), or with a
+    one-off uncached fetcher if none is given.
+    """
+    if validate_url(spec_path):
+        if fetcher is None:
+            from validator.fetch import SpecFetcher
+            with SpecFetcher() as fetcher:
+                fetched = fetcher.fetch(spec_path)
+        else:
+            fetched = fetcher.fetch(spec_path)
+        text, is_json = fetched.text, fetched.is_json
+    else:
+        with open(spec_path, 'r', encoding='utf-8-sig') as f:
+            text = f.read()
+        is_json = is_json_file(spec_path)
     
-    # Placeholder return
-    return {
-        "openapi": "3.0.0",
-        "info": {"title": "TODO", "version": "1.0.0"},
-        "paths": {}
-    }
+    return parse_document(text, is_json, spec_path)
 
-def run_validation(spec: Dict[str, Any], level: str, config: Optional[str], verbose: bool) -> Dict[str, Any]:
+def parse_document(text: str, is_json: bool, name: str = '<document>') -> Tuple[Dict[str, Any], PositionIndex]:
+    """Parse spec source text (JSON or YAML) into the spec and its position index."""
+    if is_json:
+        spec = json.loads(text)
+        positions = PositionIndex.from_json(text)
+    else:
+        spec, positions = load_yaml_with_positions(text)
+    
+    if not isinstance(spec, dict):
+        raise ValueError(f"{name} is not an OpenAPI document (expected a mapping at the root)")
+    return spec, positions
+
+def run_validation(spec: Dict[str, Any], level: str, config: Optional[str], verbose: bool,
+                   jobs: int = 1, cache: Optional[FindingsCache] = None,
+                   positions: Optional[PositionIndex] = None, profile: bool = False,
+                   schema_check: Optional[str] = None) -> Dict[str, Any]:
     """
     Run validation at the specified level.
     
-    TODO: Implement validation orchestration
-    - Create validators based on level
-    - Run appropriate validation checks
-    - Collect and organize results
+    All rules enabled at the level (and the levels below it) run in a single
+    traversal of the spec; see validator/engine.py. With jobs > 1, large specs
+    are split across worker processes and findings merged in document order.
+    With a cache, only changed units and their $ref dependents are checked.
+    Given the spec's position index, findings get a line and column.
+    
+    With profile (or when the config sets rule time budgets) every rule is
+    timed and summary.performance reports time, calls and findings per rule.
+    
+    schema_check ('off', 'fail-fast' or 'collect-all') overrides the
+    config's schema_check setting for the OpenAPI meta-schema check.
     """
-    click.echo(f"TODO: Implement {level} validation")
+    config_data = load_config(config) if config else {}
+    overrides = config_data.get('rules')
+    settings = config_data.get('settings')
+    if schema_check:
+        settings = dict(settings or {}, schema_check=schema_check)
+    budgets = config_data.get('budgets') or {}
+    profile = profile or bool(budgets)
+    if verbose:
+        rules = registry.select(level, overrides)
+        click.echo(f"🔍 Running {level} validation ({len(rules)} rules, up to {jobs} jobs)...")
+    
+    start = time.perf_counter()
+    if cache is not None:
+        run = run_incremental(spec, registry.select(level, overrides), settings, cache, level, overrides,
+                              jobs, profile)
+        if verbose:
+            click.echo(f"♻️  Reused cached findings for {cache.reused} units, checked {cache.checked}")
+    else:
+        run = run_parallel(spec, level, overrides, settings, jobs, profile)
+    elapsed = time.perf_counter() - start
+    total_operations = run['stats']['total_operations']
     
     results = {
         'level': level,
-        'spec_info': extract_spec_info(spec),
+        'spec_info': extract_spec_info(spec, total_operations),
         'errors': [],
         'warnings': [],
         'info': [],
         'summary': {}
     }
     
-    if level in ['syntax', 'semantic', 'agent-ready']:
-        # TODO: Run syntax validation
-        syntax_results = validate_syntax(spec, verbose)
-        results['errors'].extend(syntax_results.get('errors', []))
-        results['warnings'].extend(syntax_results.get('warnings', []))
-    
-    if level in ['semantic', 'agent-ready']:
-        # TODO: Run semantic validation
-        semantic_results = validate_semantics(spec, verbose)
-        results['errors'].extend(semantic_results.get('errors', []))
-        results['warnings'].extend(semantic_results.get('warnings', []))
-    
-    if level == 'agent-ready':
-        # TODO: Run agent-ready validation
-        agent_results = validate_agent_ready(spec, verbose)
-        results['errors'].extend(agent_results.get('errors', []))
-        results['warnings'].extend(agent_results.get('warnings', []))
-    
-    # TODO: Generate summary statistics
+    # Positions are attached after the run so cached findings pick up current lines
+    attach_positions(run['findings'], positions)
+    for finding in run['findings']:
+        results[SEVERITY_BUCKETS[finding['severity']]].append(finding)
+    
     results['summary'] = {
         'total_errors': len(results['errors']),
         'total_warnings': len(results['warnings']),
-        'total_operations': count_operations(spec),
+        'total_info': len(results['info']),
+        'total_operations': total_operations,
         'validation_level': level
     }
+    if cache is not None:
+        results['summary']['cache'] = {'reused_units': cache.reused, 'checked_units': cache.checked}
+    if profile:
+        results['summary']['performance'] = summarize_performance(run['stats']['rule_timings'], elapsed, budgets)
+        for slow in results['summary']['performance']['over_budget']:
+            click.echo(f"⏱️  Rule {slow['rule']} took {slow['time_ms']:.0f}ms, "
+                       f"over its {slow['budget_ms']:g}ms budget", err=True)
     
     return results
 
+def summarize_performance(timings: Dict[str, List[float]], elapsed: float,
+                          budgets: Dict[str, float]) -> Dict[str, Any]:
+    """Per-rule time, calls and findings, slowest first, plus rules over their time budget."""
+    rules = [{'rule': rule_id, 'calls': calls, 'findings': found, 'time_ms': round(seconds * 1000, 3)}
+             for rule_id, (seconds, calls, found) in timings.items()]
+    rules.sort(key=lambda entry: entry['time_ms'], reverse=True)
+    over_budget = [dict(entry, budget_ms=budgets[entry['rule']]) for entry in rules
+                   if entry['rule'] in budgets and entry['time_ms'] > budgets[entry['rule']]]
+    return {'validation_time_ms': round(elapsed * 1000, 3), 'rules': rules, 'over_budget': over_budget}
+
+def run_level_rules(spec: Dict[str, Any], level: str) -> Dict[str, Any]:
+    """Run only the rules defined at one level and bucket findings by severity."""
+    run = RuleEngine(registry.select(level, exact=True)).run(spec)
+    buckets = {'errors': [], 'warnings': [], 'info': []}
+    for finding in run['findings']:
+        buckets[SEVERITY_BUCKETS[finding['severity']]].append(finding)
+    return buckets
+
 def validate_syntax(spec: Dict[str, Any], verbose: bool) -> Dict[str, Any]:
     """
     Validate OpenAPI specification syntax.
     
-    TODO: Implement syntax validation
-    - Check OpenAPI version compatibility
-    - Validate required root fields
-    - Check JSON Schema compliance
-    - Validate $ref resolution
+    Checks required root fields, OpenAPI version, required fields of
+    responses and parameters, and local $ref resolution.
     """
     if verbose:
         click.echo("🔍 Running syntax validation...")
     
-    errors = []
-    warnings = []
-    
-    # TODO: Implement validation rules
-    # Example rules to implement:
-    
-    # Check OpenAPI version
-    if 'openapi' not in spec:
-        errors.append({
-            'type': 'missing_field',
-            'field': 'openapi',
-            'message': 'Missing required field: openapi',
-            'severity': 'error'
-        })
-    elif not spec['openapi'].startswith('3.'):
-        errors.append({
-            'type': 'invalid_version',
-            'field': 'openapi',
-            'message': f'Unsupported OpenAPI version: {spec["openapi"]}. Expected 3.x',
-            'severity': 'error'
-        })
-    
-    # TODO: Add more syntax validation rules
-    # - Check info section
-    # - Validate paths structure
-    # - Check components section
-    # - Validate references
-    
-    return {'errors': errors, 'warnings': warnings}
+    return run_level_rules(spec, 'syntax')
 
 def validate_semantics(spec: Dict[str, Any], verbose: bool) -> Dict[str, Any]:
     """
     Validate semantic correctness of API design.
     
-    TODO: Implement semantic validation
-    - Check HTTP method usage patterns
-    - Validate status code appropriateness
-    - Check parameter consistency
-    - Validate schema relationships
+    Checks HTTP method usage, error response coverage and that templated
+    path parameters are declared.
     """
     if verbose:
         click.echo("🔍 Running semantic validation...")
     
-    errors = []
-    warnings = []
-    
-    # TODO: Implement semantic validation rules
-    # Example rules to implement:
-    
-    # Check for GET methods with request bodies
-    paths = spec.get('paths', {})
-    for path, path_item in paths.items():
-        if 'get' in path_item and 'requestBody' in path_item['get']:
-            warnings.append({
-                'type': 'questionable_design',
-                'location': f'paths.{path}.get',
-                'message': 'GET operation should not have a request body',
-                'severity': 'warning'
-            })
-    
-    # TODO: Add more semantic validation rules
-    # - Check appropriate status codes for methods
-    # - Validate parameter naming consistency
-    # - Check for missing error responses
-    # - Validate schema type consistency
-    
-    return {'errors': errors, 'warnings': warnings}
+    return run_level_rules(spec, 'semantic')
 
 def validate_agent_ready(spec: Dict[str, Any], verbose: bool) -> Dict[str, Any]:
     """
     Validate specification for AI agent compatibility.
     
-    TODO: Implement agent-ready validation
-    - Check operation descriptions completeness
-    - Validate parameter descriptions
-    - Check for operation IDs
-    - Validate example completeness
+    Checks operation IDs and operation and parameter descriptions.
     """
     if verbose:
         click.echo("🔍 Running agent-ready validation...")
     
-    errors = []
-    warnings = []
-    
-    # TODO: Implement agent-ready validation rules
-    # Example rules to implement:
-    
-    paths = spec.get('paths', {})
-    for path, path_item in paths.items():
-        for method, operation in path_item.items():
-            if method.lower() not in ['get', 'post', 'put', 'delete', 'patch', 'head', 'options']:
-                continue
-                
-            # Check for operation ID
-            if 'operationId' not in operation:
-                warnings.append({
-                    'type': 'missing_operation_id',
-                    'location': f'paths.{path}.{method}',
-                    'message': 'Operation missing operationId - recommended for agent usage',
-                    'severity': 'warning'
-                })
-            
-            # Check for description
-            if 'description' not in operation or len(operation['description'].strip()) < 10:
-                warnings.append({
-                    'type': 'insufficient_description',
-                    'location': f'paths.{path}.{method}',
-                    'message': 'Operation needs detailed description for agent understanding',
-                    'severity': 'warning'
-                })
-    
-    # TODO: Add more agent-ready validation rules
-    # - Check parameter descriptions
-    # - Validate response examples
-    # - Check error response completeness
-    # - Validate schema descriptions
-    
-    return {'errors': errors, 'warnings': warnings}
-
-def extract_spec_info(spec: Dict[str, Any]) -> Dict[str, Any]:
+    return run_level_rules(spec, 'agent-ready')
+
+def extract_spec_info(spec: Dict[str, Any], total_operations: Optional[int] = None) -> Dict[str, Any]:
     """Extract basic information about the specification."""
     info = spec.get('info', {})
     paths = spec.get('paths', {})
     
+    if total_operations is None:
+        total_operations = count_operations(spec)
+    
     return {
         'title': info.get('title', 'Unknown'),
         'version': info.get('version', 'Unknown'),
         'openapi_version': spec.get('openapi', 'Unknown'),
         'total_paths': len(paths),
-        'total_operations': count_operations(spec)
+        'total_operations': total_operations
     }
 
 def count_operations(spec: Dict[str, Any]) -> int:
@@ -309,143 +580,285 @@ def count_operations(spec: Dict[str, Any]) -> int:
     paths = spec.get('paths', {})
     
     for path_item in paths.values():
-        for method in ['get', 'post', 'put', 'delete', 'patch', 'head', 'options']:
-            if method in path_item:
-                count += 1
+        if isinstance(path_item, dict):
+            count += sum(1 for method in HTTP_METHODS if method in path_item)
     
     return count
 
-def generate_report(results: Dict[str, Any], format_type: str, verbose: bool) -> str:
+def stream_report(results: Dict[str, Any], format_type: str, verbose: bool = False) -> Iterator[str]:
     """
-    Generate validation report in the specified format.
+    Generate validation report in the specified format, chunk by chunk.
     
-    TODO: Implement report generation for different formats
-    - Console: Human-readable output with colors
-    - JSON: Machine-readable structured data
-    - HTML: Web-friendly report with styling
-    - JUnit: XML format for CI/CD integration
+    Reporters yield lines; they are grouped into chunks of REPORT_CHUNK_LINES
+    so a report with hundreds of thousands of findings is written as it is
+    produced instead of being built as one string.
     """
     if verbose:
         click.echo(f"📊 Generating {format_type} report...")
     
     if format_type == 'console':
-        return generate_console_report(results)
+        lines = console_report_lines(results)
     elif format_type == 'json':
-        return generate_json_report(results)
+        lines = json_report_lines(results)
+    elif format_type == 'jsonl':
+        lines = jsonl_report_lines(results)
     elif format_type == 'html':
-        return generate_html_report(results)
+        lines = html_report_lines(results)
     elif format_type == 'junit':
-        return generate_junit_report(results)
+        lines = junit_report_lines(results)
     else:
         raise ValueError(f"Unsupported format: {format_type}")
+    return chunk_lines(lines)
 
-def generate_console_report(results: Dict[str, Any]) -> str:
-    """Generate human-readable console report."""
-    # TODO: Implement console report generation
-    # - Use colors for different severity levels
-    # - Group errors by type
-    # - Show summary statistics
-    # - Provide actionable recommendations
-    
-    lines = []
-    lines.append("📋 Validation Report")
-    lines.append("=" * 50)
+def generate_report(results: Dict[str, Any], format_type: str, verbose: bool) -> str:
+    """Generate the whole report as one string."""
+    return "".join(stream_report(results, format_type, verbose))
+
+def chunk_lines(lines: Iterable[str], size: int = REPORT_CHUNK_LINES) -> Iterator[str]:
+    """Group report lines into newline-terminated chunks."""
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= size:
+            yield "\n".join(chunk) + "\n"
+            chunk = []
+    if chunk:
+        yield "\n".join(chunk) + "\n"
+
+def format_finding_location(finding: Dict[str, Any]) -> str:
+    """Dotted location of a finding, with its file (split specs), line and column when known."""
+    location = finding.get('location', 'root')
+    if 'line' in finding:
+        source = f"{finding['file']}, " if 'file' in finding else ''
+        return f"{location} ({source}line {finding['line']}, column {finding['column']})"
+    return location
+
+def console_report_lines(results: Dict[str, Any]) -> Iterator[str]:
+    """Human-readable console report."""
+    yield "📋 Validation Report"
+    yield "=" * 50
     
     spec_info = results.get('spec_info', {})
-    lines.append(f"API: {spec_info.get('title', 'Unknown')}")
-    lines.append(f"Version: {spec_info.get('version', 'Unknown')}")
-    lines.append(f"OpenAPI: {spec_info.get('openapi_version', 'Unknown')}")
-    lines.append("")
+    yield f"API: {spec_info.get('title', 'Unknown')}"
+    yield f"Version: {spec_info.get('version', 'Unknown')}"
+    yield f"OpenAPI: {spec_info.get('openapi_version', 'Unknown')}"
+    yield ""
     
     summary = results.get('summary', {})
-    lines.append("📊 Summary:")
-    lines.append(f"  Errors: {summary.get('total_errors', 0)}")
-    lines.append(f"  Warnings: {summary.get('total_warnings', 0)}")
-    lines.append(f"  Operations: {summary.get('total_operations', 0)}")
-    lines.append("")
-    
-    # TODO: Add detailed error/warning listings
+    yield "📊 Summary:"
+    yield f"  Errors: {summary.get('total_errors', 0)}"
+    yield f"  Warnings: {summary.get('total_warnings', 0)}"
+    yield f"  Operations: {summary.get('total_operations', 0)}"
+    yield ""
     
     errors = results.get('errors', [])
     if errors:
-        lines.append("❌ Errors:")
+        yield "❌ Errors:"
         for error in errors:
-            lines.append(f"  - {error.get('message', 'Unknown error')}")
+            yield f"  - {error.get('message', 'Unknown error')}"
             if 'location' in error:
-                lines.append(f"    Location: {error['location']}")
-        lines.append("")
+                yield f"    Location: {format_finding_location(error)}"
+        yield ""
     
     warnings = results.get('warnings', [])
     if warnings:
-        lines.append("⚠️  Warnings:")
+        yield "⚠️  Warnings:"
         for warning in warnings:
-            lines.append(f"  - {warning.get('message', 'Unknown warning')}")
+            yield f"  - {warning.get('message', 'Unknown warning')}"
             if 'location' in warning:
-                lines.append(f"    Location: {warning['location']}")
-        lines.append("")
+                yield f"    Location: {format_finding_location(warning)}"
+        yield ""
     
     if not errors and not warnings:
-        lines.append("✅ No issues found!")
+        yield "✅ No issues found!"
+    
+    performance = summary.get('performance')
+    if performance:
+        if not errors and not warnings:
+            yield ""
+        yield f"⏱️  Rule Timings ({performance['validation_time_ms']:.0f}ms total):"
+        yield f"  {'Rule':<32} {'Calls':>9} {'Findings':>9} {'Time (ms)':>10}"
+        for entry in performance['rules']:
+            yield (f"  {entry['rule']:<32} {entry['calls']:>9} {entry['findings']:>9} "
+                   f"{entry['time_ms']:>10.1f}")
+
+def generate_console_report(results: Dict[str, Any]) -> str:
+    """Generate human-readable console report."""
+    return "".join(chunk_lines(console_report_lines(results)))
+
+def json_report_lines(results: Dict[str, Any]) -> Iterator[str]:
+    """
+    Indented JSON object with each finding list streamed one element per line.
     
-    return "\n".join(lines)
+    The output parses to the same value as json.dumps(results).
+    """
+    yield "{"
+    last = len(results) - 1
+    for i, (key, value) in enumerate(results.items()):
+        comma = "," if i < last else ""
+        if key in STREAMED_LISTS and isinstance(value, list) and value:
+            yield f"  {json.dumps(key)}: ["
+            last_item = len(value) - 1
+            for j, item in enumerate(value):
+                yield f"    {json.dumps(item)}{',' if j < last_item else ''}"
+            yield f"  ]{comma}"
+        else:
+            yield f"  {json.dumps(key)}: {json.dumps(value, indent=2)}{comma}".replace("\n", "\n  ")
+    yield "}"
 
 def generate_json_report(results: Dict[str, Any]) -> str:
     """Generate JSON report for machine consumption."""
-    # TODO: Implement JSON report generation
-    return json.dumps(results, indent=2)
+    return "".join(chunk_lines(json_report_lines(results)))
+
+def jsonl_report_lines(results: Dict[str, Any]) -> Iterator[str]:
+    """
+    JSON Lines: one line per finding (or per file in batch mode), then one
+    line with everything else (level, spec_info, summary).
+    """
+    for key in STREAMED_LISTS:
+        for item in results.get(key, ()):
+            yield json.dumps(item)
+    yield json.dumps({key: value for key, value in results.items() if key not in STREAMED_LISTS})
+
+def html_report_lines(results: Dict[str, Any]) -> Iterator[str]:
+    """HTML report for web viewing."""
+    from xml.sax.saxutils import escape
+
+    spec_info = results.get('spec_info', {})
+    summary = results.get('summary', {})
+    
+    yield "<!DOCTYPE html>"
+    yield "<html>"
+    yield "<head>"
+    yield "    <title>OpenAPI Validation Report</title>"
+    yield "    <style>"
+    yield "        body { font-family: Arial, sans-serif; margin: 40px; }"
+    yield "        .summary { background: #f5f5f5; padding: 20px; border-radius: 5px; }"
+    yield "        .error { color: #d73527; }"
+    yield "        .warning { color: #ffa500; }"
+    yield "        td, th { padding: 4px 12px; text-align: left; }"
+    yield "    </style>"
+    yield "</head>"
+    yield "<body>"
+    yield "    <h1>OpenAPI Validation Report</h1>"
+    yield '    <div class="summary">'
+    yield (f"        <p>API: {escape(str(spec_info.get('title', 'Unknown')))} "
+           f"{escape(str(spec_info.get('version', '')))}</p>")
+    yield (f"        <p>Errors: {summary.get('total_errors', 0)} &middot; "
+           f"Warnings: {summary.get('total_warnings', 0)} &middot; "
+           f"Operations: {summary.get('total_operations', 0)}</p>")
+    yield "    </div>"
+    
+    if not any(results.get(bucket) for bucket in SEVERITY_BUCKETS.values()):
+        yield "    <p>✅ No issues found!</p>"
+    else:
+        yield "    <table>"
+        yield "        <tr><th>Severity</th><th>Location</th><th>Line:Col</th><th>Message</th></tr>"
+        for bucket, css_class in (('errors', 'error'), ('warnings', 'warning'), ('info', 'info')):
+            for finding in results.get(bucket, []):
+                position = f"{finding['line']}:{finding['column']}" if 'line' in finding else ''
+                yield (f'        <tr class="{css_class}"><td>{escape(finding.get("severity", css_class))}</td>'
+                       f'<td>{escape(finding.get("location", "root"))}</td><td>{position}</td>'
+                       f'<td>{escape(finding.get("message", ""))}</td></tr>')
+        yield "    </table>"
+    yield "</body>"
+    yield "</html>"
 
 def generate_html_report(results: Dict[str, Any]) -> str:
     """Generate HTML report for web viewing."""
-    # TODO: Implement HTML report generation
-    # - Use templates for consistent styling
-    # - Include charts/graphs for statistics
-    # - Make it interactive if possible
-    
-    return f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>OpenAPI Validation Report</title>
-        <style>
-            body {{ font-family: Arial, sans-serif; margin: 40px; }}
-            .summary {{ background: #f5f5f5; padding: 20px; border-radius: 5px; }}
-            .error {{ color: #d73527; }}
-            .warning {{ color: #ffa500; }}
-        </style>
-    </head>
-    <body>
-        <h1>OpenAPI Validation Report</h1>
-        <div class="summary">
-            <!-- TODO: Add summary information -->
-            <p>Report generation not fully implemented</p>
-        </div>
-        <!-- TODO: Add detailed results -->
-    </body>
-    </html>
+    return "".join(chunk_lines(html_report_lines(results)))
+
+def batch_console_report_lines(batch: Dict[str, Any]) -> Iterator[str]:
+    """Human-readable summary of a batch run."""
+    yield "📋 Batch Validation Report"
+    yield "=" * 50
+    
+    icons = {'passed': '✅', 'failed': '❌', 'error': '💥'}
+    for entry in batch['files']:
+        detail = entry.get('message') or f"{entry.get('errors', 0)} errors, {entry.get('warnings', 0)} warnings"
+        yield f"{icons[entry['status']]} {entry['spec']} ({detail})"
+    yield ""
+    
+    totals = batch['summary']
+    yield "📊 Summary:"
+    yield f"  Files: {totals['total_files']}"
+    yield f"  Passed: {totals['passed']}"
+    yield f"  Failed: {totals['failed']}"
+    yield f"  Could not validate: {totals['errored']}"
+    yield f"  Errors: {totals['total_errors']}"
+    yield f"  Warnings: {totals['total_warnings']}"
+
+def junit_report_lines(results: Dict[str, Any]) -> Iterator[str]:
+    """
+    JUnit XML report for CI/CD integration.
+    
+    Each spec becomes a testsuite with one testcase: errors (or warnings,
+    for specs that failed in strict mode) are reported as a failure, and a
+    spec that could not be loaded as an error. Accepts a single run's
+    results or a batch ({'level', 'runs'}).
     """
+    from xml.sax.saxutils import escape, quoteattr
+
+    if 'runs' in results:
+        level = results['level']
+        runs = results['runs']
+    else:
+        level = results.get('level', 'semantic')
+        status = 'failed' if results.get('errors') else 'passed'
+        spec_info = results.get('spec_info', {})
+        runs = [{'spec': spec_info.get('path', spec_info.get('title', 'specification')),
+                 'status': status, 'results': results, 'duration': 0.0}]
+    
+    statuses = [run['status'] for run in runs]
+    total_time = sum(run.get('duration', 0.0) for run in runs)
+    yield '<?xml version="1.0" encoding="UTF-8"?>'
+    yield (f'<testsuites name="OpenAPI Validation" tests="{len(runs)}" failures="{statuses.count("failed")}" '
+           f'errors="{statuses.count("error")}" time="{total_time:.3f}">')
+    
+    for run in runs:
+        duration = run.get('duration', 0.0)
+        failures = int(run['status'] == 'failed')
+        errors = int(run['status'] == 'error')
+        yield (f"  <testsuite name={quoteattr(run['spec'])} tests=\"1\" failures=\"{failures}\" "
+               f"errors=\"{errors}\" time=\"{duration:.3f}\">")
+        testcase = (f"    <testcase name={quoteattr(f'{level} validation')} classname=\"openapi.validation\" "
+                    f"time=\"{duration:.3f}\">")
+        if errors:
+            yield testcase
+            yield f"      <error message={quoteattr(run['message'])} type=\"load_error\"/>"
+            yield "    </testcase>"
+        elif failures:
+            summary = run['results']['summary']
+            message = f"{summary['total_errors']} errors, {summary['total_warnings']} warnings"
+            yield testcase
+            # One line per finding inside the failure text
+            prefix = f"      <failure message={quoteattr(message)} type=\"validation\">"
+            for finding in itertools.chain(run['results'].get('errors', []), run['results'].get('warnings', [])):
+                detail = f"[{finding['severity']}] {format_finding_location(finding)}: {finding.get('message', '')}"
+                yield prefix + escape(detail)
+                prefix = ""
+            yield f"{prefix}</failure>"
+            yield "    </testcase>"
+        else:
+            yield testcase + "</testcase>"
+        yield "  </testsuite>"
+    yield "</testsuites>"
 
 def generate_junit_report(results: Dict[str, Any]) -> str:
     """Generate JUnit XML report for CI/CD integration."""
-    # TODO: Implement JUnit XML report generation
-    # - Follow JUnit XML schema
-    # - Map validation errors to test failures
-    # - Include timing information
-    
-    return """<?xml version="1.0" encoding="UTF-8"?>
-<testsuite name="OpenAPI Validation" tests="1" failures="0" errors="0">
-    <testcase name="validation" classname="openapi.validation">
-        <!-- TODO: Add test case details -->
-    </testcase>
-</testsuite>"""
-
-def output_results(report: str, output_path: Optional[str], format_type: str):
-    """Output results to file or stdout."""
+    return "".join(chunk_lines(junit_report_lines(results)))
+
+def output_results(report: Union[str, Iterable[str]], output_path: Optional[str], format_type: str):
+    """Output results to file or stdout, writing each chunk as the reporter produces it."""
+    chunks = [report + "\n"] if isinstance(report, str) else report
     if output_path:
-        with open(output_path, 'w') as f:
-            f.write(report)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            for chunk in chunks:
+                f.write(chunk)
         click.echo(f"✅ Report saved to: {output_path}")
     else:
-        click.echo(report)
+        for chunk in chunks:
+            click.echo(chunk, nl=False)
 
 def determine_exit_code(results: Dict[str, Any], strict: bool) -> int:
     """Determine appropriate exit code based on validation results."""
@@ -459,20 +872,89 @@ def determine_exit_code(results: Dict[str, Any], strict: bool) -> int:
     else:
         return 0
 
-# TODO: Add utility functions
-
 def load_config(config_path: str) -> Dict[str, Any]:
-    """Load validation configuration from file."""
-    # TODO: Implement configuration loading
-    # - Support YAML/JSON config files
-    # - Allow custom validation rules
-    # - Support rule disabling/enabling
-    pass
+    """
+    Load validation configuration from file.
+    
+    The file (YAML or JSON) may load custom rule plugins (modules or .py
+    files, relative to the config file, that register rules with
+    validator.rule), group rule ids by level mapping each to a severity or
+    'off', carry rule settings, and set rule time budgets in milliseconds:
+    
+        plugins:
+          - rules/company_rules.py
+        rules:
+          semantic:
+            get_with_body: error
+          agent_ready:
+            missing_parameter_description: off
+        settings:
+          min_description_length: 20
+          schema_check: fail-fast
+        performance:
+          budgets:
+            company_naming: 200
+    
+    Custom rules get a PLUGIN_RULE_BUDGET_MS budget unless one is set, so a
+    pathologically slow plugin is reported. Any budget turns on profiling.
+    
+    Returns {'rules': {rule_id: severity_or_off}, 'settings': {...},
+    'budgets': {rule_id: ms}}.
+    """
+    with open(config_path, 'r', encoding='utf-8') as f:
+        if is_json_file(config_path):
+            raw = json.load(f)
+        else:
+            import yaml
+            raw = yaml.safe_load(f)
+    raw = raw or {}
+    
+    custom_rules = []
+    for plugin in raw.get('plugins') or []:
+        custom_rules.extend(load_rule_plugin(str(plugin), os.path.dirname(os.path.abspath(config_path))))
+    
+    rules = {}
+    for key, value in (raw.get('rules') or {}).items():
+        # Rules may be grouped under their level or listed directly
+        entries = value if isinstance(value, dict) else {key: value}
+        for rule_id, severity in entries.items():
+            # YAML reads a bare off as False
+            rules[rule_id] = 'off' if severity is False else str(severity).lower()
+    
+    unknown = sorted(set(rules) - set(registry.rules))
+    if unknown:
+        raise ValueError(f"Unknown rules in config: {', '.join(unknown)}")
+    invalid = sorted(rule_id for rule_id, severity in rules.items()
+                     if severity not in ('error', 'warning', 'info', 'off'))
+    if invalid:
+        raise ValueError(f"Invalid severity in config for: {', '.join(invalid)}")
+    
+    budgets = {rule_id: PLUGIN_RULE_BUDGET_MS for rule_id in custom_rules}
+    for rule_id, budget in ((raw.get('performance') or {}).get('budgets') or {}).items():
+        if rule_id not in registry.rules:
+            raise ValueError(f"Unknown rule in performance budgets: {rule_id}")
+        if isinstance(budget, bool) or not isinstance(budget, (int, float)) or budget <= 0:
+            raise ValueError(f"Invalid time budget for {rule_id}: expected milliseconds > 0")
+        budgets[rule_id] = budget
+    
+    settings = raw.get('settings') or {}
+    if settings.get('schema_check', 'off') not in SCHEMA_CHECK_MODES:
+        raise ValueError(f"Invalid schema_check setting: expected one of {', '.join(SCHEMA_CHECK_MODES)}")
+    
+    return {'rules': rules, 'settings': settings, 'budgets': budgets}
+
+def http_cache_dir(cache_dir: Optional[str]) -> Optional[str]:
+    """Where remote spec responses are cached inside the --cache directory."""
+    return os.path.join(cache_dir, 'http') if cache_dir else None
 
 def validate_url(url: str) -> bool:
-    """Validate if string is a valid URL."""
-    # TODO: Implement URL validation
-    return url.startswith(('http://', 'https://'))
+    """True for an absolute http(s) URL with a host."""
+    from urllib.parse import urlsplit
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return False
+    return parts.scheme.lower() in ('http', 'https') and bool(parts.hostname)
 
 def is_yaml_file(path: str) -> bool:
     """Check if file is likely a YAML file."""
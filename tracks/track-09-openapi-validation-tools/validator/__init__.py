@@ -0,0 +1,17 @@
+"""
+OpenAPI validation package used by validator.py.
+
+Importing the package registers the built-in syntax, semantic and
+agent-ready rules on the shared registry.
+"""
+
+__version__ = '0.1.0'
+
+from .engine import (LEVELS, NODE_KINDS, Node, Rule, RuleContext, RuleEngine, RuleRegistry,
+                     registry, rule, walk_spec)
+from . import syntax, semantic, agent_ready  # noqa: F401  (register built-in rules)
+
+__all__ = [
+    'LEVELS', 'NODE_KINDS', 'Node', 'Rule', 'RuleContext', 'RuleEngine', 'RuleRegistry',
+    'registry', 'rule', 'walk_spec',
+]
@@ -0,0 +1,35 @@
+"""
+Agent-ready rules: documentation completeness for AI agent usage.
+"""
+
+from .engine import OPERATION, PARAMETER, rule
+
+DEFAULT_MIN_DESCRIPTION_LENGTH = 10
+
+
+@rule('missing_operation_id', level='agent-ready', kinds=(OPERATION,), severity='warning')
+def check_missing_operation_id(node, context):
+    """Operations should have an operationId."""
+    if 'operationId' not in node.value:
+        yield node.finding('missing_operation_id', 'Operation missing operationId - recommended for agent usage',
+                           'Add a unique operationId, e.g. listUsers')
+
+
+@rule('insufficient_description', level='agent-ready', kinds=(OPERATION,), severity='warning')
+def check_insufficient_description(node, context):
+    """Operations need a detailed description."""
+    min_length = context.settings.get('min_description_length', DEFAULT_MIN_DESCRIPTION_LENGTH)
+    description = node.value.get('description')
+    if not isinstance(description, str) or len(description.strip()) < min_length:
+        yield node.finding('insufficient_description',
+                           'Operation needs detailed description for agent understanding',
+                           f'Add a description field with at least {min_length} characters')
+
+
+@rule('missing_parameter_description', level='agent-ready', kinds=(PARAMETER,), severity='warning')
+def check_missing_parameter_description(node, context):
+    """Parameters should explain what they do."""
+    if '$ref' not in node.value and not node.value.get('description'):
+        name = node.value.get('name', '?')
+        yield node.finding('missing_parameter_description', f'Parameter {name} has no description',
+                           'Describe the parameter, its format and allowed values')
@@ -0,0 +1,234 @@
+"""
+Split specifications: a root document plus the files it pulls in with
+external $refs ("paths/users.yaml", "schemas.yaml#/Pet").
+
+The rules only follow local "#/..." references, so a split spec is
+validated as one bundled document in which every external $ref is replaced
+by the content it points to. Bundles are rebuilt incrementally: each
+inlined target is memoized with the files it was built from, and a change
+to a file only rebuilds the targets that depend on it. Unchanged targets
+keep their identity across builds, so the findings cache skips hashing and
+re-checking them (see validator/cache.py).
+"""
+
+import hashlib
+import os
+import re
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from .engine import resolve_pointer
+
+# $refs whose value does / does not start with '#', in JSON or YAML source
+_LOCAL_REF = re.compile(r'''\$ref["']?\s*:\s*["']?#''')
+_EXTERNAL_REF = re.compile(r'''\$ref["']?\s*:\s*["']?[^#\s"']''')
+
+
+class DocumentStore:
+    """
+    Parsed documents kept between validations.
+
+    Files are re-parsed only when their mtime or size changes, buffers only
+    when their content does. `parse(text, name)` returns (spec, positions).
+    """
+
+    def __init__(self, parse: Callable[[str, str], Tuple[Any, Any]]):
+        self.parse = parse
+        self._documents: Dict[str, Tuple[Any, Any, Any]] = {}
+        # Per document: whether it contains local and external $refs
+        self.refs: Dict[str, Tuple[bool, bool]] = {}
+        self.parsed = 0
+        self.reused = 0
+
+    def load(self, path: str, content: Optional[str] = None) -> Tuple[Any, Any]:
+        if content is None:
+            stat = os.stat(path)
+            version: Any = (stat.st_mtime_ns, stat.st_size)
+        else:
+            version = hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+
+        cached = self._documents.get(path)
+        if cached is not None and cached[0] == version:
+            self.reused += 1
+            return cached[1], cached[2]
+
+        if content is None:
+            with open(path, 'r', encoding='utf-8-sig') as f:
+                content = f.read()
+        spec, positions = self.parse(content, path)
+        self._documents[path] = (version, spec, positions)
+        self.refs[path] = (bool(_LOCAL_REF.search(content)), bool(_EXTERNAL_REF.search(content)))
+        self.parsed += 1
+        return spec, positions
+
+    def positions(self, path: str) -> Any:
+        cached = self._documents.get(path)
+        return cached[2] if cached else None
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+
+def split_ref(ref: str, base_file: str) -> Tuple[str, str]:
+    """(absolute file, JSON pointer fragment) a $ref in `base_file` points to."""
+    file_part, _, fragment = ref.partition('#')
+    if not file_part:
+        return base_file, fragment
+    return os.path.normpath(os.path.join(os.path.dirname(base_file), file_part)), fragment
+
+
+class SpecBundle:
+    """A root spec with its external $refs inlined, rebuilt as files change."""
+
+    def __init__(self, root: str, store: DocumentStore):
+        self.root = os.path.abspath(root)
+        self.store = store
+        # Every file the last build read (or tried to: missing targets count)
+        self.files: Set[str] = {self.root}
+        # External $refs that could not be resolved: (file, ref, reason)
+        self.unresolved: List[Tuple[str, str, str]] = []
+        # (file, fragment) -> (inlined value, files it was built from, unresolved refs in it)
+        self._inlined: Dict[Tuple[str, str], Tuple[Any, FrozenSet[str], List[Tuple[str, str, str]]]] = {}
+        self._collecting: List[List[Tuple[str, str, str]]] = []
+        # Document object each inlined file was read as, to detect changes
+        self._loaded: Dict[str, Any] = {}
+        # id(inlined object) -> (object, file, pointer in file), for positions
+        self._origins: Dict[int, Tuple[Any, str, str]] = {}
+
+    def build(self, changed: Optional[Iterable[str]] = None,
+              content: Optional[str] = None) -> Tuple[Dict[str, Any], 'BundleIndex']:
+        """
+        Bundle the spec, rebuilding only what depends on the `changed` files.
+
+        Without `changed`, every file of the last build is checked for
+        changes (one stat each). `content` replaces the root file's text,
+        e.g. an unsaved editor buffer.
+        """
+        if changed is None:
+            changed = {path for path in self.files - {self.root} if self._has_changed(path)}
+        else:
+            changed = {os.path.abspath(path) for path in changed}
+        if changed:
+            for key, (value, deps, _) in list(self._inlined.items()):
+                if deps & changed:
+                    del self._inlined[key]
+                    self._origins.pop(id(value), None)
+
+        self._collecting = [[]]
+        spec, _ = self.store.load(self.root, content)
+        files: Set[str] = {self.root}
+        if self.store.refs[self.root][1]:
+            spec = self._inline(spec, self.root, frozenset(), files)
+        self.unresolved = self._collecting.pop()
+        if not isinstance(spec, dict):
+            raise ValueError(f"{self.root} is not an OpenAPI document (expected a mapping at the root)")
+        self.files = files
+        return spec, BundleIndex(spec, self.root, self.store, self._origins)
+
+    def _resolve(self, path: str, fragment: str, active: FrozenSet[Tuple[str, str]], files: Set[str]) -> Any:
+        """Inlined target of an external $ref; adds the files it was built from to `files`."""
+        key = (path, fragment)
+        cached = self._inlined.get(key)
+        if cached is None:
+            document, _ = self.store.load(path)
+            self._loaded[path] = document
+            target = resolve_pointer(document, '#' + fragment) if fragment else document
+            local, external = self.store.refs[path]
+            value, deps = target, {path}
+            self._collecting.append([])
+            try:
+                if local or external:
+                    value = self._inline(target, path, active | {key}, deps)
+            finally:
+                unresolved = self._collecting.pop()
+            cached = self._inlined[key] = (value, frozenset(deps), unresolved)
+            if isinstance(value, (dict, list)):
+                self._origins[id(value)] = (value, path, fragment)
+        files.update(cached[1])
+        self._collecting[-1].extend(cached[2])
+        return cached[0]
+
+    def _has_changed(self, path: str) -> bool:
+        previous = self._loaded.get(path)
+        try:
+            return self.store.load(path)[0] is not previous
+        except (OSError, ValueError):
+            return previous is not None
+
+    def _inline(self, value: Any, path: str, active: FrozenSet[Tuple[str, str]], files: Set[str]) -> Any:
+        """
+        Copy of `value` (from `path`) with external $refs inlined; unchanged
+        parts are shared. Files read along the way are added to `files`.
+        """
+        if isinstance(value, dict):
+            ref = value.get('$ref')
+            if isinstance(ref, str):
+                target_file, fragment = split_ref(ref, path)
+                if target_file == self.root:
+                    # Back into the root document: a local reference there
+                    return value if path == self.root else {'$ref': '#' + fragment}
+                if (target_file, fragment) in active:
+                    return value  # circular: leave the $ref in place
+                try:
+                    return self._resolve(target_file, fragment, active, files)
+                except (OSError, ValueError, KeyError) as e:
+                    reason = 'file not found' if isinstance(e, FileNotFoundError) else f'{type(e).__name__}: {e}'
+                    self._collecting[-1].append((path, ref, reason))
+                    files.add(target_file)  # re-bundle when it appears
+                    return value
+
+            result = None
+            for key, item in value.items():
+                new_item = self._inline(item, path, active, files)
+                if new_item is not item:
+                    if result is None:
+                        result = dict(value)
+                    result[key] = new_item
+            return value if result is None else result
+
+        if isinstance(value, list):
+            result = None
+            for i, item in enumerate(value):
+                new_item = self._inline(item, path, active, files)
+                if new_item is not item:
+                    if result is None:
+                        result = list(value)
+                    result[i] = new_item
+            return value if result is None else result
+
+        return value
+
+
+class BundleIndex:
+    """
+    Positions of bundled nodes in the file each one came from.
+
+    lookup() returns (line, column) for nodes of the root document and
+    (line, column, file relative to the root's directory) for inlined ones.
+    """
+
+    def __init__(self, spec: Dict[str, Any], root: str, store: DocumentStore,
+                 origins: Dict[int, Tuple[Any, str, str]]):
+        self.spec = spec
+        self.root = root
+        self.store = store
+        self.origins = origins
+
+    def lookup(self, pointer: str):
+        path, base, node = self.root, '', self.spec
+        for part in pointer.split('/')[1:] if pointer else ():
+            key = part.replace('~1', '/').replace('~0', '~')
+            try:
+                node = node[int(key)] if isinstance(node, list) else node[key]
+            except (KeyError, IndexError, ValueError, TypeError):
+                break
+            origin = self.origins.get(id(node))
+            if origin is not None and origin[0] is node:
+                path, base = origin[1], origin[2]
+            else:
+                base = f'{base}/{part}'
+
+        index = self.store.positions(path)
+        position = index.lookup(base) if index is not None else None
+        if position is None or path == self.root:
+            return position
+        return position + (os.path.relpath(path, os.path.dirname(self.root)),)
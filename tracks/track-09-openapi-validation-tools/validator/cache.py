@@ -0,0 +1,279 @@
+"""
+Incremental validation cache.
+
+Findings are stored per spec unit (document root, path item, component)
+together with a structural hash of the unit and a key for the rule set that
+produced them. On the next run only units whose hash changed, new units, and
+units that $ref a changed or removed unit are checked again; the rest replay
+their cached findings. A $ref into anything that is not a unit of its own
+(components/examples, components/headers, ...) depends on the document unit.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import types
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import unquote
+
+from .engine import COMPONENT_SECTIONS, Rule, spec_units
+from .parallel import check_units
+
+# Bump when the cache layout changes
+CACHE_FORMAT_VERSION = 5
+
+# Root fields whose value every unit's rules may read: openapi_schema checks
+# path items and components against the meta-schema of the spec version
+ROOT_INPUTS = ('openapi',)
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_REF_PATTERN = re.compile(r'"\$ref":"(#[^"]*)"')
+
+
+@lru_cache(maxsize=65536)
+def _unit_id(unit: Tuple[Any, ...]) -> str:
+    return json.dumps(list(unit))
+
+
+def _unit_value(spec: Dict[str, Any], unit: Tuple[Any, ...]) -> Any:
+    if not unit:
+        # Document rules see root fields and the names (not contents) of path
+        # items and unit components; other component sections belong to the root
+        root = dict(spec)
+        if isinstance(spec.get('paths'), dict):
+            root['paths'] = list(spec['paths'])
+        if isinstance(spec.get('components'), dict):
+            root['components'] = {section: (list(value) if section in COMPONENT_SECTIONS and isinstance(value, dict)
+                                            else value)
+                                  for section, value in spec['components'].items()}
+        return root
+    if unit[0] == 'paths':
+        return spec['paths'][unit[1]]
+    return spec['components'][unit[1]][unit[2]]
+
+
+@lru_cache(maxsize=65536)
+def _ref_target(ref: str) -> str:
+    """
+    Unit id a local $ref points into. Path items and unit components are
+    units of their own; everything else (other component sections such as
+    examples or headers, root fields) is part of the document unit.
+    """
+    parts = [unquote(part).replace('~1', '/').replace('~0', '~')
+             for part in ref[2:].split('/')] if ref.startswith('#/') else []
+    if len(parts) >= 3 and parts[0] == 'components' and parts[1] in COMPONENT_SECTIONS:
+        return _unit_id(('components', parts[1], parts[2]))
+    if len(parts) >= 2 and parts[0] == 'paths':
+        return _unit_id(('paths', parts[1]))
+    return _unit_id(())
+
+
+def fingerprint_unit(spec: Dict[str, Any], unit: Tuple[Any, ...]) -> Tuple[str, List[str]]:
+    """Structural hash of a unit and the local $refs it contains."""
+    # ensure_ascii=False keeps non-ASCII $refs matchable by _REF_PATTERN
+    canonical = json.dumps(_unit_value(spec, unit), sort_keys=True, separators=(',', ':'), default=str,
+                           ensure_ascii=False)
+    digest = hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+    return digest, sorted(set(_REF_PATTERN.findall(canonical)))
+
+
+def root_inputs_digest(spec: Dict[str, Any]) -> str:
+    """Hash of the root fields (ROOT_INPUTS) that are part of every unit's key."""
+    canonical = json.dumps([spec.get(field) for field in ROOT_INPUTS], default=str, ensure_ascii=False)
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _hash_code(code: types.CodeType, digest: Any):
+    """Feed bytecode, names and constants (including nested functions) into digest."""
+    digest.update(code.co_code)
+    digest.update(' '.join(code.co_names).encode('utf-8'))
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _hash_code(const, digest)
+        elif isinstance(const, frozenset):
+            # Set iteration order depends on the string hash seed
+            digest.update(repr(sorted(map(repr, const))).encode('utf-8'))
+        else:
+            digest.update(repr(const).encode('utf-8'))
+
+
+@lru_cache(maxsize=256)
+def _file_digest(path: str, mtime_ns: int, size: int) -> str:
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+    except OSError:
+        return ''
+
+
+def _source_digest(path: str) -> str:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return ''
+    return _file_digest(path, stat.st_mtime_ns, stat.st_size)
+
+
+def ruleset_key(rules: Iterable[Rule], settings: Optional[Dict[str, Any]]) -> str:
+    """
+    Identify the rule set: ids, severities, kinds, check code and settings,
+    plus the source of the validator package and of every module defining a
+    rule, so edited constants, messages or helpers invalidate the cache.
+    """
+    parts = [str(CACHE_FORMAT_VERSION), json.dumps(settings or {}, sort_keys=True, default=str)]
+    sources = {os.path.join(_PACKAGE_DIR, name) for name in os.listdir(_PACKAGE_DIR) if name.endswith('.py')}
+    for rule in sorted(rules, key=lambda r: r.id):
+        code = getattr(rule.check, '__code__', None)
+        code_hash = ''
+        if code is not None:
+            digest = hashlib.blake2b(digest_size=8)
+            _hash_code(code, digest)
+            code_hash = digest.hexdigest()
+        parts.append(f'{rule.id}:{rule.severity}:{",".join(rule.kinds)}:{code_hash}')
+        module_file = getattr(sys.modules.get(getattr(rule.check, '__module__', None)), '__file__', None)
+        if module_file:
+            sources.add(os.path.abspath(module_file))
+    parts.extend(f'{path}:{_source_digest(path)}' for path in sorted(sources))
+    return hashlib.blake2b('\n'.join(parts).encode('utf-8'), digest_size=16).hexdigest()
+
+
+class FindingsCache:
+    """Per-spec findings cache persisted as a JSON file, or kept in memory only without a path."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.ruleset = None
+        self.units: Dict[str, Dict[str, Any]] = {}
+        self.reused = 0
+        self.checked = 0
+        # Unit objects validated last with their fingerprints; long-lived
+        # callers (daemon, watch mode) that pass unchanged units as the same
+        # objects skip hashing them
+        self._fingerprints: Dict[str, Tuple[Any, Tuple[str, List[str]]]] = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.ruleset = data.get('ruleset')
+                self.units = data.get('units', {})
+            except (OSError, ValueError):
+                # A corrupt cache is just a cold cache
+                self.ruleset, self.units = None, {}
+
+    @classmethod
+    def for_spec(cls, cache_dir: str, spec_path: str) -> 'FindingsCache':
+        """Cache file for a spec inside a cache directory."""
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        source = spec_path if '://' in spec_path else os.path.abspath(spec_path)
+        name = hashlib.blake2b(source.encode('utf-8'), digest_size=12).hexdigest()
+        return cls(os.path.join(cache_dir, f'{name}.json'))
+
+    def save(self):
+        if not self.path:
+            return
+        tmp_path = f'{self.path}.tmp'
+        # json.dumps uses the C encoder; json.dump to a file does not
+        payload = json.dumps({'ruleset': self.ruleset, 'units': self.units}, separators=(',', ':'))
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        os.replace(tmp_path, self.path)
+
+
+def dirty_units(cache: FindingsCache, ruleset: str,
+                fingerprints: Dict[str, Tuple[str, List[str]]]) -> Set[str]:
+    """Units that must be re-checked: changed, new, or depending on a changed unit."""
+    if cache.ruleset != ruleset:
+        return set(fingerprints)
+
+    changed = {uid for uid, (digest, _) in fingerprints.items()
+               if cache.units.get(uid, {}).get('hash') != digest}
+    changed |= set(cache.units) - set(fingerprints)  # removed units
+
+    dependents = defaultdict(set)
+    dirty = set()
+    for uid, (_, refs) in fingerprints.items():
+        for ref in refs:
+            dependents[_ref_target(ref)].add(uid)
+
+    # Everything that transitively $refs a changed unit is dirty too
+    pending = list(changed)
+    visited = set()
+    while pending:
+        uid = pending.pop()
+        if uid in visited:
+            continue
+        visited.add(uid)
+        dirty.add(uid)
+        pending.extend(dependents.get(uid, ()))
+
+    return dirty & set(fingerprints)
+
+
+def run_incremental(spec: Dict[str, Any], rules: List[Rule], settings: Optional[Dict[str, Any]],
+                    cache: FindingsCache, level: str, overrides: Optional[Dict[str, str]] = None,
+                    jobs: int = 1, profile: bool = False) -> Dict[str, Any]:
+    """
+    Validate a spec, replaying cached findings for unchanged units.
+
+    Returns the same {'findings', 'stats'} shape as RuleEngine.run, in the
+    same order, and updates and saves the cache. Profiled timings cover the
+    re-checked units only. Units are not modified in place between runs
+    sharing a cache object: one passed again as the same object is assumed
+    unchanged.
+    """
+    units = spec_units(spec)
+    ids = [_unit_id(unit) for unit in units]
+    fingerprints = {}
+    known = {}
+    for uid, unit in zip(ids, units):
+        value = _unit_value(spec, unit) if unit else None  # the root view is rebuilt every run
+        previous = cache._fingerprints.get(uid)
+        if value is not None and previous is not None and previous[0] is value:
+            fingerprints[uid] = previous[1]
+        else:
+            fingerprints[uid] = fingerprint_unit(spec, unit)
+        known[uid] = (value, fingerprints[uid])
+    cache._fingerprints = known
+    # Unit keys include the root inputs, so e.g. a new spec version re-checks every unit
+    root = root_inputs_digest(spec)
+    fingerprints = {uid: (f'{root}:{digest}', refs) for uid, (digest, refs) in fingerprints.items()}
+    ruleset = ruleset_key(rules, settings)
+    dirty = dirty_units(cache, ruleset, fingerprints)
+
+    to_check = [unit for uid, unit in zip(ids, units) if uid in dirty]
+    timings = {} if profile else None
+    fresh = dict(zip((_unit_id(unit) for unit in to_check),
+                     check_units(spec, to_check, level, overrides, settings, jobs, timings)))
+
+    findings: List[Dict[str, Any]] = []
+    operations = 0
+    new_units = {}
+    for uid in ids:
+        if uid in fresh:
+            unit_findings, unit_operations = fresh[uid]
+        else:
+            cached = cache.units[uid]
+            unit_findings, unit_operations = cached['findings'], cached['operations']
+        findings.extend(unit_findings)
+        operations += unit_operations
+        digest, refs = fingerprints[uid]
+        new_units[uid] = {'hash': digest, 'refs': refs,
+                          'findings': unit_findings, 'operations': unit_operations}
+
+    cache.checked = len(to_check)
+    cache.reused = len(ids) - len(to_check)
+    if to_check or cache.ruleset != ruleset or len(cache.units) != len(new_units):
+        cache.ruleset = ruleset
+        cache.units = new_units
+        cache.save()
+
+    stats = {'total_operations': operations}
+    if profile:
+        stats['rule_timings'] = timings
+    return {'findings': findings, 'stats': stats}
@@ -0,0 +1,76 @@
+"""
+Thin client for the validation daemon (validator.py --serve SOCKET).
+
+Imports only the standard library and the daemon protocol, so a request
+costs interpreter start-up plus a socket round trip:
+
+    python -m validator.client --socket /tmp/validator.sock api.yaml
+    python -m validator.client --socket /tmp/validator.sock api.yaml --stdin < buffer.yaml
+
+Prints the daemon's report and exits with its exit code, like validator.py.
+"""
+
+import argparse
+import os
+import sys
+
+from .daemon import request
+
+LEVELS = ('syntax', 'semantic', 'agent-ready')
+FORMATS = ('console', 'json', 'jsonl', 'junit', 'html')
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m validator.client',
+                                     description='Validate a spec with a running validator daemon.')
+    parser.add_argument('spec_path', nargs='?', help='Spec file to validate')
+    parser.add_argument('--socket', '-s', default=os.environ.get('VALIDATOR_SOCKET'),
+                        help='Daemon socket (default: $VALIDATOR_SOCKET)')
+    parser.add_argument('--level', '-l', choices=LEVELS, default='semantic')
+    parser.add_argument('--format', '-f', choices=FORMATS, default='console')
+    parser.add_argument('--config', '-c', help='Path to configuration file')
+    parser.add_argument('--strict', action='store_true', help='Treat warnings as errors')
+    parser.add_argument('--schema-check', choices=('off', 'fail-fast', 'collect-all'))
+    parser.add_argument('--stdin', action='store_true',
+                        help='Validate the content on stdin (an unsaved buffer) as SPEC_PATH')
+    parser.add_argument('--ping', action='store_true', help='Check that the daemon is running')
+    parser.add_argument('--stats', action='store_true', help='Show warm cache statistics')
+    parser.add_argument('--shutdown', action='store_true', help='Stop the daemon')
+    args = parser.parse_args(argv)
+
+    if not args.socket:
+        parser.error('--socket or $VALIDATOR_SOCKET is required')
+    command = next((name for name in ('ping', 'stats', 'shutdown') if getattr(args, name)), 'validate')
+    payload = {'command': command}
+    if command == 'validate':
+        if not args.spec_path:
+            parser.error('the following arguments are required: spec_path')
+        payload.update(path=os.path.abspath(args.spec_path), level=args.level, format=args.format,
+                       strict=args.strict, schema_check=args.schema_check,
+                       config=os.path.abspath(args.config) if args.config else None)
+        if args.stdin:
+            payload['content'] = sys.stdin.read()
+
+    try:
+        response = request(args.socket, payload)
+    except (OSError, ConnectionError) as e:
+        print(f"❌ Error: cannot reach the validator daemon on {args.socket}: {e}", file=sys.stderr)
+        return 1
+    if not response.get('ok'):
+        print(f"❌ Error: {response.get('error')}", file=sys.stderr)
+        return 1
+
+    if command == 'validate':
+        sys.stdout.write(response['report'] + '\n')
+        return response['exit_code']
+    if command == 'stats':
+        for key, value in sorted(response.items()):
+            if key != 'ok':
+                print(f"{key}: {value}")
+    elif command == 'ping':
+        print(f"✅ Daemon running (pid {response['pid']})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""
+Long-running validation daemon on a local Unix socket.
+
+A fresh validator.py process spends most of a small run on interpreter
+start-up, imports and parsing. The daemon pays that once and keeps parsed
+documents and in-memory findings caches warm between requests. Editors and
+pre-commit hooks then get results in milliseconds: only the units changed
+since the last request are re-checked.
+
+The protocol is one JSON object per line in each direction:
+
+    {"command": "validate", "path": "api.yaml", "level": "semantic", "format": "console"}
+    {"ok": true, "exit_code": 1, "report": "...", "summary": {...}}
+
+"content" validates an unsaved editor buffer in place of the file on disk.
+The other commands are "ping", "stats" and "shutdown". The server logic is
+generic: validator.py supplies the handler for everything else.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import threading
+from typing import Any, Callable, Dict, Optional
+
+# Largest request line accepted, so a runaway client cannot exhaust memory
+MAX_REQUEST_BYTES = 64 * 2 ** 20
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        server = self.server
+        while True:
+            line = self.rfile.readline(MAX_REQUEST_BYTES + 1)
+            if not line:
+                return
+            try:
+                if len(line) > MAX_REQUEST_BYTES:
+                    raise ValueError("Request too large")
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("Request must be a JSON object")
+                response = server.dispatch(request)
+            except Exception as e:
+                response = {'ok': False, 'error': f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+            self.wfile.flush()
+
+
+def _remove_stale_socket(socket_path: str):
+    """Remove a socket file left behind by a dead daemon; refuse to steal a live one."""
+    if not os.path.exists(socket_path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        os.unlink(socket_path)
+    else:
+        raise RuntimeError(f"A daemon is already listening on {socket_path}")
+    finally:
+        probe.close()
+
+
+def serve(socket_path: str, handler: Callable[[Dict[str, Any]], Dict[str, Any]],
+          on_ready: Optional[Callable[[], None]] = None,
+          stats: Optional[Callable[[], Dict[str, Any]]] = None):
+    """
+    Serve requests on a Unix socket until a "shutdown" request arrives.
+
+    `handler` answers every command other than ping/stats/shutdown. Calls
+    to it are serialized, so it may keep unsynchronized warm state.
+    """
+    _remove_stale_socket(socket_path)
+    lock = threading.Lock()
+    counters = {'requests': 0}
+
+    server = _Server(socket_path, _RequestHandler)
+
+    def dispatch(request):
+        command = request.get('command', 'validate')
+        if command == 'ping':
+            return {'ok': True, 'pid': os.getpid()}
+        if command == 'shutdown':
+            threading.Thread(target=server.shutdown, daemon=True).start()
+            return {'ok': True}
+        with lock:
+            if command == 'stats':
+                return dict(stats() if stats else {}, ok=True, requests=counters['requests'])
+            counters['requests'] += 1
+            return handler(request)
+
+    server.dispatch = dispatch
+    try:
+        os.chmod(socket_path, 0o600)
+        if on_ready:
+            on_ready()
+        server.serve_forever(poll_interval=0.1)
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def request(socket_path: str, payload: Dict[str, Any], timeout: Optional[float] = 60.0) -> Dict[str, Any]:
+    """Send one request to a running daemon and return its response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(socket_path)
+        client.sendall(json.dumps(payload).encode('utf-8') + b'\n')
+        with client.makefile('rb') as responses:
+            line = responses.readline()
+    if not line:
+        raise ConnectionError(f"Daemon on {socket_path} closed the connection")
+    return json.loads(line)
@@ -0,0 +1,435 @@
+"""
+Rule engine for the OpenAPI validator.
+
+Rules declare the node kinds they inspect. The spec is traversed once and
+every node is dispatched to all rules interested in its kind, so adding a
+rule does not add another walk over the document.
+"""
+
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Node kinds a rule can subscribe to
+DOCUMENT = 'document'
+PATH_ITEM = 'path'
+OPERATION = 'operation'
+PARAMETER = 'parameter'
+REQUEST_BODY = 'requestBody'
+RESPONSE = 'response'
+SCHEMA = 'schema'
+COMPONENT = 'component'  # a whole entry of components.<section>
+
+NODE_KINDS = (DOCUMENT, PATH_ITEM, OPERATION, PARAMETER, REQUEST_BODY, RESPONSE, SCHEMA, COMPONENT)
+
+# Every operation method of an OpenAPI path item, TRACE included: rules check
+# TRACE operations and total_operations counts them like any other
+HTTP_METHODS = ('get', 'post', 'put', 'delete', 'patch', 'head', 'options', 'trace')
+
+# Each level includes every rule of the levels before it
+LEVELS = ('syntax', 'semantic', 'agent-ready')
+LEVEL_RANK = {level: rank for rank, level in enumerate(LEVELS)}
+
+SEVERITIES = ('error', 'warning', 'info')
+
+# Schema keywords holding a single nested schema / a list of them / a map of them
+_SCHEMA_SINGLE = ('items', 'not', 'additionalProperties')
+_SCHEMA_LIST = ('allOf', 'oneOf', 'anyOf')
+_SCHEMA_MAP = ('properties', 'patternProperties')
+
+
+def format_location(keys: Tuple[Any, ...]) -> str:
+    """Render node keys as the dotted location used in findings, e.g. paths./users.get.parameters[0]."""
+    if not keys:
+        return 'root'
+    parts = []
+    for key in keys:
+        if isinstance(key, int):
+            parts[-1] = f'{parts[-1]}[{key}]'
+        else:
+            parts.append(str(key))
+    return '.'.join(parts)
+
+
+def json_pointer(keys: Tuple[Any, ...]) -> str:
+    """Render node keys as an RFC 6901 JSON pointer, e.g. /paths/~1users/get/parameters/0."""
+    return ''.join('/' + str(key).replace('~', '~0').replace('/', '~1') for key in keys)
+
+
+class Node:
+    """A node of the spec handed to rules: its kind, value and position."""
+
+    __slots__ = ('kind', 'value', 'keys', 'path', 'method')
+
+    def __init__(self, kind: str, value: Any, keys: Tuple[Any, ...],
+                 path: Optional[str] = None, method: Optional[str] = None):
+        self.kind = kind
+        self.value = value
+        self.keys = keys
+        self.path = path
+        self.method = method
+
+    @property
+    def location(self) -> str:
+        return format_location(self.keys)
+
+    @property
+    def pointer(self) -> str:
+        return json_pointer(self.keys)
+
+    def finding(self, finding_type: str, message: str, fix_suggestion: Optional[str] = None,
+                **extra) -> Dict[str, Any]:
+        """Build a finding located at this node; severity is filled in by the engine."""
+        result = {'type': finding_type, 'location': self.location, 'pointer': self.pointer,
+                  'message': message}
+        if fix_suggestion:
+            result['fix_suggestion'] = fix_suggestion
+        result.update(extra)
+        return result
+
+
+class RuleContext:
+    """What a rule can see besides the node: the whole spec and rule settings."""
+
+    __slots__ = ('spec', 'settings')
+
+    def __init__(self, spec: Dict[str, Any], settings: Optional[Dict[str, Any]] = None):
+        self.spec = spec
+        self.settings = settings or {}
+
+
+class Rule:
+    """A validation rule: a check function plus the node kinds and level it applies to."""
+
+    __slots__ = ('id', 'check', 'level', 'kinds', 'severity', 'description')
+
+    def __init__(self, rule_id: str, check: Callable[[Node, RuleContext], Iterable[Dict[str, Any]]],
+                 level: str, kinds: Iterable[str], severity: str = 'warning', description: str = ''):
+        if level not in LEVEL_RANK:
+            raise ValueError(f"Unknown validation level for rule {rule_id}: {level}")
+        unknown = set(kinds) - set(NODE_KINDS)
+        if unknown:
+            raise ValueError(f"Unknown node kinds for rule {rule_id}: {', '.join(sorted(unknown))}")
+        if severity not in SEVERITIES:
+            raise ValueError(f"Unknown severity for rule {rule_id}: {severity}")
+        self.id = rule_id
+        self.check = check
+        self.level = level
+        self.kinds = tuple(kinds)
+        self.severity = severity
+        self.description = description
+
+    def with_severity(self, severity: str) -> 'Rule':
+        """Copy of this rule reporting at a different severity."""
+        return Rule(self.id, self.check, self.level, self.kinds, severity, self.description)
+
+
+class RuleRegistry:
+    """Collection of rules, selectable per validation level."""
+
+    def __init__(self):
+        self.rules: Dict[str, Rule] = {}
+
+    def add(self, new_rule: Rule) -> Rule:
+        if new_rule.id in self.rules:
+            raise ValueError(f"Duplicate rule id: {new_rule.id}")
+        self.rules[new_rule.id] = new_rule
+        return new_rule
+
+    def register(self, rule_id: str, level: str, kinds: Iterable[str], severity: str = 'warning'):
+        """Decorator registering a check function as a rule."""
+        def decorator(check):
+            self.add(Rule(rule_id, check, level, kinds, severity, (check.__doc__ or '').strip()))
+            return check
+        return decorator
+
+    def select(self, level: str, overrides: Optional[Dict[str, str]] = None,
+               exact: bool = False) -> List[Rule]:
+        """
+        Rules enabled at a level.
+
+        overrides maps rule ids to a severity or 'off'. With exact=True only
+        rules defined at that level are returned, not those of lower levels.
+        """
+        if level not in LEVEL_RANK:
+            raise ValueError(f"Unknown validation level: {level}")
+        overrides = overrides or {}
+        selected = []
+        for candidate in self.rules.values():
+            if exact and candidate.level != level:
+                continue
+            if LEVEL_RANK[candidate.level] > LEVEL_RANK[level]:
+                continue
+            override = overrides.get(candidate.id)
+            if override == 'off':
+                continue
+            selected.append(candidate.with_severity(override) if override else candidate)
+        return selected
+
+
+registry = RuleRegistry()
+rule = registry.register
+
+
+def _walk_schema(schema: Any, keys: Tuple[Any, ...], path: Optional[str],
+                 method: Optional[str]) -> Iterator[Node]:
+    if not isinstance(schema, dict):
+        return
+    yield Node(SCHEMA, schema, keys, path, method)
+    for keyword in _SCHEMA_SINGLE:
+        child = schema.get(keyword)
+        if isinstance(child, dict):
+            yield from _walk_schema(child, keys + (keyword,), path, method)
+    for keyword in _SCHEMA_LIST:
+        children = schema.get(keyword)
+        if isinstance(children, list):
+            for i, child in enumerate(children):
+                yield from _walk_schema(child, keys + (keyword, i), path, method)
+    for keyword in _SCHEMA_MAP:
+        children = schema.get(keyword)
+        if isinstance(children, dict):
+            for name, child in children.items():
+                yield from _walk_schema(child, keys + (keyword, name), path, method)
+
+
+def _walk_content(content: Any, keys: Tuple[Any, ...], path: Optional[str], method: Optional[str],
+                  kinds: Set[str]) -> Iterator[Node]:
+    if SCHEMA not in kinds or not isinstance(content, dict):
+        return
+    for media_type, media in content.items():
+        if isinstance(media, dict) and 'schema' in media:
+            yield from _walk_schema(media['schema'], keys + ('content', media_type, 'schema'), path, method)
+
+
+def _walk_parameters(parameters: Any, keys: Tuple[Any, ...], path: Optional[str], method: Optional[str],
+                     kinds: Set[str]) -> Iterator[Node]:
+    if not isinstance(parameters, list):
+        return
+    for i, parameter in enumerate(parameters):
+        if not isinstance(parameter, dict):
+            continue
+        param_keys = keys + ('parameters', i)
+        if PARAMETER in kinds:
+            yield Node(PARAMETER, parameter, param_keys, path, method)
+        if SCHEMA in kinds and 'schema' in parameter:
+            yield from _walk_schema(parameter['schema'], param_keys + ('schema',), path, method)
+        if 'content' in parameter:
+            yield from _walk_content(parameter['content'], param_keys, path, method, kinds)
+
+
+def _walk_response(response: Any, keys: Tuple[Any, ...], path: Optional[str], method: Optional[str],
+                   kinds: Set[str]) -> Iterator[Node]:
+    if not isinstance(response, dict):
+        return
+    if RESPONSE in kinds:
+        yield Node(RESPONSE, response, keys, path, method)
+    yield from _walk_content(response.get('content'), keys, path, method, kinds)
+
+
+def _walk_request_body(body: Any, keys: Tuple[Any, ...], path: Optional[str], method: Optional[str],
+                       kinds: Set[str]) -> Iterator[Node]:
+    if not isinstance(body, dict):
+        return
+    if REQUEST_BODY in kinds:
+        yield Node(REQUEST_BODY, body, keys, path, method)
+    yield from _walk_content(body.get('content'), keys, path, method, kinds)
+
+
+def walk_document(spec: Dict[str, Any], kinds: Set[str]) -> Iterator[Node]:
+    """Yield the root document node."""
+    if DOCUMENT in kinds:
+        yield Node(DOCUMENT, spec, ())
+
+
+def walk_path_item(path: str, path_item: Any, kinds: Set[str]) -> Iterator[Node]:
+    """Yield every node below one entry of the paths object."""
+    if not isinstance(path_item, dict):
+        return
+    keys = ('paths', path)
+    if PATH_ITEM in kinds:
+        yield Node(PATH_ITEM, path_item, keys, path)
+    yield from _walk_parameters(path_item.get('parameters'), keys, path, None, kinds)
+
+    for method in HTTP_METHODS:
+        operation = path_item.get(method)
+        if not isinstance(operation, dict):
+            continue
+        op_keys = keys + (method,)
+        if OPERATION in kinds:
+            yield Node(OPERATION, operation, op_keys, path, method)
+        yield from _walk_parameters(operation.get('parameters'), op_keys, path, method, kinds)
+        if 'requestBody' in operation:
+            yield from _walk_request_body(operation['requestBody'], op_keys + ('requestBody',),
+                                          path, method, kinds)
+        responses = operation.get('responses')
+        if isinstance(responses, dict):
+            for code, response in responses.items():
+                yield from _walk_response(response, op_keys + ('responses', str(code)), path, method, kinds)
+
+
+def walk_component(section: str, name: str, value: Any, kinds: Set[str]) -> Iterator[Node]:
+    """Yield every node of one reusable component."""
+    keys = ('components', section, name)
+    if COMPONENT in kinds and isinstance(value, dict):
+        yield Node(COMPONENT, value, keys)
+    if section == 'schemas':
+        if SCHEMA in kinds:
+            yield from _walk_schema(value, keys, None, None)
+    elif section == 'parameters':
+        if isinstance(value, dict):
+            if PARAMETER in kinds:
+                yield Node(PARAMETER, value, keys)
+            if SCHEMA in kinds and 'schema' in value:
+                yield from _walk_schema(value['schema'], keys + ('schema',), None, None)
+    elif section == 'responses':
+        yield from _walk_response(value, keys, None, None, kinds)
+    elif section == 'requestBodies':
+        yield from _walk_request_body(value, keys, None, None, kinds)
+
+
+COMPONENT_SECTIONS = ('schemas', 'parameters', 'responses', 'requestBodies')
+
+
+def spec_units(spec: Dict[str, Any]) -> List[Tuple[Any, ...]]:
+    """
+    Independent units of the spec in traversal order: the document root, each
+    path item and each component. Units can be checked separately (e.g. on
+    different workers) and their findings concatenated in this order.
+    """
+    units: List[Tuple[Any, ...]] = [()]
+
+    paths = spec.get('paths')
+    if isinstance(paths, dict):
+        units.extend(('paths', path) for path in paths)
+
+    components = spec.get('components')
+    if isinstance(components, dict):
+        for section in COMPONENT_SECTIONS:
+            entries = components.get(section)
+            if isinstance(entries, dict):
+                units.extend(('components', section, name) for name in entries)
+    return units
+
+
+def walk_unit(spec: Dict[str, Any], unit: Tuple[Any, ...], kinds: Set[str]) -> Iterator[Node]:
+    """Yield the nodes of one unit returned by spec_units."""
+    if not unit:
+        yield from walk_document(spec, kinds)
+    elif unit[0] == 'paths':
+        yield from walk_path_item(unit[1], spec['paths'][unit[1]], kinds)
+    else:
+        _, section, name = unit
+        yield from walk_component(section, name, spec['components'][section][name], kinds)
+
+
+def walk_spec(spec: Dict[str, Any], kinds: Optional[Set[str]] = None) -> Iterator[Node]:
+    """Single traversal of the spec yielding nodes of the requested kinds."""
+    kinds = set(NODE_KINDS) if kinds is None else kinds
+    for unit in spec_units(spec):
+        yield from walk_unit(spec, unit, kinds)
+
+
+class RuleEngine:
+    """
+    Runs a set of rules over a spec in one traversal.
+
+    With profile=True every rule call is timed; `timings` maps rule ids to
+    [seconds, calls, findings] and is included in the run stats.
+    """
+
+    def __init__(self, rules: Iterable[Rule], settings: Optional[Dict[str, Any]] = None,
+                 profile: bool = False):
+        self.rules = list(rules)
+        self.settings = settings or {}
+        self.timings: Dict[str, List[float]] = {}
+        if profile:
+            self.timings = {rule_.id: [0.0, 0, 0] for rule_ in self.rules}
+            self.check_node = self.check_node_profiled
+        self.dispatch: Dict[str, List[Rule]] = defaultdict(list)
+        for rule_ in self.rules:
+            for kind in rule_.kinds:
+                self.dispatch[kind].append(rule_)
+        # Operations are always visited so the run can report how many it saw
+        self.kinds = set(self.dispatch) | {OPERATION}
+
+    def check_node(self, node: Node, context: RuleContext, findings: List[Dict[str, Any]]):
+        """Dispatch one node to every interested rule."""
+        for rule_ in self.dispatch.get(node.kind, ()):
+            for finding in rule_.check(node, context) or ():
+                finding['severity'] = rule_.severity
+                finding['rule'] = rule_.id
+                findings.append(finding)
+
+    def check_node_profiled(self, node: Node, context: RuleContext, findings: List[Dict[str, Any]]):
+        """check_node, recording time, calls and findings per rule."""
+        timings = self.timings
+        for rule_ in self.dispatch.get(node.kind, ()):
+            before = len(findings)
+            start = time.perf_counter()
+            for finding in rule_.check(node, context) or ():
+                finding['severity'] = rule_.severity
+                finding['rule'] = rule_.id
+                findings.append(finding)
+            timing = timings[rule_.id]
+            timing[0] += time.perf_counter() - start
+            timing[1] += 1
+            timing[2] += len(findings) - before
+
+    def take_timings(self) -> Dict[str, List[float]]:
+        """Timings collected so far, resetting the counters."""
+        timings = self.timings
+        self.timings = {rule_id: [0.0, 0, 0] for rule_id in timings}
+        return timings
+
+    def run_nodes(self, nodes: Iterable[Node], context: RuleContext) -> Tuple[List[Dict[str, Any]], int]:
+        """Check a stream of nodes; returns the findings and the number of operations seen."""
+        findings = []
+        operations = 0
+        for node in nodes:
+            if node.kind == OPERATION:
+                operations += 1
+            self.check_node(node, context, findings)
+        return findings, operations
+
+    def run_units(self, spec: Dict[str, Any], units: Iterable[Tuple[Any, ...]]) -> Tuple[List[Dict[str, Any]], int]:
+        """Check only the given units of a spec."""
+        context = RuleContext(spec, self.settings)
+        nodes = (node for unit in units for node in walk_unit(spec, unit, self.kinds))
+        return self.run_nodes(nodes, context)
+
+    def run(self, spec: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate a whole spec."""
+        context = RuleContext(spec, self.settings)
+        findings, operations = self.run_nodes(walk_spec(spec, self.kinds), context)
+        stats = {'total_operations': operations}
+        if self.timings:
+            stats['rule_timings'] = self.take_timings()
+        return {'findings': findings, 'stats': stats}
+
+
+def merge_timings(total: Dict[str, List[float]], timings: Dict[str, List[float]]):
+    """Add per-rule [seconds, calls, findings] counters into a running total."""
+    for rule_id, (seconds, calls, found) in timings.items():
+        timing = total.setdefault(rule_id, [0.0, 0, 0])
+        timing[0] += seconds
+        timing[1] += calls
+        timing[2] += found
+
+
+def resolve_pointer(spec: Dict[str, Any], ref: str) -> Any:
+    """Resolve a local '#/...' reference; raises KeyError if it does not exist."""
+    if not ref.startswith('#'):
+        raise KeyError(ref)
+    target: Any = spec
+    for part in ref[1:].split('/')[1:]:
+        part = part.replace('~1', '/').replace('~0', '~')
+        if isinstance(target, list):
+            try:
+                target = target[int(part)]
+            except (ValueError, IndexError):
+                raise KeyError(ref)
+        elif isinstance(target, dict):
+            target = target[part]
+        else:
+            raise KeyError(ref)
+    return target
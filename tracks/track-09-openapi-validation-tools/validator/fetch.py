@@ -0,0 +1,173 @@
+"""
+Fetching remote specifications over HTTP.
+
+One pooled session is shared by every request, so specs from the same host
+reuse keep-alive connections. Responses are kept in an on-disk cache with
+their ETag / Last-Modified validators; an unchanged spec then costs a single
+conditional request answered with 304 Not Modified.
+"""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import brotli  # noqa: F401  (urllib3 decodes br responses when it is installed)
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+ACCEPT = 'application/json, application/yaml, application/x-yaml, text/yaml, */*;q=0.5'
+USER_AGENT = 'openapi-validator'
+
+
+class FetchedSpec:
+    """Body of a remote spec and how it was obtained."""
+
+    __slots__ = ('url', 'text', 'content_type', 'from_cache')
+
+    def __init__(self, url: str, text: str, content_type: str, from_cache: bool):
+        self.url = url
+        self.text = text
+        self.content_type = content_type
+        self.from_cache = from_cache
+
+    @property
+    def is_json(self) -> bool:
+        return 'json' in self.content_type or self.url.split('?')[0].lower().endswith('.json')
+
+
+class SpecFetcher:
+    """
+    HTTP client for remote specs with a pooled session and a disk cache.
+
+    With revalidate=False a cached body is used without contacting the
+    server; batch mode uses this in workers after prefetching every URL.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, pool_size: int = 16,
+                 timeout: float = 30.0, revalidate: bool = True):
+        self.cache_dir = cache_dir
+        self.timeout = timeout
+        self.revalidate = revalidate
+        self.downloads = 0
+        self.not_modified = 0
+        if cache_dir:
+            Path(cache_dir).mkdir(parents=True, exist_ok=True)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=2)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'Accept': ACCEPT, 'Accept-Encoding': ACCEPT_ENCODING,
+                                     'User-Agent': USER_AGENT})
+
+    def __enter__(self) -> 'SpecFetcher':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    def _cache_paths(self, url: str):
+        key = hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, f'{key}.json'), os.path.join(self.cache_dir, f'{key}.body')
+
+    def _load_cached(self, url: str) -> Optional[Dict[str, Any]]:
+        if not self.cache_dir:
+            return None
+        meta_path, body_path = self._cache_paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                meta['body'] = f.read()
+        except (OSError, ValueError):
+            return None
+        return meta if meta.get('url') == url else None
+
+    def _store(self, url: str, response: requests.Response):
+        meta_path, body_path = self._cache_paths(url)
+        meta = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'content_type': response.headers.get('Content-Type', ''),
+            'encoding': response.encoding,
+            'fetched_at': time.time(),
+        }
+        # Body first, so a crash never leaves metadata pointing at a missing body
+        for path, data, mode in ((body_path, response.content, 'wb'),
+                                 (meta_path, json.dumps(meta), 'w')):
+            with open(f'{path}.tmp', mode) as f:
+                f.write(data)
+            os.replace(f'{path}.tmp', path)
+
+    def fetch(self, url: str) -> FetchedSpec:
+        """Fetch a spec, revalidating a cached copy with a conditional request."""
+        cached = self._load_cached(url)
+        if cached is not None and not self.revalidate:
+            return self._from_cache(url, cached)
+
+        headers = {}
+        if cached is not None:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise ValueError(f"Failed to fetch {url}: {e}") from e
+
+        if response.status_code == 304 and cached is not None:
+            self.not_modified += 1
+            return self._from_cache(url, cached)
+        if response.status_code != 200:
+            raise ValueError(f"Failed to fetch {url}: HTTP {response.status_code}")
+
+        self.downloads += 1
+        if self.cache_dir:
+            self._store(url, response)
+        return FetchedSpec(url, self._decode(response.content, response.encoding),
+                           response.headers.get('Content-Type', ''), False)
+
+    def _from_cache(self, url: str, cached: Dict[str, Any]) -> FetchedSpec:
+        return FetchedSpec(url, self._decode(cached['body'], cached.get('encoding')),
+                           cached.get('content_type', ''), True)
+
+    @staticmethod
+    def _decode(body: bytes, encoding: Optional[str]) -> str:
+        # Specs are UTF-8 in practice; servers often omit or misreport the charset
+        try:
+            return body.decode('utf-8-sig')
+        except UnicodeDecodeError:
+            return body.decode(encoding or 'latin-1', errors='replace')
+
+    def fetch_many(self, urls: Iterable[str], workers: int = 8) -> Dict[str, Optional[str]]:
+        """
+        Fetch URLs concurrently into the cache.
+
+        Returns a map of url to error message (None on success); the bodies
+        are read back from the cache by whoever validates them.
+        """
+        def fetch_one(url):
+            try:
+                self.fetch(url)
+                return url, None
+            except ValueError as e:
+                return url, str(e)
+
+        urls = list(dict.fromkeys(urls))
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(urls)))) as executor:
+            return dict(executor.map(fetch_one, urls))
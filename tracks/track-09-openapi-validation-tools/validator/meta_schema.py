@@ -0,0 +1,169 @@
+"""
+Whole-document validation against the OpenAPI 3.0 / 3.1 meta-schemas.
+
+A spec is checked unit by unit (root, each path item, each component)
+against the matching part of the meta-schema. The check therefore fits the
+single traversal, runs on pool workers and is skipped by the incremental
+cache for unchanged units. Validators are compiled once per version and
+target and cached for the life of the process. jsonschema resolves
+meta-schema $refs lazily, only for the parts an instance actually reaches.
+
+The meta-schemas ship with openapi-spec-validator. When fastjsonschema is
+installed, OpenAPI 3.0 units are first checked by a validator it compiles to
+Python code, about 5x faster than jsonschema. Only units that fail are
+re-checked by jsonschema for detailed errors, so valid documents take the
+fast path. 3.1 uses draft 2020-12 ($dynamicRef), which fastjsonschema does
+not support.
+"""
+
+import copy
+import json
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from .engine import COMPONENT_SECTIONS
+
+MODES = ('off', 'fail-fast', 'collect-all')
+
+META_SCHEMA_FILES = {'3.0': ('v3.0', 'schema.json'), '3.1': ('v3.1', 'schema.json')}
+
+# Messages quote the offending instance; keep findings readable
+MAX_MESSAGE_LENGTH = 200
+
+# Stand-in for path items and components when checking the root unit; they
+# are validated as their own units
+_COMPONENT_PLACEHOLDER = {'$ref': '#/components'}
+
+
+def spec_version(spec: Dict[str, Any]) -> Optional[str]:
+    """'3.0' or '3.1' for documents we have a meta-schema for, else None."""
+    version = str(spec.get('openapi', ''))
+    for prefix in META_SCHEMA_FILES:
+        if version.startswith(prefix + '.'):
+            return prefix
+    return None
+
+
+@lru_cache(maxsize=None)
+def load_meta_schema(version: str) -> Dict[str, Any]:
+    try:
+        from importlib import resources
+        import openapi_spec_validator
+    except ImportError as e:
+        raise ImportError("Meta-schema validation needs openapi-spec-validator: "
+                          "pip install openapi-spec-validator") from e
+    folder, name = META_SCHEMA_FILES[version]
+    path = resources.files(openapi_spec_validator) / 'resources' / 'schemas' / folder / name
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def _schema_id(meta: Dict[str, Any]) -> str:
+    return meta.get('$id') or meta['id']
+
+
+def _target_fragment(meta: Dict[str, Any], version: str, target: str) -> str:
+    """JSON pointer, within the meta-schema, of the schema for one kind of unit."""
+    if target == 'document':
+        return ''
+    definitions, components, path_item = (('definitions', 'Components', 'PathItem') if version == '3.0'
+                                           else ('$defs', 'components', 'path-item'))
+    if target == 'path':
+        return f'/{definitions}/{path_item}'
+    section = meta[definitions][components]['properties'][target]
+    if 'patternProperties' in section:
+        pattern = next(iter(section['patternProperties']))
+        escaped = pattern.replace('~', '~0').replace('/', '~1')
+        return f'/{definitions}/{components}/properties/{target}/patternProperties/{escaped}'
+    return f'/{definitions}/{components}/properties/{target}/additionalProperties'
+
+
+@lru_cache(maxsize=None)
+def compiled_validator(version: str, target: str):
+    """
+    Validator for a unit kind: 'document', 'path' or a component section.
+
+    Built once per process; the registry holding the meta-schema is shared.
+    """
+    import jsonschema
+    from referencing import Registry, Resource
+    from referencing.jsonschema import DRAFT4
+
+    meta = load_meta_schema(version)
+    resource = Resource.from_contents(meta, default_specification=DRAFT4)
+    registry = Registry().with_resource(_schema_id(meta), resource)
+    validator_cls = jsonschema.validators.validator_for(meta)
+    fragment = _target_fragment(meta, version, target)
+    return validator_cls({'$ref': f'{_schema_id(meta)}#{fragment}'}, registry=registry)
+
+
+@lru_cache(maxsize=None)
+def compiled_check(version: str, target: str) -> Optional[Callable[[Any], Any]]:
+    """Fast validity check compiled by fastjsonschema, or None where unavailable."""
+    if version != '3.0':
+        return None
+    try:
+        import fastjsonschema
+    except ImportError:
+        return None
+    meta = load_meta_schema(version)
+    schema = meta
+    for part in _target_fragment(meta, version, target).split('/')[1:]:
+        schema = schema[part.replace('~1', '/').replace('~0', '~')]
+    # $refs in the target schema point into the meta-schema's definitions;
+    # the id keeps them resolving locally rather than against the network
+    schema = copy.deepcopy(dict(schema, definitions=meta['definitions']))
+    schema.update({'$schema': meta['$schema'], 'id': _schema_id(meta)})
+    return fastjsonschema.compile(schema, use_default=False)
+
+
+def root_placeholder(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The root unit as checked against the meta-schema: path items and unit
+    components are replaced by valid stand-ins, keeping their keys.
+    """
+    root = dict(spec)
+    paths = spec.get('paths')
+    if isinstance(paths, dict):
+        root['paths'] = {path: ({} if isinstance(item, dict) else item) for path, item in paths.items()}
+    components = spec.get('components')
+    if isinstance(components, dict):
+        root['components'] = dict(components)
+        for section in COMPONENT_SECTIONS:
+            entries = components.get(section)
+            if isinstance(entries, dict):
+                root['components'][section] = {
+                    name: (copy.copy(_COMPONENT_PLACEHOLDER) if isinstance(value, dict) else value)
+                    for name, value in entries.items()
+                }
+    return root
+
+
+def iter_violations(instance: Any, version: str, target: str,
+                    fail_fast: bool = False) -> Iterator[Tuple[Tuple[Any, ...], str]]:
+    """
+    Yield (keys below the instance, message) for each meta-schema violation.
+
+    fail_fast stops at the first violation; errors are produced lazily, so
+    the rest of the instance is never examined.
+    """
+    from jsonschema.exceptions import best_match
+
+    check = compiled_check(version, target)
+    if check is not None:
+        from fastjsonschema import JsonSchemaException
+        try:
+            check(instance)
+            return
+        except JsonSchemaException:
+            pass  # jsonschema reports the details below
+
+    for error in compiled_validator(version, target).iter_errors(instance):
+        # oneOf/anyOf failures are reported through their most relevant branch
+        if error.context:
+            error = best_match(error.context) or error
+        message = error.message
+        if len(message) > MAX_MESSAGE_LENGTH:
+            message = message[:MAX_MESSAGE_LENGTH - 3] + '...'
+        yield tuple(error.absolute_path), message
+        if fail_fast:
+            return
@@ -0,0 +1,112 @@
+"""
+Parallel rule execution across a process pool.
+
+The spec is split into units (document root, path items, components) and
+contiguous runs of units are checked on worker processes. Chunks are merged
+in submission order, so findings come out in exactly the order a serial run
+produces them and JSON reports stay reproducible.
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from .engine import RuleEngine, merge_timings, registry, spec_units
+from .plugins import load_rule_plugin, loaded_plugins
+
+# Below this many units per worker, process start-up costs more than it saves
+MIN_UNITS_PER_JOB = 250
+
+# Per-worker state, set once by the pool initializer
+_worker: Dict[str, Any] = {}
+
+
+def default_jobs() -> int:
+    return os.cpu_count() or 1
+
+
+def _init_worker(spec: Dict[str, Any], level: str, overrides: Optional[Dict[str, str]],
+                 settings: Optional[Dict[str, Any]], profile: bool, plugins: List[Tuple[str, str]]):
+    # Spawned workers only know the built-in rules until the parent's plugins are imported
+    for plugin, base_dir in plugins:
+        load_rule_plugin(plugin, base_dir)
+    _worker['spec'] = spec
+    _worker['engine'] = RuleEngine(registry.select(level, overrides), settings, profile)
+
+
+def _check_chunk(units: List[Tuple[Any, ...]]):
+    engine = _worker['engine']
+    results = [engine.run_units(_worker['spec'], [unit]) for unit in units]
+    return results, engine.take_timings()
+
+
+def chunk_units(units: List[Tuple[Any, ...]], chunks: int) -> List[List[Tuple[Any, ...]]]:
+    """Split units into contiguous, nearly equal chunks."""
+    size, extra = divmod(len(units), chunks)
+    result, start = [], 0
+    for i in range(chunks):
+        end = start + size + (1 if i < extra else 0)
+        if end > start:
+            result.append(units[start:end])
+        start = end
+    return result
+
+
+def check_units(spec: Dict[str, Any], units: List[Tuple[Any, ...]], level: str,
+                overrides: Optional[Dict[str, str]] = None, settings: Optional[Dict[str, Any]] = None,
+                jobs: Optional[int] = None,
+                timings: Optional[Dict[str, List[float]]] = None) -> List[Tuple[List[Dict[str, Any]], int]]:
+    """
+    Check the given units with the rules of a level, using up to `jobs` processes.
+
+    Returns (findings, operation count) for each unit, in the order given.
+    Few units, or jobs=1, are checked in-process. If a timings dict is given,
+    rules are profiled and their counters are added to it.
+    """
+    profile = timings is not None
+    jobs = min(jobs or default_jobs(), len(units) // MIN_UNITS_PER_JOB)
+    if jobs <= 1:
+        engine = RuleEngine(registry.select(level, overrides), settings, profile)
+        results = [engine.run_units(spec, [unit]) for unit in units]
+        if profile:
+            merge_timings(timings, engine.take_timings())
+        return results
+
+    import multiprocessing
+
+    # Each worker gets a few chunks so a slow chunk doesn't leave the others idle
+    chunks = chunk_units(units, jobs * 4)
+    # fork shares the parsed spec with workers without pickling it
+    method = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else None
+    context = multiprocessing.get_context(method)
+    with context.Pool(jobs, initializer=_init_worker,
+                      initargs=(spec, level, overrides, settings, profile, loaded_plugins())) as pool:
+        chunk_results = pool.map(_check_chunk, chunks)
+    if profile:
+        for _, chunk_timings in chunk_results:
+            merge_timings(timings, chunk_timings)
+    return [unit_result for chunk, _ in chunk_results for unit_result in chunk]
+
+
+def run_parallel(spec: Dict[str, Any], level: str, overrides: Optional[Dict[str, str]] = None,
+                 settings: Optional[Dict[str, Any]] = None, jobs: Optional[int] = None,
+                 profile: bool = False) -> Dict[str, Any]:
+    """
+    Validate a spec with the rules of a level, using up to `jobs` processes.
+
+    Returns the same {'findings', 'stats'} shape as RuleEngine.run.
+    """
+    jobs = jobs or default_jobs()
+    units = spec_units(spec)
+    if min(jobs, len(units) // MIN_UNITS_PER_JOB) <= 1:
+        return RuleEngine(registry.select(level, overrides), settings, profile).run(spec)
+
+    findings: List[Dict[str, Any]] = []
+    operations = 0
+    timings = {} if profile else None
+    for unit_findings, unit_operations in check_units(spec, units, level, overrides, settings, jobs, timings):
+        findings.extend(unit_findings)
+        operations += unit_operations
+    stats = {'total_operations': operations}
+    if profile:
+        stats['rule_timings'] = timings
+    return {'findings': findings, 'stats': stats}
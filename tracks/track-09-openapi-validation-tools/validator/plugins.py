@@ -0,0 +1,110 @@
+"""
+Custom rule plugins: modules or .py files that register rules on the shared
+registry when imported.
+
+Every plugin loaded in a process is remembered with the directory its path
+is relative to, so process pools can import the same plugins in their
+workers (see parallel.py). Forked workers inherit the registered rules;
+spawned ones start with the built-in rules only.
+
+.py plugins are identified by their absolute path and modification time, so
+two configs that both use plugins/rules.py from different directories (e.g.
+in one --serve daemon) each get their own rules, and an edited file is
+imported again.
+"""
+
+import hashlib
+import os
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from .engine import Rule, registry
+
+# Rule ids registered by each loaded plugin, keyed by module name or absolute path
+_PLUGIN_RULES: Dict[str, List[str]] = {}
+
+# Directory each loaded plugin was resolved against, in load order
+_PLUGIN_DIRS: Dict[str, str] = {}
+
+# (mtime, size) of each .py plugin when it was imported
+_PLUGIN_STAMPS: Dict[str, Tuple[int, int]] = {}
+
+
+def _unload(key: str):
+    """Forget a plugin and remove the rules it registered."""
+    for rule_id in _PLUGIN_RULES.pop(key, []):
+        registry.rules.pop(rule_id, None)
+    _PLUGIN_DIRS.pop(key, None)
+    _PLUGIN_STAMPS.pop(key, None)
+
+
+def _import_rules(load: Callable[[], None]) -> Dict[str, Rule]:
+    """Run a plugin import and return the rules it registered, without adding them yet."""
+    existing = registry.rules
+    registry.rules = {}
+    try:
+        load()
+        return registry.rules
+    finally:
+        registry.rules = existing
+
+
+def load_rule_plugin(plugin: str, base_dir: str) -> List[str]:
+    """
+    Import a module or .py file (relative to base_dir) that registers custom rules.
+
+    Returns the ids of the rules it registered. Module plugins are imported
+    once per process; .py plugins again when the file changed. A plugin
+    registering rule ids that another plugin registered replaces that
+    plugin's rules until the other one is loaded again.
+    """
+    import importlib
+    import importlib.util
+    if plugin.endswith('.py'):
+        key = os.path.abspath(os.path.join(base_dir, plugin))
+        try:
+            stat = os.stat(key)
+        except OSError:
+            raise ValueError(f"Rule plugin not found: {key}")
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if key in _PLUGIN_RULES and _PLUGIN_STAMPS.get(key) == stamp:
+            return _PLUGIN_RULES[key]
+        _unload(key)
+
+        # Same-named files in different directories must not share a module
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=6).hexdigest()
+        name = f"validator_plugin_{Path(key).stem}_{digest}"
+        module_spec = importlib.util.spec_from_file_location(name, key)
+        if module_spec is None:
+            raise ValueError(f"Rule plugin not found: {key}")
+
+        def load():
+            module = importlib.util.module_from_spec(module_spec)
+            sys.modules[name] = module
+            module_spec.loader.exec_module(module)
+    else:
+        key = plugin
+        if key in _PLUGIN_RULES:
+            return _PLUGIN_RULES[key]
+
+        def load():
+            importlib.import_module(plugin)
+
+    new_rules = _import_rules(load)
+    owners = {owner for owner, rule_ids in _PLUGIN_RULES.items() if set(rule_ids) & set(new_rules)}
+    for owner in owners:
+        _unload(owner)
+    for new_rule in new_rules.values():
+        registry.add(new_rule)  # still rejects clashes with built-in rules
+
+    _PLUGIN_RULES[key] = list(new_rules)
+    _PLUGIN_DIRS[key] = os.path.abspath(base_dir)
+    if plugin.endswith('.py'):
+        _PLUGIN_STAMPS[key] = stamp
+    return _PLUGIN_RULES[key]
+
+
+def loaded_plugins() -> List[Tuple[str, str]]:
+    """(plugin, base directory) of every plugin loaded in this process, in load order."""
+    return list(_PLUGIN_DIRS.items())
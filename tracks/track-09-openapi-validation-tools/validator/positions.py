@@ -0,0 +1,185 @@
+"""
+Line/column positions of spec nodes, keyed by JSON pointer.
+
+YAML documents are indexed from the node graph the loader composes anyway,
+so positions come from the same single parse. The C JSON decoder does not
+report positions, so a JSON index is built on first lookup by one token scan
+of the source; runs without findings never pay for it.
+
+Findings carry a pointer rather than a line number. Cached findings stay
+valid when lines shift, and positions are attached after every run from the
+index of the document that was just loaded.
+"""
+
+import json
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Strings (keys or values) and structural characters; numbers and literals
+# never start a node we need to locate, except as array items
+_JSON_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\],]')
+_NON_SPACE = re.compile(r'\S')
+
+
+def _escape(key: str) -> str:
+    return key.replace('~', '~0').replace('/', '~1')
+
+
+def _pack(line: int, column: int) -> int:
+    return line << 32 | column
+
+
+class PositionIndex:
+    """Maps JSON pointers to 1-based (line, column) of the node in its source file."""
+
+    __slots__ = ('_positions', '_source')
+
+    def __init__(self, positions: Optional[Dict[str, int]] = None, source: Optional[str] = None):
+        # Positions are packed into one int per pointer to keep the index small
+        self._positions = positions
+        self._source = source
+
+    @classmethod
+    def from_json(cls, text: str) -> 'PositionIndex':
+        """Index for a JSON document, scanned lazily on first lookup."""
+        return cls(source=text)
+
+    def _index(self) -> Dict[str, int]:
+        if self._positions is None:
+            self._positions = _scan_json(self._source)
+            self._source = None
+        return self._positions
+
+    def lookup(self, pointer: str) -> Optional[Tuple[int, int]]:
+        """Position of the node, or of its closest ancestor present in the source."""
+        positions = self._index()
+        while True:
+            packed = positions.get(pointer)
+            if packed is not None:
+                return packed >> 32, packed & 0xFFFFFFFF
+            if not pointer:
+                return None
+            pointer = pointer[:pointer.rfind('/')]
+
+    def __len__(self) -> int:
+        return len(self._index())
+
+
+def attach_positions(findings: Iterable[Dict[str, Any]], index: Optional[PositionIndex]):
+    """
+    Set line/column on findings that carry a JSON pointer.
+
+    Indexes of split specs (validator/bundle.py) also name the file a node
+    came from when it is not the root document; it is set as 'file'.
+    """
+    if index is None:
+        return
+    for finding in findings:
+        pointer = finding.get('pointer')
+        position = index.lookup(pointer) if pointer is not None else None
+        if position:
+            finding['line'], finding['column'] = position[:2]
+            if len(position) > 2:
+                finding['file'] = position[2]
+            else:
+                finding.pop('file', None)
+
+
+def load_yaml_with_positions(text: str) -> Tuple[Any, PositionIndex]:
+    """Parse YAML once, returning the data and a position index built from its node graph."""
+    import yaml
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)(text)
+    try:
+        root = loader.get_single_node()
+        data = loader.construct_document(root) if root is not None else None
+    finally:
+        loader.dispose()
+    return data, PositionIndex(_index_yaml(root) if root is not None else {})
+
+
+def _index_yaml(root) -> Dict[str, int]:
+    import yaml
+    mark = root.start_mark
+    positions = {'': _pack(mark.line + 1, mark.column + 1)}
+    stack = [(root, '')]
+    seen = set()
+    while stack:
+        node, pointer = stack.pop()
+        # Aliased nodes are indexed once, at their anchor; pointers through
+        # an alias fall back to the alias's own key
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        if isinstance(node, yaml.MappingNode):
+            for key_node, value_node in node.value:
+                if key_node.tag == 'tag:yaml.org,2002:merge':
+                    continue
+                child = f'{pointer}/{_escape(str(key_node.value))}'
+                mark = key_node.start_mark
+                positions[child] = _pack(mark.line + 1, mark.column + 1)
+                stack.append((value_node, child))
+        elif isinstance(node, yaml.SequenceNode):
+            for i, item in enumerate(node.value):
+                child = f'{pointer}/{i}'
+                mark = item.start_mark
+                positions[child] = _pack(mark.line + 1, mark.column + 1)
+                stack.append((item, child))
+    return positions
+
+
+def _scan_json(text: str) -> Dict[str, int]:
+    """Positions of every object member (at its key) and array item, in one token scan."""
+    positions: Dict[str, int] = {}
+    count, rfind, search = text.count, text.rfind, _NON_SPACE.search
+    line, line_start, last = 1, 0, 0
+
+    def record(pointer: str, offset: int):
+        nonlocal line, line_start, last
+        newlines = count('\n', last, offset)
+        if newlines:
+            line += newlines
+            line_start = rfind('\n', last, offset) + 1
+        last = offset
+        positions[pointer] = _pack(line, offset - line_start + 1)
+
+    first = search(text)
+    record('', first.start() if first else 0)
+
+    # Per open container: its pointer and the current item index (-1 for objects)
+    containers: List[str] = []
+    items: List[int] = []
+    child = ''
+    expect_key = False
+    for match in _JSON_TOKEN.finditer(text):
+        token = match.group()
+        char = token[0]
+        if char == '"':
+            if expect_key:
+                key = json.loads(token) if '\\' in token else token[1:-1]
+                child = f'{containers[-1]}/{_escape(key)}'
+                expect_key = False
+                record(child, match.start())
+        elif char == '{':
+            containers.append(child)
+            items.append(-1)
+            expect_key = True
+        elif char == '[':
+            containers.append(child)
+            items.append(0)
+            child = f'{child}/0'
+            item = search(text, match.end())
+            if item and item.group() != ']':
+                record(child, item.start())
+        elif char == ',':
+            if items[-1] < 0:
+                expect_key = True
+            else:
+                items[-1] += 1
+                child = f'{containers[-1]}/{items[-1]}'
+                item = search(text, match.end())
+                record(child, item.start() if item else match.end())
+        else:
+            containers.pop()
+            items.pop()
+            expect_key = False
+    return positions
@@ -0,0 +1,52 @@
+"""
+Semantic rules: HTTP method usage, status codes and parameter consistency.
+"""
+
+import re
+
+from .engine import OPERATION, rule
+
+_PATH_TEMPLATE = re.compile(r'\{([^}]+)\}')
+
+
+@rule('get_with_body', level='semantic', kinds=(OPERATION,), severity='warning')
+def check_get_with_body(node, context):
+    """GET operations should not have a request body."""
+    if node.method == 'get' and 'requestBody' in node.value:
+        yield node.finding('questionable_design', 'GET operation should not have a request body',
+                           'Remove requestBody or change to POST method')
+
+
+@rule('missing_error_responses', level='semantic', kinds=(OPERATION,), severity='warning')
+def check_missing_error_responses(node, context):
+    """Operations should document at least one error response."""
+    responses = node.value.get('responses')
+    if not isinstance(responses, dict):
+        return
+    codes = [str(code) for code in responses]
+    if not any(code.startswith(('4', '5')) or code == 'default' for code in codes):
+        yield node.finding('missing_error_responses', 'Operation documents no 4xx/5xx or default response',
+                           'Add the error responses clients should expect, e.g. 400 and 500')
+
+
+@rule('path_parameters_defined', level='semantic', kinds=(OPERATION,), severity='error')
+def check_path_parameters_defined(node, context):
+    """Every {template} in the path must be declared as an in: path parameter."""
+    templated = _PATH_TEMPLATE.findall(node.path or '')
+    if not templated:
+        return
+
+    declared = set()
+    path_item = context.spec.get('paths', {}).get(node.path, {})
+    for parameters in (path_item.get('parameters'), node.value.get('parameters')):
+        for parameter in parameters or ():
+            if isinstance(parameter, dict) and parameter.get('in') == 'path':
+                declared.add(parameter.get('name'))
+            elif isinstance(parameter, dict) and '$ref' in parameter:
+                # Referenced parameters are resolved by reference_resolution; don't guess here
+                return
+
+    for name in templated:
+        if name not in declared:
+            yield node.finding('undefined_path_parameter', f'Path parameter {{{name}}} is not defined',
+                               f'Add a parameter with name: {name} and in: path')
@@ -0,0 +1,95 @@
+"""
+Syntax-level rules: required fields, structure and reference resolution.
+"""
+
+from .engine import (COMPONENT, DOCUMENT, PARAMETER, PATH_ITEM, REQUEST_BODY, RESPONSE, SCHEMA,
+                     Node, resolve_pointer, rule)
+from .meta_schema import iter_violations, root_placeholder, spec_version
+
+
+@rule('required_fields', level='syntax', kinds=(DOCUMENT,), severity='error')
+def check_required_fields(node, context):
+    """Root must declare a 3.x openapi version, an info object with title and version, and paths."""
+    spec = node.value
+
+    if 'openapi' not in spec:
+        yield node.finding('missing_field', 'Missing required field: openapi',
+                           'Add openapi: "3.0.0" to the root level', field='openapi')
+    elif not str(spec['openapi']).startswith('3.'):
+        yield node.finding('invalid_version',
+                           f'Unsupported OpenAPI version: {spec["openapi"]}. Expected 3.x',
+                           'Convert the specification to OpenAPI 3.0 or later', field='openapi')
+
+    info = spec.get('info')
+    if not isinstance(info, dict):
+        yield node.finding('missing_field', 'Missing required field: info',
+                           'Add an info object with title and version', field='info')
+    else:
+        for field in ('title', 'version'):
+            if field not in info:
+                yield node.finding('missing_field', f'Missing required field: info.{field}',
+                                   f'Add {field} to the info object', field=f'info.{field}')
+
+    # OpenAPI 3.1 allows documents with only webhooks or components
+    if 'paths' not in spec and 'webhooks' not in spec:
+        yield node.finding('missing_field', 'Missing required field: paths',
+                           'Add a paths object (it can be empty)', field='paths')
+
+
+@rule('reference_resolution', level='syntax',
+      kinds=(PARAMETER, REQUEST_BODY, RESPONSE, SCHEMA), severity='error')
+def check_reference_resolution(node, context):
+    """Local $ref pointers must resolve within the document."""
+    ref = node.value.get('$ref')
+    if not isinstance(ref, str) or not ref.startswith('#'):
+        return
+    try:
+        resolve_pointer(context.spec, ref)
+    except KeyError:
+        yield node.finding('unresolved_reference', f'Reference cannot be resolved: {ref}',
+                           'Point $ref at an existing component or define the missing component')
+
+
+@rule('response_description', level='syntax', kinds=(RESPONSE,), severity='error')
+def check_response_description(node, context):
+    """Response objects require a description."""
+    if '$ref' not in node.value and 'description' not in node.value:
+        yield node.finding('missing_field', 'Response is missing required field: description',
+                           'Add a description explaining when this response is returned')
+
+
+@rule('parameter_fields', level='syntax', kinds=(PARAMETER,), severity='error')
+def check_parameter_fields(node, context):
+    """Parameters require name and in."""
+    if '$ref' in node.value:
+        return
+    for field in ('name', 'in'):
+        if field not in node.value:
+            yield node.finding('missing_field', f'Parameter is missing required field: {field}',
+                               f'Add {field} to the parameter definition')
+
+
+@rule('openapi_schema', level='syntax', kinds=(DOCUMENT, PATH_ITEM, COMPONENT), severity='error')
+def check_openapi_schema(node, context):
+    """
+    The document must conform to the OpenAPI 3.0/3.1 meta-schema.
+
+    Off unless the schema_check setting is 'fail-fast' (at most one finding
+    per path item / component / root) or 'collect-all'.
+    """
+    mode = context.settings.get('schema_check', 'off')
+    version = spec_version(context.spec)
+    if mode == 'off' or version is None:
+        return  # required_fields reports unsupported versions
+
+    if node.kind == DOCUMENT:
+        instance, target = root_placeholder(node.value), 'document'
+    elif node.kind == PATH_ITEM:
+        instance, target = node.value, 'path'
+    else:
+        instance, target = node.value, node.keys[1]
+
+    for keys, message in iter_violations(instance, version, target, fail_fast=mode == 'fail-fast'):
+        yield Node(node.kind, None, node.keys + keys).finding(
+            'schema_violation', f'Does not match the OpenAPI {version} schema: {message}',
+            f'Check this field against the OpenAPI {version} specification')
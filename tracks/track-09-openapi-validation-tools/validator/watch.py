@@ -0,0 +1,69 @@
+"""
+Polling file watcher for --watch.
+
+Files are polled by mtime and size, which works the same on every platform
+and on network mounts, and costs one stat per watched file per poll.
+Editors often write a file several times per save (write, rename, touch);
+changes are collected until none arrive for the debounce window and then
+reported once.
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+# How often watched files are polled, in seconds
+POLL_INTERVAL = 0.05
+
+Snapshot = Dict[str, Optional[Tuple[int, int]]]
+
+
+def snapshot(paths: Iterable[str]) -> Snapshot:
+    """(mtime_ns, size) per file, None for files that do not exist."""
+    state: Snapshot = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            state[path] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            state[path] = None
+    return state
+
+
+def _diff(before: Snapshot, after: Snapshot) -> Set[str]:
+    # A file new to the watched set counts as changed if it exists
+    return {path for path, state in after.items() if before.get(path) != state}
+
+
+def watch_changes(get_paths: Callable[[], Iterable[str]], debounce: float = 0.05,
+                  interval: float = POLL_INTERVAL,
+                  stop: Optional[threading.Event] = None) -> Iterator[Set[str]]:
+    """
+    Yield the set of changed (created, modified or deleted) files after each
+    burst of changes.
+
+    get_paths is called on every poll, so the watched set can grow as specs
+    start $ref-ing new files. Stops when `stop` is set.
+    """
+    stop = stop or threading.Event()
+    seen = snapshot(get_paths())
+    while not stop.wait(interval):
+        current = snapshot(get_paths())
+        changed = _diff(seen, current)
+        if not changed:
+            continue
+
+        # Wait for the burst to settle before reporting it
+        quiet_since = time.monotonic()
+        while time.monotonic() - quiet_since < debounce and not stop.wait(min(interval, debounce)):
+            latest = snapshot(current)
+            more = _diff(current, latest)
+            if more:
+                changed |= more
+                current = latest
+                quiet_since = time.monotonic()
+        yield changed
+        # Files the caller started depending on while handling the change
+        # (newly $ref'd ones) are a baseline, not a change
+        seen = {**snapshot(get_paths()), **current}